@@ -9,7 +9,7 @@ from app.models.job import JobListing
 router = APIRouter()
 
 @router.get("/dashboard-all")
-async def get_all_analytics_data(
+def get_all_analytics_data(
     skills: Optional[str] = Query(None, description="User skills (comma-separated)"),
     experience_level: Optional[str] = Query("mid", description="Experience level"),
     preferred_locations: Optional[str] = Query(None, description="Preferred locations (comma-separated)"),
@@ -45,7 +45,7 @@ async def get_all_analytics_data(
     }
 
 @router.get("/executive-dashboard")
-async def get_executive_dashboard(
+def get_executive_dashboard(
     time_range: int = Query(30, description="Time range in days"),
     db: Session = Depends(get_db)
 ):
@@ -56,7 +56,7 @@ async def get_executive_dashboard(
     return analytics.get_executive_dashboard(time_range)
 
 @router.get("/search-intelligence")
-async def get_search_intelligence(db: Session = Depends(get_db)):
+def get_search_intelligence(db: Session = Depends(get_db)):
     """
     Get search query performance analytics and optimization recommendations
     """
@@ -64,7 +64,7 @@ async def get_search_intelligence(db: Session = Depends(get_db)):
     return analytics.get_search_query_analytics()
 
 @router.get("/market-intelligence")
-async def get_market_intelligence(db: Session = Depends(get_db)):
+def get_market_intelligence(db: Session = Depends(get_db)):
     """
     Get comprehensive job market intelligence including:
     - Tech stack trends
@@ -76,7 +76,7 @@ async def get_market_intelligence(db: Session = Depends(get_db)):
     return analytics.get_market_intelligence()
 
 @router.get("/profile-optimization")
-async def get_profile_optimization(
+def get_profile_optimization(
     user_skills: Optional[str] = Query(None, description="Comma-separated list of user skills"),
     db: Session = Depends(get_db)
 ):
@@ -93,7 +93,7 @@ async def get_profile_optimization(
     return analytics.get_profile_optimization(skills_list)
 
 @router.get("/job-predictions")
-async def get_job_predictions(
+def get_job_predictions(
     skills: Optional[str] = Query(None, description="User skills (comma-separated)"),
     experience_level: Optional[str] = Query("mid", description="Experience level"),
     preferred_locations: Optional[str] = Query(None, description="Preferred locations (comma-separated)"),
@@ -117,7 +117,7 @@ async def get_job_predictions(
     return analytics.get_job_match_predictions(user_profile)
 
 @router.get("/skills-analysis")
-async def get_skills_analysis(db: Session = Depends(get_db)):
+def get_skills_analysis(db: Session = Depends(get_db)):
     """
     Get detailed skills market analysis including demand, growth, and salary impact
     """
@@ -126,7 +126,7 @@ async def get_skills_analysis(db: Session = Depends(get_db)):
     return profile_data["skills_analysis"]
 
 @router.get("/location-insights")
-async def get_location_insights(db: Session = Depends(get_db)):
+def get_location_insights(db: Session = Depends(get_db)):
     """
     Get location-based job market insights
     """
@@ -138,7 +138,7 @@ async def get_location_insights(db: Session = Depends(get_db)):
     }
 
 @router.get("/tech-trends")
-async def get_tech_trends(db: Session = Depends(get_db)):
+def get_tech_trends(db: Session = Depends(get_db)):
     """
     Get technology and skills trending analysis
     """
@@ -150,7 +150,7 @@ async def get_tech_trends(db: Session = Depends(get_db)):
     }
 
 @router.get("/recommendations")
-async def get_personalized_recommendations(
+def get_personalized_recommendations(
     skills: Optional[str] = Query(None, description="User skills (comma-separated)"),
     experience_level: Optional[str] = Query("mid", description="Experience level"),
     preferred_locations: Optional[str] = Query(None, description="Preferred locations (comma-separated)"),
@@ -192,7 +192,7 @@ async def get_personalized_recommendations(
     }
 
 @router.get("/company-insights")
-async def get_company_insights(
+def get_company_insights(
     company_name: Optional[str] = Query(None, description="Specific company to analyze"),
     db: Session = Depends(get_db)
 ):
@@ -213,7 +213,7 @@ async def get_company_insights(
     return {"top_companies": market_data["industry_trends"][:20]}
 
 @router.get("/salary-insights")
-async def get_salary_insights(
+def get_salary_insights(
     skill: Optional[str] = Query(None, description="Skill to analyze salary for"),
     location: Optional[str] = Query(None, description="Location to analyze salary for"),
     experience_level: Optional[str] = Query(None, description="Experience level"),
@@ -1,6 +1,6 @@
-from fastapi import APIRouter, Depends, HTTPException, status
-from sqlalchemy.orm import Session
-from sqlalchemy import func
+from fastapi import APIRouter, Depends, HTTPException, Response, status
+from sqlalchemy.orm import Session, load_only
+from sqlalchemy import func, tuple_
 from typing import Optional
 from pydantic import BaseModel
 from starlette.responses import RedirectResponse
@@ -12,6 +12,7 @@ from app.models.email_models import UserGmailConnection, EmailEvent
 from app.models.job import JobListing, JobApplication
 from app.services.gmail_service import GmailService
 from app.services.email_processor import EmailProcessor
+from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
 
 router = APIRouter()
 logger = logging.getLogger(__name__)
@@ -38,7 +39,7 @@ async def get_email_config_status():
         }
 
 @router.post("/connect")
-async def connect_gmail(
+def connect_gmail(
     request: ConnectGmailRequest,
     db: Session = Depends(get_db)
 ):
@@ -83,7 +84,7 @@ async def connect_gmail(
         )
 
 @router.get("/oauth/callback")
-async def oauth_callback(
+def oauth_callback(
     code: str,
     state: str,
     db: Session = Depends(get_db)
@@ -147,7 +148,7 @@ async def oauth_callback(
         )
 
 @router.get("/status/{user_id}")
-async def get_gmail_status(
+def get_gmail_status(
     user_id: str,
     db: Session = Depends(get_db)
 ):
@@ -177,7 +178,11 @@ async def get_gmail_status(
                 db.commit()
         
         # Get recent email events
-        recent_events = db.query(EmailEvent).filter(
+        # Only the listed fields; ai_data is a TOASTed blob this view never shows
+        recent_events = db.query(EmailEvent).options(load_only(
+            EmailEvent.id, EmailEvent.sender_email, EmailEvent.subject,
+            EmailEvent.email_type, EmailEvent.confidence_score, EmailEvent.created_at
+        )).filter(
             EmailEvent.user_id == user_id
         ).order_by(EmailEvent.created_at.desc()).limit(5).all()
         
@@ -206,7 +211,7 @@ async def get_gmail_status(
         )
 
 @router.get("/summary/{user_id}")
-async def get_email_summary(
+def get_email_summary(
     user_id: str,
     db: Session = Depends(get_db)
 ):
@@ -223,36 +228,28 @@ async def get_email_summary(
                 "message": "No Gmail connection found"
             }
         
-        # Get email statistics
-        total_events = db.query(EmailEvent).filter(
-            EmailEvent.user_id == user_id
-        ).count()
-        
-        recent_events = db.query(EmailEvent).filter(
-            EmailEvent.user_id == user_id
-        ).order_by(EmailEvent.created_at.desc()).limit(10).count()
-        
-        needs_review = db.query(EmailEvent).filter(
-            EmailEvent.user_id == user_id,
-            EmailEvent.confidence_score < 0.8,
-            EmailEvent.user_reviewed == False
-        ).count()
-        
-        # Get events by type
+        # Get email statistics: per-type totals and review counts in one pass
+        # over the user's events; the overall figures are sums of these
         events_by_type = db.query(
             EmailEvent.email_type,
-            func.count(EmailEvent.id).label('count')
+            func.count(EmailEvent.id).label('count'),
+            func.count(EmailEvent.id).filter(
+                EmailEvent.confidence_score < 0.8,
+                EmailEvent.user_reviewed == False
+            ).label('needs_review')
         ).filter(
             EmailEvent.user_id == user_id
         ).group_by(EmailEvent.email_type).all()
         
         by_type = {event.email_type: event.count for event in events_by_type}
+        total_events = sum(by_type.values())
+        needs_review = sum(event.needs_review for event in events_by_type)
         
         return {
             "connected": connection.is_authorized,
             "last_sync": connection.last_sync_at.isoformat() if connection.last_sync_at else None,
             "total_processed": total_events,
-            "recent_count": recent_events,
+            "recent_count": min(total_events, 10),
             "needs_review": needs_review,
             "by_type": by_type
         }
@@ -268,21 +265,37 @@ async def get_email_summary(
         )
 
 @router.get("/events/{user_id}")
-async def get_email_events(
+def get_email_events(
     user_id: str,
+    response: Response,
     limit: int = 50,
     offset: int = 0,
+    cursor: Optional[str] = None,
     email_type: str = None,
     db: Session = Depends(get_db)
 ):
-    """Get email events for user"""
+    """
+    Get email events for user, newest first
+    
+    Pass the X-Next-Cursor response header back as `cursor` to fetch the next
+    page with a keyset range scan instead of an OFFSET; `offset` is ignored
+    when a cursor is given.
+    """
+    cursor_key = decode_keyset_cursor(cursor) if cursor else None
     try:
         query = db.query(EmailEvent).filter(EmailEvent.user_id == user_id)
         
         if email_type and email_type != 'all':
             query = query.filter(EmailEvent.email_type == email_type)
         
-        events = query.order_by(EmailEvent.created_at.desc()).offset(offset).limit(limit).all()
+        if cursor_key:
+            query = query.filter(tuple_(EmailEvent.created_at, EmailEvent.id) < cursor_key)
+        else:
+            query = query.offset(offset)
+        
+        events = query.order_by(EmailEvent.created_at.desc(), EmailEvent.id.desc()).limit(limit).all()
+        if events and len(events) == limit:
+            response.headers["X-Next-Cursor"] = encode_keyset_cursor(events[-1].created_at, events[-1].id)
         
         return [
             {
@@ -310,13 +323,13 @@ async def get_email_events(
         )
 
 @router.post("/events/{event_id}/review")
-async def mark_event_reviewed(
+def mark_event_reviewed(
     event_id: int,
     db: Session = Depends(get_db)
 ):
     """Mark email event as reviewed by user"""
     try:
-        event = db.query(EmailEvent).filter(EmailEvent.id == event_id).first()
+        event = db.get(EmailEvent, event_id)
         
         if not event:
             raise HTTPException(
@@ -338,16 +351,25 @@ async def mark_event_reviewed(
         )
 
 @router.post("/process/{user_id}")
-async def process_emails(
+def process_emails(
     user_id: str,
-    request: ProcessEmailsRequest,
-    db: Session = Depends(get_db)
+    request: ProcessEmailsRequest
 ):
-    """Process emails for user with AI classification and job status updates"""
+    """
+    Queue Gmail fetch + AI classification and job status updates for a user
+    
+    The work runs on a Celery worker; poll /summary or /events for results
+    """
     try:
-        processor = EmailProcessor()
-        result = await processor.process_user_emails(user_id, request.user_email, db)
-        return result
+        from app.tasks.email_monitoring_tasks import process_user_emails_async
+        
+        task = process_user_emails_async.delay(user_id, request.user_email)
+        return {
+            "success": True,
+            "message": "Email processing queued",
+            "task_id": task.id,
+            "status": "queued"
+        }
         
     except Exception as e:
         raise HTTPException(
@@ -373,7 +395,7 @@ async def process_specific_email(
         )
 
 @router.get("/analytics/{user_id}")
-async def get_email_analytics(
+def get_email_analytics(
     user_id: str,
     db: Session = Depends(get_db)
 ):
@@ -405,7 +427,7 @@ async def get_email_analytics(
                 ).first()
                 
                 if job_application:
-                    job = db.query(JobListing).filter(JobListing.id == event.matched_job_id).first()
+                    job = db.get(JobListing, event.matched_job_id)
                     if job:
                         status_updates.append({
                             "email_event_id": event.id,
@@ -494,7 +516,7 @@ async def test_email_classification(
         )
 
 @router.get("/test-job-matching/{user_id}")
-async def test_job_matching(
+def test_job_matching(
     user_id: str,
     company_name: str,
     job_title: str = None,
@@ -514,7 +536,7 @@ async def test_job_matching(
         
         if result:
             job_id, confidence_score = result
-            job = db.query(JobListing).filter(JobListing.id == job_id).first()
+            job = db.get(JobListing, job_id)
             
             return {
                 "matched": True,
@@ -542,7 +564,7 @@ async def test_job_matching(
         )
 
 @router.delete("/disconnect/{user_id}")
-async def disconnect_gmail(
+def disconnect_gmail(
     user_id: str,
     db: Session = Depends(get_db)
 ):
@@ -569,7 +591,7 @@ async def disconnect_gmail(
         ) 
 
 @router.post("/trigger-processing/{user_id}")
-async def trigger_email_processing(
+def trigger_email_processing(
     user_id: str,
     db: Session = Depends(get_db)
 ):
@@ -595,7 +617,7 @@ async def trigger_email_processing(
         )
 
 @router.get("/monitoring-status")
-async def get_monitoring_status():
+def get_monitoring_status():
     """Get the status of email monitoring tasks"""
     try:
         from app.core.celery_app import celery_app
@@ -1,12 +1,18 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Response
 from sqlalchemy.orm import Session
-from sqlalchemy import desc
+from sqlalchemy import delete, desc
+from app.core import cache
 from app.db.session import get_db
 from app.models.job import RSSFeedConfiguration
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 from datetime import datetime
 
+# Feed configuration is read far more often than it is edited. Writes here
+# clear the prefix; refresh stats written by the RSS task age out via the TTL
+FEED_CACHE_TTL = 60  # seconds
+FEED_CACHE_PREFIX = "feeds:"
+
 router = APIRouter()
 
 # Pydantic models for RSS Feed Configuration
@@ -54,8 +60,18 @@ class FeedHealthResponse(BaseModel):
     feeds_with_issues: int
     last_refresh_time: Optional[datetime] = None
 
+_FEED_ADAPTER = TypeAdapter(RSSFeedResponse)
+_FEED_LIST_ADAPTER = TypeAdapter(List[RSSFeedResponse])
+_FEED_HEALTH_ADAPTER = TypeAdapter(FeedHealthResponse)
+
+def _get_feed_or_404(db: Session, feed_id: int) -> RSSFeedConfiguration:
+    feed = db.get(RSSFeedConfiguration, feed_id)
+    if not feed:
+        raise HTTPException(status_code=404, detail="Feed not found")
+    return feed
+
 @router.get("/", response_model=List[RSSFeedResponse])
-async def get_rss_feeds(
+def get_rss_feeds(
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
@@ -64,16 +80,24 @@ async def get_rss_feeds(
     """
     Get all RSS feed configurations
     """
-    query = db.query(RSSFeedConfiguration)
-    
-    if active_only:
-        query = query.filter(RSSFeedConfiguration.is_active == True)
-    
-    feeds = query.order_by(desc(RSSFeedConfiguration.created_at)).offset(skip).limit(limit).all()
-    return feeds
+    def list_feeds() -> bytes:
+        query = db.query(RSSFeedConfiguration)
+        
+        if active_only:
+            query = query.filter(RSSFeedConfiguration.is_active == True)
+        
+        feeds = query.order_by(desc(RSSFeedConfiguration.created_at)).offset(skip).limit(limit).all()
+        return _FEED_LIST_ADAPTER.dump_json(_FEED_LIST_ADAPTER.validate_python(feeds, from_attributes=True))
+
+    content = cache.get_or_compute_bytes(
+        f"{FEED_CACHE_PREFIX}list:{skip}:{limit}:{active_only}",
+        list_feeds,
+        ttl=FEED_CACHE_TTL
+    )
+    return Response(content=content, media_type="application/json")
 
 @router.post("/", response_model=RSSFeedResponse)
-async def create_rss_feed(
+def create_rss_feed(
     feed: RSSFeedCreate,
     db: Session = Depends(get_db)
 ):
@@ -92,23 +116,28 @@ async def create_rss_feed(
     db.add(db_feed)
     db.commit()
     db.refresh(db_feed)
+    cache.invalidate(FEED_CACHE_PREFIX)
     return db_feed
 
 @router.get("/{feed_id}", response_model=RSSFeedResponse)
-async def get_rss_feed(
+def get_rss_feed(
     feed_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Get a specific RSS feed configuration
     """
-    feed = db.query(RSSFeedConfiguration).filter(RSSFeedConfiguration.id == feed_id).first()
-    if not feed:
-        raise HTTPException(status_code=404, detail="Feed not found")
-    return feed
+    content = cache.get_or_compute_bytes(
+        f"{FEED_CACHE_PREFIX}feed:{feed_id}",
+        lambda: _FEED_ADAPTER.dump_json(
+            _FEED_ADAPTER.validate_python(_get_feed_or_404(db, feed_id), from_attributes=True)
+        ),
+        ttl=FEED_CACHE_TTL
+    )
+    return Response(content=content, media_type="application/json")
 
 @router.put("/{feed_id}", response_model=RSSFeedResponse)
-async def update_rss_feed(
+def update_rss_feed(
     feed_id: int,
     feed_update: RSSFeedUpdate,
     db: Session = Depends(get_db)
@@ -116,9 +145,7 @@ async def update_rss_feed(
     """
     Update an RSS feed configuration
     """
-    feed = db.query(RSSFeedConfiguration).filter(RSSFeedConfiguration.id == feed_id).first()
-    if not feed:
-        raise HTTPException(status_code=404, detail="Feed not found")
+    feed = _get_feed_or_404(db, feed_id)
     
     # Update only provided fields
     for field, value in feed_update.dict(exclude_unset=True).items():
@@ -126,48 +153,61 @@ async def update_rss_feed(
     
     db.commit()
     db.refresh(feed)
+    cache.invalidate(FEED_CACHE_PREFIX)
     return feed
 
 @router.delete("/{feed_id}")
-async def delete_rss_feed(
+def delete_rss_feed(
     feed_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Delete an RSS feed configuration
     """
-    feed = db.query(RSSFeedConfiguration).filter(RSSFeedConfiguration.id == feed_id).first()
-    if not feed:
+    # One DELETE ... RETURNING instead of loading the row to delete it
+    deleted_id = db.execute(
+        delete(RSSFeedConfiguration)
+        .where(RSSFeedConfiguration.id == feed_id)
+        .returning(RSSFeedConfiguration.id)
+    ).scalar_one_or_none()
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Feed not found")
     
-    db.delete(feed)
     db.commit()
+    cache.invalidate(FEED_CACHE_PREFIX)
     return {"message": "Feed deleted successfully"}
 
 @router.post("/{feed_id}/toggle", response_model=RSSFeedResponse)
-async def toggle_rss_feed(
+def toggle_rss_feed(
     feed_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Toggle RSS feed active status
     """
-    feed = db.query(RSSFeedConfiguration).filter(RSSFeedConfiguration.id == feed_id).first()
-    if not feed:
-        raise HTTPException(status_code=404, detail="Feed not found")
+    feed = _get_feed_or_404(db, feed_id)
     
     feed.is_active = not feed.is_active
     db.commit()
     db.refresh(feed)
+    cache.invalidate(FEED_CACHE_PREFIX)
     return feed
 
 @router.get("/health/summary", response_model=FeedHealthResponse)
-async def get_feed_health(
+def get_feed_health(
     db: Session = Depends(get_db)
 ):
     """
     Get RSS feed health summary
     """
+    content = cache.get_or_compute_bytes(
+        f"{FEED_CACHE_PREFIX}health",
+        lambda: _FEED_HEALTH_ADAPTER.dump_json(_compute_feed_health(db)),
+        ttl=FEED_CACHE_TTL
+    )
+    return Response(content=content, media_type="application/json")
+
+def _compute_feed_health(db: Session) -> FeedHealthResponse:
     from sqlalchemy import func
     
     # Get feed statistics
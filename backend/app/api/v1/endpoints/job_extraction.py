@@ -1,8 +1,10 @@
 import logging
 from typing import Optional, List
-from fastapi import APIRouter, HTTPException, Depends, BackgroundTasks
+from fastapi import APIRouter, HTTPException, Depends
+from fastapi.concurrency import run_in_threadpool
 from pydantic import BaseModel, HttpUrl, validator
 from sqlalchemy.orm import Session
+from sqlalchemy.dialects.postgresql import insert as pg_insert
 
 from app.db.session import get_db
 from app.models.job import JobListing, JobApplication, UserProfile
@@ -70,7 +72,6 @@ class BatchJobExtractionResponse(BaseModel):
 @router.post("/extract-from-url", response_model=JobExtractionResponse)
 async def extract_job_from_url(
     request: JobExtractionRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -174,9 +175,7 @@ async def extract_job_from_url(
             job_listing.applied = True
             job_listing.applied_date = datetime.utcnow()
                 
-            job_application = JobApplication(
-                user_id=request.user_id,
-                job_id=job_listing.id,
+            application_values = dict(
                 application_status="applied",  # Mark as applied since extracted from URL
                 application_source="url_extraction",
                 source_url=str(request.url),
@@ -187,10 +186,18 @@ async def extract_job_from_url(
                     "extracted_at": job_data.get("extracted_at")
                 }
             )
-            db.add(job_application)
+            # Applications are unique per (user_id, job_id); re-extracting a
+            # known job refreshes the existing application instead of failing
+            application_id = db.execute(
+                pg_insert(JobApplication)
+                .values(user_id=request.user_id, job_id=job_listing.id, **application_values)
+                .on_conflict_do_update(
+                    index_elements=[JobApplication.user_id, JobApplication.job_id],
+                    set_={**application_values, "updated_at": datetime.utcnow()}
+                )
+                .returning(JobApplication.id)
+            ).scalar_one()
             db.commit()
-            db.refresh(job_application)
-            application_id = job_application.id
             
             logger.info(f"Created application entry with ID: {application_id}")
         
@@ -198,13 +205,9 @@ async def extract_job_from_url(
         compatibility_score = None
         if job_listing.id and user_profile:
             try:
-                # For immediate response, we'll use a placeholder score
-                # The actual scoring will happen in background
-                background_tasks.add_task(
-                    trigger_job_scoring_background,
-                    job_listing.id,
-                    request.user_id
-                )
+                # Scoring runs on a Celery worker; only the enqueue happens
+                # here, off the event loop
+                await run_in_threadpool(smart_job_scorer.trigger_scoring_for_new_job, job_listing.id)
                 compatibility_score = 75.0  # Placeholder - will be updated by background task
                 
             except Exception as e:
@@ -234,7 +237,6 @@ async def extract_job_from_url(
 @router.post("/extract-multiple-urls", response_model=BatchJobExtractionResponse)
 async def extract_multiple_jobs_from_urls(
     request: BatchJobExtractionRequest,
-    background_tasks: BackgroundTasks,
     db: Session = Depends(get_db)
 ):
     """
@@ -269,7 +271,7 @@ async def extract_multiple_jobs_from_urls(
                 )
                 
                 # Process individual URL
-                result = await extract_job_from_url(individual_request, background_tasks, db)
+                result = await extract_job_from_url(individual_request, db)
                 results.append(result)
                 
                 if result.success:
@@ -304,7 +306,7 @@ async def extract_multiple_jobs_from_urls(
         raise HTTPException(status_code=500, detail=f"Batch extraction failed: {str(e)}")
 
 @router.get("/extraction-stats/{user_id}")
-async def get_extraction_stats(user_id: str, db: Session = Depends(get_db)):
+def get_extraction_stats(user_id: str, db: Session = Depends(get_db)):
     """
     Get extraction statistics for a user
     """
@@ -331,21 +333,6 @@ async def get_extraction_stats(user_id: str, db: Session = Depends(get_db)):
         logger.error(f"Failed to get extraction stats: {e}")
         raise HTTPException(status_code=500, detail="Failed to get extraction statistics")
 
-# =====================================================
-# BACKGROUND TASK FUNCTIONS
-# =====================================================
-
-async def trigger_job_scoring_background(job_id: int, user_id: str):
-    """
-    Background task to trigger job scoring
-    """
-    try:
-        logger.info(f"Triggering background job scoring for job {job_id} and user {user_id}")
-        result = smart_job_scorer.trigger_scoring_for_new_job(job_id)
-        logger.info(f"Background scoring triggered: {result}")
-    except Exception as e:
-        logger.error(f"Background scoring failed: {e}")
-
 @router.post("/test-extraction")
 async def test_extraction_endpoint():
     """
@@ -1,7 +1,9 @@
 from typing import List, Optional, Dict
-from fastapi import APIRouter, Depends, HTTPException, Query, Form
-from sqlalchemy.orm import Session
-from sqlalchemy import func, cast, Date, Integer, extract, desc
+from fastapi import APIRouter, Depends, HTTPException, Query, Form, Request, Response
+from sqlalchemy.orm import Session, joinedload
+from sqlalchemy.exc import IntegrityError
+from pydantic import TypeAdapter
+from sqlalchemy import text, func, Integer, desc, tuple_, update, delete, select, bindparam
 from app.db.rls_session import get_db, set_current_user
 from app.models.job import JobListing, JobApplication
 from app.schemas.job import (
@@ -10,20 +12,101 @@ from app.schemas.job import (
     JobListingUpdate, 
     JobStats, 
     TimeRange,
-    RecentApplication
+    RecentApplication,
+    ApplicationListResponse
 )
 from app.services.job_cleanup_service import JobCleanupService
+from app.services.application_tracking_service import ApplicationTrackingService
+from app.tasks.application_tasks import process_application_task
+from app.core import cache
+from app.utils.http_cache import conditional_json_response
+from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
 # LinkedIn scraper removed - using job aggregator instead
-from datetime import datetime, timedelta
-from app.models.job import JobApplication
+from datetime import date
 import logging
 
 logger = logging.getLogger(__name__)
 
+APPLICATION_COUNT_CACHE_TTL = 60  # seconds
+JOB_QUERY_CACHE_TTL = 60  # seconds; job data changes at ingest cadence
+JOB_CACHE_PREFIX = "jobs:"
+JOB_LIST_BATCH_SIZE = 100  # rows hydrated per server-side cursor fetch
+# Dashboards poll these reads; clients revalidate with If-None-Match and get a
+# 304 while the body is unchanged. Per-user lists must not sit in shared caches.
+PUBLIC_CACHE_CONTROL = "public, max-age=30, stale-while-revalidate=60"
+PRIVATE_CACHE_CONTROL = "private, max-age=30, stale-while-revalidate=60"
+
+_RANGE_DAYS = {
+    TimeRange.LAST_7_DAYS: 7,
+    TimeRange.LAST_30_DAYS: 30,
+    TimeRange.LAST_3_MONTHS: 90
+}
+
+# All-time counters kept current by triggers on job_listings (see the
+# stats_overall migration), so /stats does not scan the whole table
+_OVERALL_STATS_STMT = text("SELECT total_jobs, total_applied FROM stats_overall WHERE id = 1")
+
+# Per-day graph rows for /stats, read from the jobs_daily_stats materialized
+# view (refreshed every few minutes by Celery beat) instead of aggregating
+# job_listings per request. The window sums repeat the period totals on every
+# row so the whole time range is answered in one round trip.
+_DAILY_STATS_STMT = text("""
+    SELECT day AS date,
+           jobs_extracted,
+           jobs_applied,
+           CAST(sum(jobs_extracted) OVER () AS INTEGER) AS period_jobs,
+           CAST(sum(jobs_applied) OVER () AS INTEGER) AS period_applied
+    FROM jobs_daily_stats
+    WHERE day BETWEEN CAST(timezone('UTC', now()) AS DATE) - :days
+                  AND CAST(timezone('UTC', now()) AS DATE)
+    ORDER BY day
+""").bindparams(bindparam("days", type_=Integer))
+
+_RECENT_APPLICATIONS_STMT = select(JobApplication).options(
+    joinedload(JobApplication.job_listing, innerjoin=True)
+).order_by(
+    desc(JobApplication.application_date)
+).limit(bindparam("limit"))
+
+# The applications list only shows listing summaries, so the description,
+# requirements and skills blobs are never fetched for it
+_APPLICATION_LIST_JOB_LOAD = joinedload(JobApplication.job_listing, innerjoin=True).load_only(
+    JobListing.id,
+    JobListing.title,
+    JobListing.company,
+    JobListing.location,
+    JobListing.job_type,
+    JobListing.experience_level,
+    JobListing.salary_range,
+    JobListing.application_url,
+    JobListing.source,
+    JobListing.source_url,
+    JobListing.posted_date,
+    JobListing.extracted_date,
+)
+
+# Schema compiled once and reused for every list response
+_JOB_LIST_ADAPTER = TypeAdapter(List[JobListingResponse])
+_RECENT_APPLICATIONS_ADAPTER = TypeAdapter(List[RecentApplication])
+_JOB_STATS_ADAPTER = TypeAdapter(JobStats)
+
+# Handlers are plain `def`: the session is synchronous, so FastAPI runs them in
+# its threadpool instead of blocking the event loop on every query
 router = APIRouter()
 
+def _db_utcnow():
+    """
+    Server-side UTC timestamp for write statements
+
+    Every column stamped in one statement gets the same transaction time and
+    no Python datetime is bound as a parameter. Columns are naive UTC, hence
+    the timezone() conversion.
+    """
+    return func.timezone('UTC', func.now())
+
 @router.get("/", response_model=List[JobListingResponse])
-async def get_jobs(
+def get_jobs(
+    request: Request,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
@@ -41,6 +124,32 @@ async def get_jobs(
     """
     Retrieve job listings with optional filtering, sorting, and pagination
     """
+    cache_key = (
+        f"{JOB_CACHE_PREFIX}list:{user_id}:{skip}:{limit}:{title}:{company}:{location}:"
+        f"{job_type}:{experience_level}:{sort_by}:{applied}"
+    )
+    content = cache.get_or_compute_bytes(
+        cache_key,
+        lambda: _list_jobs_json(
+            db, skip, limit, title, company, location, job_type, experience_level, sort_by, applied
+        ),
+        ttl=JOB_QUERY_CACHE_TTL
+    )
+    return conditional_json_response(request, content, PRIVATE_CACHE_CONTROL)
+
+def _list_jobs_json(
+    db: Session,
+    skip: int,
+    limit: int,
+    title: Optional[str],
+    company: Optional[str],
+    location: Optional[str],
+    job_type: Optional[str],
+    experience_level: Optional[str],
+    sort_by: Optional[str],
+    applied: Optional[bool],
+) -> bytes:
+    """Run the filtered job listing query and return the page encoded as JSON"""
     query = db.query(JobListing)
     
     # Apply filters
@@ -70,11 +179,20 @@ async def get_jobs(
         # Default to newest first
         query = query.order_by(JobListing.extracted_date.desc())
         
-    jobs = query.offset(skip).limit(limit).all()
-    return jobs
+    # Rows come off a server-side cursor in batches, and each batch is validated
+    # and encoded by pydantic-core before the next is hydrated, so a large page
+    # never holds every ORM object at once
+    result = db.execute(
+        query.offset(skip).limit(limit).statement.execution_options(yield_per=JOB_LIST_BATCH_SIZE)
+    )
+    encoded_batches = [
+        _JOB_LIST_ADAPTER.dump_json(_JOB_LIST_ADAPTER.validate_python(batch, from_attributes=True))[1:-1]
+        for batch in result.scalars().partitions()
+    ]
+    return b"[" + b",".join(batch for batch in encoded_batches if batch) + b"]"
 
 @router.get("/counts")
-async def get_job_counts(
+def get_job_counts(
     db: Session = Depends(get_db),
     title: Optional[str] = None,
     company: Optional[str] = None,
@@ -85,7 +203,11 @@ async def get_job_counts(
     """
     Get job counts for pagination and stats
     """
-    query = db.query(JobListing)
+    # Both counts in one scan; FILTER keeps the applied tally in the database
+    query = db.query(
+        func.count(JobListing.id).label('total'),
+        func.count(JobListing.id).filter(JobListing.applied == True).label('applied')
+    )
     
     # Apply same filters as get_jobs
     if title:
@@ -99,11 +221,9 @@ async def get_job_counts(
     if experience_level:
         query = query.filter(JobListing.experience_level == experience_level)
     
-    # Get total count
-    total_count = query.count()
-    
-    # Get applied count
-    applied_count = query.filter(JobListing.applied == True).count()
+    counts = query.one()
+    total_count = counts.total
+    applied_count = counts.applied
     
     # Get pending count
     pending_count = total_count - applied_count
@@ -115,7 +235,8 @@ async def get_job_counts(
     }
 
 @router.get("/stats", response_model=JobStats)
-async def get_job_stats(
+def get_job_stats(
+    request: Request,
     db: Session = Depends(get_db),
     time_range: TimeRange = Query(default=TimeRange.LAST_30_DAYS, description="Time range for stats"),
     custom_days: Optional[int] = Query(default=None, description="Custom number of days for stats")
@@ -125,11 +246,20 @@ async def get_job_stats(
     - Overall total jobs and applications (all time)
     - Time-range specific graph data
     """
+    content = cache.get_or_compute_bytes(
+        f"{JOB_CACHE_PREFIX}stats:{time_range.value}:{custom_days}",
+        lambda: _JOB_STATS_ADAPTER.dump_json(
+            _JOB_STATS_ADAPTER.validate_python(_compute_job_stats(db, time_range, custom_days))
+        ),
+        ttl=JOB_QUERY_CACHE_TTL
+    )
+    # Stats move at ingest cadence, so let browsers and proxies reuse them briefly
+    return conditional_json_response(request, content, PUBLIC_CACHE_CONTROL)
+
+def _compute_job_stats(db: Session, time_range: TimeRange, custom_days: Optional[int]) -> dict:
+    """Build the /stats payload from the counter row and the jobs_daily_stats materialized view"""
     # Get overall totals (regardless of time range)
-    overall_stats = db.query(
-        func.count(JobListing.id).label('total_jobs'),
-        func.sum(cast(JobListing.applied, Integer)).label('total_applied')
-    ).first()
+    overall_stats = db.execute(_OVERALL_STATS_STMT).first()
 
     total_jobs = overall_stats.total_jobs or 0
     total_applied = overall_stats.total_applied or 0
@@ -137,80 +267,22 @@ async def get_job_stats(
     # Calculate success rate from overall totals
     success_rate = (total_applied / total_jobs * 100) if total_jobs > 0 else 0
 
-    # Calculate date range for graph data
-    end_date = datetime.utcnow()
-    if custom_days is not None:
-        days = custom_days
-    else:
-        days = {
-            TimeRange.LAST_7_DAYS: 7,
-            TimeRange.LAST_30_DAYS: 30,
-            TimeRange.LAST_3_MONTHS: 90
-        }[time_range]
+    # Graph window in whole UTC days, ending today
+    days = custom_days if custom_days is not None else _RANGE_DAYS[time_range]
     
-    start_date = end_date - timedelta(days=days)
-    
-    # Get time-range specific data for the graph
-    daily_stats = db.query(
-        cast(JobListing.extracted_date, Date).label('date'),
-        func.count(JobListing.id).label('jobs_extracted'),
-        func.sum(cast(JobListing.applied, Integer)).label('jobs_applied'),
-        extract('hour', JobListing.extracted_date).label('hour')
-    ).filter(
-        JobListing.extracted_date >= start_date,
-        JobListing.extracted_date <= end_date
-    ).group_by(
-        cast(JobListing.extracted_date, Date),
-        extract('hour', JobListing.extracted_date)
-    ).order_by(
-        cast(JobListing.extracted_date, Date),
-        extract('hour', JobListing.extracted_date)
-    ).all()
-    
-    # Calculate daily aggregates for the graph
-    daily_data = []
-    current_date = None
-    daily_extracted = 0
-    daily_applied = 0
-    
-    for stat in daily_stats:
-        stat_date = stat.date
-        
-        if current_date is None:
-            current_date = stat_date
-        
-        if current_date != stat_date:
-            # Add the previous day's data
-            daily_data.append({
-                "date": str(current_date),
-                "jobs_extracted": daily_extracted,
-                "jobs_applied": daily_applied or 0,
-            })
-            # Reset counters for new day
-            current_date = stat_date
-            daily_extracted = stat.jobs_extracted
-            daily_applied = stat.jobs_applied or 0
-        else:
-            # Accumulate current day's data
-            daily_extracted += stat.jobs_extracted
-            daily_applied += stat.jobs_applied or 0
-    
-    # Add the last day's data
-    if current_date is not None:
-        daily_data.append({
-            "date": str(current_date),
-            "jobs_extracted": daily_extracted,
-            "jobs_applied": daily_applied or 0,
-        })
-
-    # Get period totals (just for the selected time range)
-    period_stats = db.query(
-        func.count(JobListing.id).label('period_jobs'),
-        func.sum(cast(JobListing.applied, Integer)).label('period_applied')
-    ).filter(
-        JobListing.extracted_date >= start_date,
-        JobListing.extracted_date <= end_date
-    ).first()
+    # One row per day, each carrying the period totals via window sums
+    daily_stats = db.execute(_DAILY_STATS_STMT, {"days": days}).all()
+
+    daily_data = [
+        {
+            "date": str(stat.date),
+            "jobs_extracted": stat.jobs_extracted,
+            "jobs_applied": stat.jobs_applied or 0,
+        }
+        for stat in daily_stats
+    ]
+    period_jobs = daily_stats[0].period_jobs if daily_stats else 0
+    period_applied = (daily_stats[0].period_applied or 0) if daily_stats else 0
     
     return {
         # Overall statistics (all time)
@@ -219,16 +291,17 @@ async def get_job_stats(
         "success_rate": round(success_rate, 2),
         
         # Period statistics (for selected time range)
-        "period_jobs": period_stats.period_jobs or 0,
-        "period_applied": period_stats.period_applied or 0,
+        "period_jobs": period_jobs,
+        "period_applied": period_applied,
         
         # Graph data
         "daily_stats": daily_data,
         "time_range": time_range.value if not custom_days else f"last_{custom_days}_days"
     } 
 
-@router.get("/recent-applications")
-async def get_recent_applications(
+@router.get("/recent-applications", response_model=List[RecentApplication])
+def get_recent_applications(
+    request: Request,
     limit: int = Query(default=5, ge=1, le=50),
     db: Session = Depends(get_db)
 ):
@@ -236,31 +309,16 @@ async def get_recent_applications(
     Get recent job applications, ordered by application date
     """
     # Query JobApplication table to get actual applications with job details
-    recent_apps = db.query(JobApplication, JobListing).join(
-        JobListing, JobApplication.job_id == JobListing.id
-    ).order_by(
-        desc(JobApplication.application_date)
-    ).limit(limit).all()
-    
-    # Format response to match frontend expectations
-    result = []
-    for app, job in recent_apps:
-        result.append({
-            "id": job.id,
-            "title": job.title,
-            "company": job.company,
-            "location": job.location or "Remote",
-            "applied_date": app.application_date.isoformat() if app.application_date else None,
-            "extracted_date": job.extracted_date.isoformat() if job.extracted_date else None,
-            "status": app.application_status.title() if app.application_status else "Applied",
-            "source_url": job.source_url,
-            "application_source": app.application_source
-        })
+    recent_apps = db.execute(_RECENT_APPLICATIONS_STMT, {"limit": limit}).scalars().all()
     
-    return result
+    # Validate and encode in one pydantic-core pass; datetimes are formatted in Rust
+    content = _RECENT_APPLICATIONS_ADAPTER.dump_json(
+        _RECENT_APPLICATIONS_ADAPTER.validate_python(recent_apps, from_attributes=True)
+    )
+    return conditional_json_response(request, content, PRIVATE_CACHE_CONTROL)
 
 @router.post("/", response_model=JobListingResponse)
-async def create_job(
+def create_job(
     job: JobListingCreate,
     db: Session = Depends(get_db)
 ):
@@ -269,25 +327,29 @@ async def create_job(
     """
     db_job = JobListing(**job.dict())
     db.add(db_job)
+    # The INSERT ... RETURNING brings back the new id and the server-default
+    # extracted_date; with expire_on_commit off the object is complete
+    # without a refresh
     db.commit()
-    db.refresh(db_job)
+    cache.invalidate(JOB_CACHE_PREFIX)
     return db_job
 
 @router.get("/{job_id}", response_model=JobListingResponse)
-async def get_job(
+def get_job(
     job_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Retrieve a specific job listing by ID
     """
-    job = db.query(JobListing).filter(JobListing.id == job_id).first()
+    # Primary-key lookup: identity map first, no Query construction
+    job = db.get(JobListing, job_id)
     if not job:
         raise HTTPException(status_code=404, detail="Job not found")
     return job
 
 @router.put("/{job_id}", response_model=JobListingResponse)
-async def update_job(
+def update_job(
     job_id: int,
     job_update: JobListingUpdate,
     db: Session = Depends(get_db)
@@ -295,35 +357,49 @@ async def update_job(
     """
     Update a job listing
     """
-    db_job = db.query(JobListing).filter(JobListing.id == job_id).first()
+    update_data = job_update.dict(exclude_unset=True)
+    if not update_data:
+        db_job = db.get(JobListing, job_id)
+    else:
+        # Single UPDATE ... RETURNING instead of SELECT + flush + refresh
+        db_job = db.execute(
+            update(JobListing)
+            .where(JobListing.id == job_id)
+            .values(**update_data)
+            .returning(JobListing)
+        ).scalar_one_or_none()
     if not db_job:
         raise HTTPException(status_code=404, detail="Job not found")
         
-    for field, value in job_update.dict(exclude_unset=True).items():
-        setattr(db_job, field, value)
-        
     db.commit()
-    db.refresh(db_job)
+    cache.invalidate(JOB_CACHE_PREFIX)
     return db_job
 
 @router.delete("/{job_id}")
-async def delete_job(
+def delete_job(
     job_id: int,
     db: Session = Depends(get_db)
 ):
     """
     Delete a job listing
     """
-    db_job = db.query(JobListing).filter(JobListing.id == job_id).first()
-    if not db_job:
+    try:
+        deleted_id = db.execute(
+            delete(JobListing).where(JobListing.id == job_id).returning(JobListing.id)
+        ).scalar_one_or_none()
+    except IntegrityError:
+        # Still referenced by an application or a matched email
+        db.rollback()
+        raise HTTPException(status_code=409, detail="Job is referenced by applications or emails")
+    if deleted_id is None:
         raise HTTPException(status_code=404, detail="Job not found")
         
-    db.delete(db_job)
     db.commit()
+    cache.invalidate(JOB_CACHE_PREFIX)
     return {"message": "Job deleted successfully"}
 
 @router.post("/scrape", response_model=List[JobListingResponse])
-async def scrape_jobs(
+def scrape_jobs(
     query: dict,
     db: Session = Depends(get_db)
 ):
@@ -343,7 +419,7 @@ async def scrape_jobs(
     raise HTTPException(status_code=501, detail="Scraping functionality is not yet implemented")
 
 @router.put("/{job_id}/status", response_model=JobListingResponse)
-async def update_job_status(
+def update_job_status(
     job_id: int,
     status_update: dict,
     db: Session = Depends(get_db)
@@ -351,82 +427,95 @@ async def update_job_status(
     """
     Update job application status
     """
-    db_job = db.query(JobListing).filter(JobListing.id == job_id).first()
-    if not db_job:
-        raise HTTPException(status_code=404, detail="Job not found")
-        
     if "applied" in status_update:
-        db_job.applied = status_update["applied"]
+        values = {"applied": status_update["applied"]}
         
         # Set applied_date timestamp when marking as applied
         if status_update["applied"]:
-            db_job.applied_date = datetime.utcnow()
+            values["applied_date"] = _db_utcnow()
+        
+        db_job = db.execute(
+            update(JobListing)
+            .where(JobListing.id == job_id)
+            .values(**values)
+            .returning(JobListing)
+        ).scalar_one_or_none()
+    else:
+        db_job = db.get(JobListing, job_id)
+    if not db_job:
+        raise HTTPException(status_code=404, detail="Job not found")
         
     db.commit()
-    db.refresh(db_job)
+    cache.invalidate(JOB_CACHE_PREFIX)
     return db_job 
 
-@router.post("/applications/{job_id}/apply")
-async def apply_to_job(
+@router.post("/applications/{job_id}/apply", status_code=202)
+def apply_to_job(
     job_id: int,
     user_id: str = Form(...),
     application_source: str = Form("direct"),
     notes: str = Form(""),
     db: Session = Depends(get_db)
 ):
-    """Track when user applies to a job"""
+    """
+    Track when user applies to a job
+
+    The click is written to the application outbox (one INSERT) and a Celery
+    worker folds it into JobApplication. Poll
+    /applications/status/{application_id} to see when it has been recorded.
+    """
     try:
-        # Check if already applied
-        existing = db.query(JobApplication).filter(
-            JobApplication.user_id == user_id,
-            JobApplication.job_id == job_id
-        ).first()
-        
-        if existing:
-            if existing.application_status == "applied":
-                return {"message": "Already applied to this job", "application_id": existing.id}
-            else:
-                # Update to applied status
-                existing.application_status = "applied"
-                existing.application_date = datetime.utcnow()
-                existing.application_source = application_source
-                existing.user_notes = notes
-                existing.updated_at = datetime.utcnow()
-        else:
-            # Create new application record
-            application = JobApplication(
-                user_id=user_id,
-                job_id=job_id,
-                application_status="applied",
-                application_source=application_source,
-                user_notes=notes
-            )
-            db.add(application)
-            existing = application
-        
-        db.commit()
-        db.refresh(existing)
-        
-        return {
-            "message": "Application tracked successfully",
-            "application_id": existing.id,
-            "status": "applied"
-        }
-        
+        outbox_id = ApplicationTrackingService(db).enqueue(user_id, job_id, application_source, notes)
+    except IntegrityError:
+        # The outbox job_id foreign key doubles as the existence check
+        db.rollback()
+        raise HTTPException(status_code=404, detail="Job not found")
     except Exception as e:
         logger.error(f"Error tracking job application: {e}")
         db.rollback()
         raise HTTPException(status_code=500, detail="Error tracking application")
 
-@router.get("/applications/{user_id}")
-async def get_user_applications(
+    try:
+        process_application_task.delay(outbox_id)
+    except Exception as e:
+        # Already durable in the outbox; the periodic drain will pick it up
+        logger.warning(f"Could not queue application outbox entry {outbox_id}: {e}")
+
+    return {
+        "message": "Application queued for tracking",
+        "application_id": outbox_id,
+        "status": "queued"
+    }
+
+@router.get("/applications/status/{application_id}")
+def get_application_tracking_status(
+    application_id: int,
+    db: Session = Depends(get_db)
+):
+    """
+    Report whether a queued apply click has been recorded yet
+    """
+    status = ApplicationTrackingService(db).status(application_id)
+    if status is None:
+        raise HTTPException(status_code=404, detail="Application not found")
+    return {"application_id": application_id, "status": status}
+
+@router.get("/applications/{user_id}", response_model=ApplicationListResponse)
+def get_user_applications(
     user_id: str,
     status: str = None,
     page: int = 1,
     limit: int = 10,
+    cursor: Optional[str] = None,
     db: Session = Depends(get_db)
 ):
-    """Get user's applied jobs from JobApplication table with pagination"""
+    """
+    Get user's applied jobs from JobApplication table with pagination
+
+    Pass the returned `next_cursor` back as `cursor` to fetch the next page
+    with a keyset range scan instead of an OFFSET. Cursor pages return
+    `total` and `total_pages` as null.
+    """
     try:
         # Query JobApplication table for user's applications
         query = db.query(JobApplication).filter(JobApplication.user_id == user_id)
@@ -435,66 +524,55 @@ async def get_user_applications(
         if status:
             query = query.filter(JobApplication.application_status == status)
         
-        # Get total count for pagination
-        total_count = query.count()
-        
-        # Apply pagination and order by application_date (latest first)
-        offset = (page - 1) * limit
-        applications = query.order_by(JobApplication.application_date.desc()).offset(offset).limit(limit).all()
-        
-        # Prepare response to match frontend expectations
-        results = []
-        for application in applications:
-            job = application.job_listing
-            results.append({
-                "id": application.id,
-                "user_id": application.user_id,
-                "job_id": application.job_id,
-                "application_status": application.application_status,
-                "application_source": application.application_source,
-                "application_date": application.application_date.isoformat(),
-                "source_url": application.source_url,
-                "user_notes": application.user_notes,
-                "extraction_metadata": application.extraction_metadata or {
-                    "extraction_confidence": 0.9,
-                    "extraction_method": job.source or "dashboard"
-                },
-                "follow_up_date": application.follow_up_date.isoformat() if application.follow_up_date else None,
-                "company_response": application.company_response,
-                "response_date": application.response_date.isoformat() if application.response_date else None,
-                "job_listing": {
-                    "id": job.id,
-                    "title": job.title,
-                    "company": job.company,
-                    "location": job.location,
-                    "description": job.description,
-                    "requirements": job.requirements,
-                    "job_type": job.job_type,
-                    "experience_level": job.experience_level,
-                    "salary_range": job.salary_range,
-                    "skills": job.skills,
-                    "application_url": job.application_url,
-                    "source": job.source,
-                    "source_url": job.source_url,
-                    "posted_date": job.posted_date.isoformat() if job.posted_date else None,
-                    "extracted_date": job.extracted_date.isoformat() if job.extracted_date else None,
-                }
-            })
+        # Cursor pages skip the count entirely: the client already has the
+        # total from its first page. Otherwise serve it from the cache.
+        total_count = None
+        if not cursor:
+            total_count = cache.get_or_compute(
+                f"applications:{user_id}:count:{status or 'all'}",
+                query.count,
+                ttl=APPLICATION_COUNT_CACHE_TTL
+            )
         
-        return {
-            "applications": results,
-            "total": total_count,
-            "page": page,
-            "limit": limit,
-            "total_pages": (total_count + limit - 1) // limit
-        }
+        # Order by application_date (latest first), id breaks ties for a stable keyset
+        query = query.order_by(JobApplication.application_date.desc(), JobApplication.id.desc())
+        if cursor:
+            cursor_date, cursor_id = decode_keyset_cursor(cursor)
+            query = query.filter(
+                tuple_(JobApplication.application_date, JobApplication.id) < (cursor_date, cursor_id)
+            )
+        else:
+            query = query.offset((page - 1) * limit)
+        
+        # Fetch one extra row to know whether another page exists; the job
+        # listing comes back in the same statement instead of one SELECT per row
+        applications = query.options(_APPLICATION_LIST_JOB_LOAD).limit(limit + 1).all()
+        has_more = len(applications) > limit
+        applications = applications[:limit]
+        next_cursor = encode_keyset_cursor(applications[-1].application_date, applications[-1].id) if has_more else None
+        
+        # Rows are validated from the ORM objects and encoded by pydantic-core
+        payload = ApplicationListResponse.model_validate(
+            {
+                "applications": applications,
+                "total": total_count,
+                "page": page,
+                "limit": limit,
+                "total_pages": (total_count + limit - 1) // limit if total_count is not None else None,
+                "next_cursor": next_cursor
+            },
+            from_attributes=True
+        )
+        return Response(content=payload.model_dump_json(), media_type="application/json")
         
+    except HTTPException:
+        raise
     except Exception as e:
         logger.error(f"Error fetching applications: {e}")
         raise HTTPException(status_code=500, detail="Error fetching applications")
 
 @router.put("/applications/{application_id}/status")
-async def update_application_status(
+def update_application_status(
     application_id: int,
     status: str = Form(...),  # interested, applied, interviewed, rejected, hired
     notes: str = Form(""),
@@ -503,30 +581,39 @@ async def update_application_status(
 ):
     """Update application status"""
     try:
-        application = db.query(JobApplication).filter(JobApplication.id == application_id).first()
-        
-        if not application:
-            raise HTTPException(status_code=404, detail="Application not found")
-        
         # Update status
-        application.application_status = status
-        application.updated_at = datetime.utcnow()
+        values = {
+            "application_status": status,
+            "updated_at": _db_utcnow(),
+        }
         
         if notes:
-            application.user_notes = notes
+            values["user_notes"] = notes
             
         if follow_up_date:
-            from datetime import datetime as dt
-            application.follow_up_date = dt.strptime(follow_up_date, "%Y-%m-%d").date()
+            # YYYY-MM-DD is ISO 8601, which date.fromisoformat parses in C
+            try:
+                values["follow_up_date"] = date.fromisoformat(follow_up_date)
+            except ValueError:
+                raise HTTPException(status_code=400, detail="follow_up_date must be YYYY-MM-DD")
         
-        # Set response tracking based on status
+        # Set response tracking based on status, keeping the first response date
         if status in ["interviewed", "rejected", "hired"]:
-            application.company_response = True
-            if not application.response_date:
-                application.response_date = datetime.utcnow()
+            values["company_response"] = True
+            values["response_date"] = func.coalesce(JobApplication.response_date, _db_utcnow())
+        
+        application = db.execute(
+            update(JobApplication)
+            .where(JobApplication.id == application_id)
+            .values(**values)
+            .returning(JobApplication.id, JobApplication.user_id)
+        ).first()
+        
+        if not application:
+            raise HTTPException(status_code=404, detail="Application not found")
         
         db.commit()
-        db.refresh(application)
+        cache.invalidate(f"applications:{application.user_id}:")
         
         return {
             "message": "Application status updated",
@@ -546,7 +633,7 @@ async def update_application_status(
 # =====================================================
 
 @router.get("/cleanup/stats")
-async def get_cleanup_stats(
+def get_cleanup_stats(
     days_old: int = Query(default=20, ge=1, le=365, description="Number of days to check for old jobs"),
     user_id: str = Query(default="demo_user", description="User ID for RLS context"),
     db: Session = Depends(get_db)
@@ -561,7 +648,7 @@ async def get_cleanup_stats(
         raise HTTPException(status_code=500, detail="Error getting cleanup statistics")
 
 @router.post("/cleanup/execute")
-async def execute_cleanup(
+def execute_cleanup(
     days_old: int = Query(default=20, ge=1, le=365, description="Number of days after which to delete old jobs"),
     user_id: str = Query(default="demo_user", description="User ID for RLS context"),
     db: Session = Depends(get_db)
@@ -574,6 +661,7 @@ async def execute_cleanup(
         
         if result["status"] == "error":
             raise HTTPException(status_code=500, detail=result["message"])
+        cache.invalidate(JOB_CACHE_PREFIX)
         return result
     except HTTPException:
         raise
@@ -582,7 +670,7 @@ async def execute_cleanup(
         raise HTTPException(status_code=500, detail="Error executing cleanup")
 
 @router.post("/cleanup/execute-all")
-async def execute_cleanup_all(
+def execute_cleanup_all(
     days_old: int = Query(default=20, ge=1, le=365, description="Number of days after which to delete old jobs"),
     db: Session = Depends(get_db)
 ):
@@ -593,6 +681,7 @@ async def execute_cleanup_all(
         
         if result["status"] == "error":
             raise HTTPException(status_code=500, detail=result["message"])
+        cache.invalidate(JOB_CACHE_PREFIX)
         return result
     except HTTPException:
         raise
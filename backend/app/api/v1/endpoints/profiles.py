@@ -1,17 +1,91 @@
 from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form
+from fastapi import APIRouter, Depends, HTTPException, UploadFile, File, Form, Request, Response
+from fastapi.concurrency import run_in_threadpool
+from fastapi.responses import StreamingResponse
+from pydantic import TypeAdapter
+from sqlalchemy import func, literal, select, text, update
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.exc import SQLAlchemyError
 from sqlalchemy.orm import Session
 
 from app.db.session import get_db
-from app.models.job import UserProfile
+from app.models.job import JobListing, UserProfile
+from app.schemas.profile import ProfileResponse, UserSummary, JobMatchesResponse
 from app.services.resume_parser import resume_parser
 from app.services.job_scorer import job_scorer
 from app.services.smart_job_scorer import smart_job_scorer
 from app.core.ai_service import ai_service
+from app.core import cache
+from app.utils.http_cache import conditional_json_response
 from datetime import datetime
+from itertools import chain
+import asyncio
+import logging
 
+logger = logging.getLogger(__name__)
+
+# Handlers that only touch the synchronous Session are plain `def`, so FastAPI
+# runs them in its threadpool; the async resume/scoring handlers push their
+# database calls there explicitly with run_in_threadpool
 router = APIRouter()
 
+PROFILE_CACHE_TTL = 300  # seconds; every profile write invalidates explicitly
+PROFILE_CACHE_CONTROL = "private, no-cache"
+JOB_MATCHES_CACHE_TTL = 300  # seconds
+_PROFILE_ADAPTER = TypeAdapter(ProfileResponse)
+_USER_SUMMARY_ADAPTER = TypeAdapter(UserSummary)
+_JOB_MATCHES_ADAPTER = TypeAdapter(JobMatchesResponse)
+USER_LIST_BATCH_SIZE = 200
+RESUME_BATCH_CONCURRENCY = 4  # resumes parsed at once; each waits on two OpenAI calls
+
+_USER_LIST_COLUMNS = (
+    UserProfile.user_id,
+    UserProfile.full_name,
+    UserProfile.career_level,
+    UserProfile.years_of_experience,
+    UserProfile.created_at,
+    UserProfile.last_resume_upload,
+)
+
+# Columns PUT /profile may change, by request section
+_PROFILE_UPDATE_FIELDS = {
+    "personal_info": ("full_name", "email", "phone", "location", "work_authorization"),
+    "preferences": ("desired_roles", "preferred_locations", "job_types", "company_size_preference"),
+}
+_SALARY_RANGE_COLUMNS = {"min": "salary_range_min", "max": "salary_range_max"}
+# Columns PUT /preferences may change
+_PREFERENCE_UPDATE_FIELDS = (
+    "desired_roles", "preferred_locations", "salary_range_min", "salary_range_max",
+    "job_types", "company_size_preference", "work_authorization",
+)
+
+def _pick_fields(data: Optional[dict], fields) -> dict:
+    """The entries of data whose keys are in fields"""
+    if not data:
+        return {}
+    return {key: data[key] for key in fields if key in data}
+
+def _profile_exists(db: Session, user_id: str) -> bool:
+    # An index probe on user_id; the wide profile row is never read
+    return db.execute(
+        select(literal(1)).where(UserProfile.user_id == user_id).limit(1)
+    ).first() is not None
+
+def _job_exists(db: Session, job_id: int) -> bool:
+    return db.execute(
+        select(literal(1)).where(JobListing.id == job_id).limit(1)
+    ).first() is not None
+
+def _profile_cache_prefix(user_id: str) -> str:
+    # Trailing colon so user "u1" never matches "u10"
+    return f"profile:{user_id}:"
+
+def _profile_cache_key(user_id: str) -> str:
+    return f"{_profile_cache_prefix(user_id)}response"
+
+def _invalidate_profile_cache(user_id: str) -> None:
+    cache.invalidate(_profile_cache_prefix(user_id))
+
 @router.post("/upload-resume/{user_id}")
 async def upload_resume(
     user_id: str,
@@ -26,27 +100,13 @@ async def upload_resume(
         # Parse resume file using AI
         parsed_data = await resume_parser.parse_resume_file(file)
         
-        # Check if user profile already exists
-        existing_profile = db.query(UserProfile).filter(
-            UserProfile.user_id == user_id
-        ).first()
-        
-        if existing_profile:
-            # Update existing profile
-            _update_profile_from_parsed_data(existing_profile, parsed_data)
-            existing_profile.updated_at = datetime.utcnow()
-            existing_profile.last_resume_upload = datetime.utcnow()
-            db.commit()
-            db.refresh(existing_profile)
-            profile = existing_profile
-        else:
-            # Create new profile
-            profile = _create_profile_from_parsed_data(user_id, parsed_data)
-            db.add(profile)
-            db.commit()
-            db.refresh(profile)
+        # Create or update the profile in one statement
+        profile = await run_in_threadpool(
+            _upsert_profile_from_parsed_data, db, user_id, parsed_data, resume_uploaded=True
+        )
         
-        return {
+        # Read the returned row before commit expires it
+        response = {
             "success": True,
             "message": "Resume uploaded and parsed successfully",
             "profile_id": profile.id,
@@ -60,82 +120,100 @@ async def upload_resume(
                 "ai_summary": profile.ai_profile_summary
             }
         }
+        await run_in_threadpool(db.commit)
+        _invalidate_profile_cache(user_id)
+        
+        return response
         
     except HTTPException:
         raise
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error processing resume: {str(e)}")
 
+@router.post("/batch-upload-resumes")
+async def batch_upload_resumes(
+    user_ids: List[str] = Form(...),
+    files: List[UploadFile] = File(...),
+    db: Session = Depends(get_db)
+):
+    """
+    Upload and parse resumes for several users at once
+    
+    user_ids[i] is the owner of files[i]. Every parsed profile is saved in
+    one transaction with a single commit; a resume that fails to parse or
+    save is reported in results without affecting the others.
+    """
+    if len(user_ids) != len(files):
+        raise HTTPException(status_code=422, detail="user_ids and files must have the same length")
+    
+    # Parse concurrently so one resume's OpenAI round trips overlap the next
+    # one's instead of running back to back
+    semaphore = asyncio.Semaphore(RESUME_BATCH_CONCURRENCY)
+    
+    async def parse(file: UploadFile):
+        async with semaphore:
+            try:
+                return await resume_parser.parse_resume_file(file), None
+            except HTTPException as e:
+                return None, e.detail
+    
+    outcomes = await asyncio.gather(*(parse(file) for file in files))
+    
+    results = []
+    parsed = []
+    for user_id, (parsed_data, error) in zip(user_ids, outcomes):
+        if error is None:
+            parsed.append((len(results), user_id, parsed_data))
+            results.append(None)
+        else:
+            results.append({"user_id": user_id, "success": False, "error": error})
+    
+    for index, result in await run_in_threadpool(_save_parsed_profiles, db, parsed):
+        results[index] = result
+    
+    for result in results:
+        if result["success"]:
+            _invalidate_profile_cache(result["user_id"])
+    
+    successful = sum(1 for result in results if result["success"])
+    return {
+        "success": True,
+        "total_processed": len(results),
+        "successful_uploads": successful,
+        "failed_uploads": len(results) - successful,
+        "results": results
+    }
+
 @router.get("/profile/{user_id}")
-async def get_user_profile(
+def get_user_profile(
     user_id: str,
+    request: Request,
     db: Session = Depends(get_db)
 ):
     """
     Get user profile information
     """
+    content = cache.get_or_compute_bytes(
+        _profile_cache_key(user_id),
+        lambda: _build_profile_response(db, user_id),
+        ttl=PROFILE_CACHE_TTL
+    )
+    # Clients always revalidate; an unchanged profile costs a 304 and no body
+    return conditional_json_response(request, content, PROFILE_CACHE_CONTROL)
+
+def _build_profile_response(db: Session, user_id: str) -> bytes:
+    """Load a profile and encode it as the GET /profile response body"""
     profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
     
     if not profile:
         raise HTTPException(status_code=404, detail="User profile not found")
     
-    return {
-        "user_id": profile.user_id,
-        "personal_info": {
-            "full_name": profile.full_name,
-            "email": profile.email,
-            "phone": profile.phone,
-            "location": profile.location,
-            "work_authorization": profile.work_authorization
-        },
-        "professional_summary": {
-            "years_of_experience": profile.years_of_experience,
-            "career_level": profile.career_level,
-            "summary": profile.professional_summary
-        },
-        "skills": {
-            "programming_languages": profile.programming_languages,
-            "frameworks_libraries": profile.frameworks_libraries,
-            "tools_platforms": profile.tools_platforms,
-            "soft_skills": profile.soft_skills
-        },
-        "experience": {
-            "job_titles": profile.job_titles,
-            "companies": profile.companies,
-            "industries": profile.industries,
-            "descriptions": profile.experience_descriptions
-        },
-        "education": {
-            "degrees": profile.degrees,
-            "institutions": profile.institutions,
-            "graduation_years": profile.graduation_years,
-            "coursework": profile.relevant_coursework
-        },
-        "preferences": {
-            "desired_roles": profile.desired_roles,
-            "preferred_locations": profile.preferred_locations,
-            "salary_range": {
-                "min": profile.salary_range_min,
-                "max": profile.salary_range_max
-            },
-            "job_types": profile.job_types,
-            "company_size_preference": profile.company_size_preference
-        },
-        "ai_insights": {
-            "profile_summary": profile.ai_profile_summary,
-            "strengths": profile.ai_strengths,
-            "improvement_areas": profile.ai_improvement_areas,
-            "career_advice": profile.ai_career_advice
-        },
-        "metadata": {
-            "created_at": profile.created_at,
-            "updated_at": profile.updated_at,
-            "last_resume_upload": profile.last_resume_upload
-        }
-    }
+    # The schema maps columns onto response sections; pydantic-core encodes
+    # the result without building intermediate dicts
+    return _PROFILE_ADAPTER.dump_json(_PROFILE_ADAPTER.validate_python(profile))
 
 @router.put("/profile/{user_id}")
-async def update_user_profile(
+def update_user_profile(
     user_id: str,
     profile_data: dict,
     db: Session = Depends(get_db)
@@ -143,50 +221,32 @@ async def update_user_profile(
     """
     Update user profile information
     """
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+    # Update fields that are provided, limited to the editable columns
+    values = {}
+    for section, fields in _PROFILE_UPDATE_FIELDS.items():
+        values.update(_pick_fields(profile_data.get(section), fields))
+    salary = (profile_data.get("preferences") or {}).get("salary_range") or {}
+    values.update({column: salary[key] for key, column in _SALARY_RANGE_COLUMNS.items() if key in salary})
     
-    if not profile:
-        raise HTTPException(status_code=404, detail="User profile not found")
-    
-    # Update fields that are provided
-    if "personal_info" in profile_data:
-        personal = profile_data["personal_info"]
-        if "full_name" in personal:
-            profile.full_name = personal["full_name"]
-        if "email" in personal:
-            profile.email = personal["email"]
-        if "phone" in personal:
-            profile.phone = personal["phone"]
-        if "location" in personal:
-            profile.location = personal["location"]
-        if "work_authorization" in personal:
-            profile.work_authorization = personal["work_authorization"]
+    values["updated_at"] = datetime.utcnow()
     
-    if "preferences" in profile_data:
-        prefs = profile_data["preferences"]
-        if "desired_roles" in prefs:
-            profile.desired_roles = prefs["desired_roles"]
-        if "preferred_locations" in prefs:
-            profile.preferred_locations = prefs["preferred_locations"]
-        if "salary_range" in prefs:
-            salary = prefs["salary_range"]
-            if "min" in salary:
-                profile.salary_range_min = salary["min"]
-            if "max" in salary:
-                profile.salary_range_max = salary["max"]
-        if "job_types" in prefs:
-            profile.job_types = prefs["job_types"]
-        if "company_size_preference" in prefs:
-            profile.company_size_preference = prefs["company_size_preference"]
+    # One UPDATE ... RETURNING instead of SELECT, flush and refresh
+    updated_id = db.execute(
+        update(UserProfile)
+        .where(UserProfile.user_id == user_id)
+        .values(**values)
+        .returning(UserProfile.id)
+    ).scalar_one_or_none()
+    if updated_id is None:
+        raise HTTPException(status_code=404, detail="User profile not found")
     
-    profile.updated_at = datetime.utcnow()
     db.commit()
-    db.refresh(profile)
+    _invalidate_profile_cache(user_id)
     
     return {"success": True, "message": "Profile updated successfully"}
 
 @router.get("/matches/{user_id}")
-async def get_job_matches(
+def get_job_matches(
     user_id: str,
     limit: int = 10,
     min_score: float = 70.0,
@@ -195,9 +255,19 @@ async def get_job_matches(
     """
     Get top job matches for a user based on AI scoring
     """
+    # Kept under the profile's cache prefix, so any profile or preference
+    # write drops it; the TTL bounds staleness against newly fetched jobs
+    content = cache.get_or_compute_bytes(
+        f"{_profile_cache_prefix(user_id)}matches:{limit}:{min_score}",
+        lambda: _build_job_matches_response(db, user_id, limit, min_score),
+        ttl=JOB_MATCHES_CACHE_TTL
+    )
+    return Response(content=content, media_type="application/json")
+
+def _build_job_matches_response(db: Session, user_id: str, limit: int, min_score: float) -> bytes:
+    """Compute and encode the GET /matches response"""
     # Check if user profile exists
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-    if not profile:
+    if not _profile_exists(db, user_id):
         raise HTTPException(status_code=404, detail="User profile not found")
     
     # Get top matches using smart job scorer for better performance
@@ -207,13 +277,14 @@ async def get_job_matches(
         min_score=min_score
     )
     
-    return {
-        "user_id": user_id,
-        "total_matches": len(matches),
-        "min_score_threshold": min_score,
-        "matches": matches,
-        "scoring_method": "smart_filtered"
-    }
+    payload = JobMatchesResponse(
+        user_id=user_id,
+        total_matches=len(matches),
+        min_score_threshold=min_score,
+        matches=matches,
+        scoring_method="smart_filtered"
+    )
+    return _JOB_MATCHES_ADAPTER.dump_json(payload)
 
 @router.post("/score-jobs/{user_id}")
 async def score_new_jobs(
@@ -226,8 +297,7 @@ async def score_new_jobs(
     Score new jobs for a user (manual trigger)
     """
     # Check if user profile exists
-    profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-    if not profile:
+    if not await run_in_threadpool(_profile_exists, db, user_id):
         raise HTTPException(status_code=404, detail="User profile not found")
     
     # Score jobs using job scorer service
@@ -254,26 +324,13 @@ async def parse_resume_text(
         # Parse resume text using AI
         parsed_data = await resume_parser.update_profile_from_text(resume_text)
         
-        # Check if user profile already exists
-        existing_profile = db.query(UserProfile).filter(
-            UserProfile.user_id == user_id
-        ).first()
-        
-        if existing_profile:
-            # Update existing profile
-            _update_profile_from_parsed_data(existing_profile, parsed_data)
-            existing_profile.updated_at = datetime.utcnow()
-            db.commit()
-            db.refresh(existing_profile)
-            profile = existing_profile
-        else:
-            # Create new profile
-            profile = _create_profile_from_parsed_data(user_id, parsed_data)
-            db.add(profile)
-            db.commit()
-            db.refresh(profile)
+        # Create or update the profile in one statement
+        profile = await run_in_threadpool(
+            _upsert_profile_from_parsed_data, db, user_id, parsed_data, resume_uploaded=False
+        )
         
-        return {
+        # Read the returned row before commit expires it
+        response = {
             "success": True,
             "message": "Resume text parsed successfully",
             "profile_summary": {
@@ -283,40 +340,70 @@ async def parse_resume_text(
                 "ai_summary": profile.ai_profile_summary
             }
         }
+        await run_in_threadpool(db.commit)
+        _invalidate_profile_cache(user_id)
+        
+        return response
         
     except Exception as e:
         raise HTTPException(status_code=500, detail=f"Error parsing resume text: {str(e)}")
 
 @router.get("/users")
-async def list_users(
+def list_users(
     skip: int = 0,
     limit: int = 100,
     db: Session = Depends(get_db)
 ):
     """
     List all users with profiles (for admin/testing)
+    
+    Streams one JSON object per line (NDJSON); the total is sent in the
+    X-Total-Count header
     """
-    profiles = db.query(UserProfile).offset(skip).limit(limit).all()
+    # Only the listed columns; the skill, experience and AI JSON blobs stay in
+    # the table. count(*) OVER () is evaluated before OFFSET/LIMIT, so every
+    # row carries the full total from the same scan.
+    result = db.execute(
+        select(*_USER_LIST_COLUMNS, func.count().over().label("total"))
+        .order_by(UserProfile.id)
+        .offset(skip)
+        .limit(limit)
+        .execution_options(yield_per=USER_LIST_BATCH_SIZE)
+    )
+    batches = result.partitions()
+    # The first batch is read up front so the total can go out as a header
+    first_batch = next(batches, [])
     
-    return {
-        "users": [
-            {
-                "user_id": p.user_id,
-                "full_name": p.full_name,
-                "career_level": p.career_level,
-                "years_of_experience": p.years_of_experience,
-                "created_at": p.created_at,
-                "last_resume_upload": p.last_resume_upload
-            }
-            for p in profiles
-        ],
-        "total": len(profiles)
-    }
+    if first_batch:
+        total = first_batch[0].total
+    elif skip:
+        # Paged past the end: no row to read the window total from
+        total = db.execute(select(func.count()).select_from(UserProfile)).scalar_one()
+    else:
+        total = 0
+    
+    def encode_rows():
+        # Rows come off a server-side cursor a batch at a time, so memory
+        # stays bounded by the batch size however large limit is
+        for batch in chain([first_batch], batches):
+            for row in batch:
+                user = _USER_SUMMARY_ADAPTER.validate_python(row, from_attributes=True)
+                yield _USER_SUMMARY_ADAPTER.dump_json(user) + b"\n"
+    
+    return StreamingResponse(
+        encode_rows(),
+        media_type="application/x-ndjson",
+        headers={"X-Total-Count": str(total)}
+    )
 
 # Helper functions
-def _create_profile_from_parsed_data(user_id: str, parsed_data: dict) -> UserProfile:
+def _unique_skills(skills: Optional[list]) -> list:
+    """Drop repeated skills in one pass, keeping first-seen order"""
+    return list(dict.fromkeys(skills or ()))
+
+def _profile_columns_from_parsed_data(user_id: str, parsed_data: dict) -> dict:
     """
-    Create new UserProfile from parsed resume data
+    Column values for a new UserProfile built from parsed resume data
     """
     personal = parsed_data.get("personal_info", {})
     professional = parsed_data.get("professional_summary", {})
@@ -325,8 +412,9 @@ def _create_profile_from_parsed_data(user_id: str, parsed_data: dict) -> UserPro
     education = parsed_data.get("education", {})
     preferences = parsed_data.get("preferences", {})
     ai_insights = parsed_data.get("ai_insights", {})
+    now = datetime.utcnow()
     
-    profile = UserProfile(
+    return dict(
         user_id=user_id,
         # Personal info
         full_name=personal.get("full_name", ""),
@@ -340,11 +428,11 @@ def _create_profile_from_parsed_data(user_id: str, parsed_data: dict) -> UserPro
         career_level=professional.get("career_level", "entry"),
         professional_summary=professional.get("summary", ""),
         
-        # Skills
-        programming_languages=skills.get("programming_languages", []),
-        frameworks_libraries=skills.get("frameworks_libraries", []),
-        tools_platforms=skills.get("tools_platforms", []),
-        soft_skills=skills.get("soft_skills", []),
+        # Skills (de-duplicated, like the merge applied to existing profiles)
+        programming_languages=_unique_skills(skills.get("programming_languages")),
+        frameworks_libraries=_unique_skills(skills.get("frameworks_libraries")),
+        tools_platforms=_unique_skills(skills.get("tools_platforms")),
+        soft_skills=_unique_skills(skills.get("soft_skills")),
         
         # Experience
         job_titles=experience.get("job_titles", []),
@@ -371,104 +459,121 @@ def _create_profile_from_parsed_data(user_id: str, parsed_data: dict) -> UserPro
         ai_improvement_areas=ai_insights.get("improvement_areas", []),
         ai_career_advice=ai_insights.get("career_advice", ""),
         
-        last_resume_upload=datetime.utcnow()
+        created_at=now,
+        updated_at=now,
+        last_resume_upload=now
     )
-    
-    return profile
 
-def _update_profile_from_parsed_data(profile: UserProfile, parsed_data: dict) -> None:
+# When re-parsing onto an existing profile, these keep their stored value
+# unless the new parse produced a non-empty one
+_KEEP_IF_BLANK_COLUMNS = (
+    "full_name", "email", "phone", "location", "work_authorization",
+    "professional_summary", "ai_profile_summary", "ai_career_advice"
+)
+_KEEP_IF_EMPTY_LIST_COLUMNS = ("ai_strengths", "ai_improvement_areas")
+# Skill lists (JSONB) are merged with what is stored, de-duplicated in the database
+_MERGED_SKILL_COLUMNS = ("programming_languages", "frameworks_libraries", "tools_platforms", "soft_skills")
+
+def _json_array_or_empty(ref: str) -> str:
+    return f"CASE WHEN json_typeof({ref}) = 'array' THEN {ref} ELSE '[]'::json END"
+
+def _jsonb_array_or_empty(ref: str) -> str:
+    return f"CASE WHEN jsonb_typeof({ref}) = 'array' THEN {ref} ELSE '[]'::jsonb END"
+
+def _profile_conflict_updates(excluded) -> dict:
     """
-    Update existing UserProfile with new parsed data
+    SET clause for re-parsing a resume onto an existing profile
     """
-    personal = parsed_data.get("personal_info", {})
-    professional = parsed_data.get("professional_summary", {})
-    skills = parsed_data.get("skills", {})
-    experience = parsed_data.get("experience", {})
-    education = parsed_data.get("education", {})
-    preferences = parsed_data.get("preferences", {})
-    ai_insights = parsed_data.get("ai_insights", {})
-    
-    # Update fields (keep existing if new data is empty)
-    if personal.get("full_name"):
-        profile.full_name = personal["full_name"]
-    if personal.get("email"):
-        profile.email = personal["email"]
-    if personal.get("phone"):
-        profile.phone = personal["phone"]
-    if personal.get("location"):
-        profile.location = personal["location"]
-    if personal.get("work_authorization"):
-        profile.work_authorization = personal["work_authorization"]
-    
-    # Professional info
-    if professional.get("years_of_experience"):
-        profile.years_of_experience = professional["years_of_experience"]
-    if professional.get("career_level"):
-        profile.career_level = professional["career_level"]
-    if professional.get("summary"):
-        profile.professional_summary = professional["summary"]
-    
-    # Skills (merge with existing)
-    if skills.get("programming_languages"):
-        profile.programming_languages = list(set(
-            (profile.programming_languages or []) + skills["programming_languages"]
-        ))
-    if skills.get("frameworks_libraries"):
-        profile.frameworks_libraries = list(set(
-            (profile.frameworks_libraries or []) + skills["frameworks_libraries"]
-        ))
-    if skills.get("tools_platforms"):
-        profile.tools_platforms = list(set(
-            (profile.tools_platforms or []) + skills["tools_platforms"]
-        ))
-    if skills.get("soft_skills"):
-        profile.soft_skills = list(set(
-            (profile.soft_skills or []) + skills["soft_skills"]
-        ))
+    updates = {
+        column: func.coalesce(func.nullif(excluded[column], ""), getattr(UserProfile, column))
+        for column in _KEEP_IF_BLANK_COLUMNS
+    }
+    updates["years_of_experience"] = func.coalesce(
+        func.nullif(excluded.years_of_experience, 0), UserProfile.years_of_experience
+    )
+    for column in _KEEP_IF_EMPTY_LIST_COLUMNS:
+        new = _json_array_or_empty(f"excluded.{column}")
+        updates[column] = text(
+            f"CASE WHEN json_array_length({new}) > 0 THEN excluded.{column} "
+            f"ELSE user_profiles.{column} END"
+        )
+    for column in _MERGED_SKILL_COLUMNS:
+        new = _jsonb_array_or_empty(f"excluded.{column}")
+        old = _jsonb_array_or_empty(f"user_profiles.{column}")
+        updates[column] = text(
+            f"CASE WHEN jsonb_array_length({new}) > 0 THEN ("
+            f"SELECT jsonb_agg(DISTINCT skill) FROM jsonb_array_elements({old} || {new}) AS merged(skill)"
+            f") ELSE user_profiles.{column} END"
+        )
+    return updates
+
+def _upsert_profile_from_parsed_data(
+    db: Session, user_id: str, parsed_data: dict, resume_uploaded: bool
+) -> UserProfile:
+    """
+    Insert a profile from parsed resume data, or fold it into the existing one
+
+    A single INSERT ... ON CONFLICT (user_id) DO UPDATE ... RETURNING replaces
+    the SELECT-then-INSERT-or-UPDATE round trips and their race.
+    """
+    stmt = pg_insert(UserProfile).values(**_profile_columns_from_parsed_data(user_id, parsed_data))
+    updates = _profile_conflict_updates(stmt.excluded)
+    # "entry" is only the level new profiles start with; a parse that found
+    # no career level leaves the stored one alone
+    if parsed_data.get("professional_summary", {}).get("career_level"):
+        updates["career_level"] = stmt.excluded.career_level
+    updates["updated_at"] = stmt.excluded.updated_at
+    if resume_uploaded:
+        updates["last_resume_upload"] = stmt.excluded.last_resume_upload
     
-    # Update AI insights
-    if ai_insights.get("profile_summary"):
-        profile.ai_profile_summary = ai_insights["profile_summary"]
-    if ai_insights.get("strengths"):
-        profile.ai_strengths = ai_insights["strengths"]
-    if ai_insights.get("improvement_areas"):
-        profile.ai_improvement_areas = ai_insights["improvement_areas"]
-    if ai_insights.get("career_advice"):
-        profile.ai_career_advice = ai_insights["career_advice"]
+    return db.execute(
+        stmt.on_conflict_do_update(index_elements=[UserProfile.user_id], set_=updates)
+        .returning(UserProfile)
+    ).scalar_one()
+
+def _save_parsed_profiles(db: Session, parsed: list) -> list:
+    """
+    Upsert (index, user_id, parsed_data) entries in one transaction
+
+    Each upsert runs in a savepoint so a failing row is rolled back alone;
+    the whole batch is committed once. Returns (index, result) pairs.
+    """
+    results = []
+    for index, user_id, parsed_data in parsed:
+        try:
+            with db.begin_nested():
+                profile = _upsert_profile_from_parsed_data(db, user_id, parsed_data, resume_uploaded=True)
+            results.append((index, {"user_id": user_id, "success": True, "profile_id": profile.id}))
+        except SQLAlchemyError as e:
+            logger.error(f"Error saving parsed resume for user {user_id}: {e}")
+            results.append((index, {"user_id": user_id, "success": False, "error": "Could not save profile"}))
+    db.commit()
+    return results
 
 @router.put("/preferences/{user_id}")
-async def update_user_preferences(user_id: str, preferences: dict, db: Session = Depends(get_db)):
+def update_user_preferences(user_id: str, preferences: dict, db: Session = Depends(get_db)):
     """
     Update user job preferences for better AI matching
     """
     try:
-        # Find existing profile
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        
-        if not profile:
-            raise HTTPException(status_code=404, detail="User profile not found")
-        
-        # Update preferences
-        if "desired_roles" in preferences:
-            profile.desired_roles = preferences["desired_roles"]
-        if "preferred_locations" in preferences:
-            profile.preferred_locations = preferences["preferred_locations"]
-        if "salary_range_min" in preferences:
-            profile.salary_range_min = preferences["salary_range_min"]
-        if "salary_range_max" in preferences:
-            profile.salary_range_max = preferences["salary_range_max"]
-        if "job_types" in preferences:
-            profile.job_types = preferences["job_types"]
-        if "company_size_preference" in preferences:
-            profile.company_size_preference = preferences["company_size_preference"]
-        if "work_authorization" in preferences:
-            profile.work_authorization = preferences["work_authorization"]
+        # Update preferences, limited to the editable columns
+        values = _pick_fields(preferences, _PREFERENCE_UPDATE_FIELDS)
         
         # Set updated timestamp
-        profile.updated_at = datetime.utcnow()
+        values["updated_at"] = datetime.utcnow()
+        
+        # One UPDATE ... RETURNING instead of SELECT, flush and refresh
+        updated_id = db.execute(
+            update(UserProfile)
+            .where(UserProfile.user_id == user_id)
+            .values(**values)
+            .returning(UserProfile.id)
+        ).scalar_one_or_none()
+        if updated_id is None:
+            raise HTTPException(status_code=404, detail="User profile not found")
         
         db.commit()
-        db.refresh(profile)
+        _invalidate_profile_cache(user_id)
         
         return {
             "message": "Preferences updated successfully",
@@ -488,19 +593,20 @@ async def update_user_preferences(user_id: str, preferences: dict, db: Session =
 # =====================================================
 
 @router.post("/trigger-scoring/{user_id}")
-async def trigger_user_scoring(user_id: str, db: Session = Depends(get_db)):
+def trigger_user_scoring(user_id: str, db: Session = Depends(get_db)):
     """
     Trigger background scoring for all jobs against user's resume
     Use after resume upload or major profile changes
     """
     try:
         # Check if user profile exists
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        if not profile:
+        if not _profile_exists(db, user_id):
             raise HTTPException(status_code=404, detail="User profile not found")
         
         # Trigger background scoring
         result = smart_job_scorer.trigger_full_scoring_for_new_user(user_id)
+        # Cached matches predate the rescoring
+        _invalidate_profile_cache(user_id)
         
         return result
         
@@ -511,7 +617,7 @@ async def trigger_user_scoring(user_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Error triggering job scoring")
 
 @router.get("/scoring-status/{user_id}")
-async def get_scoring_status(user_id: str, db: Session = Depends(get_db)):
+def get_scoring_status(user_id: str, db: Session = Depends(get_db)):
     """
     Get the status of job scoring for a user
     """
@@ -524,17 +630,17 @@ async def get_scoring_status(user_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Error fetching scoring status")
 
 @router.post("/clear-scores/{user_id}")
-async def clear_user_scores(user_id: str, db: Session = Depends(get_db)):
+def clear_user_scores(user_id: str, db: Session = Depends(get_db)):
     """
     Clear all job scores for a user (for fresh re-scoring)
     """
     try:
         # Check if user profile exists
-        profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
-        if not profile:
+        if not _profile_exists(db, user_id):
             raise HTTPException(status_code=404, detail="User profile not found")
         
         result = smart_job_scorer.clear_user_scores(user_id)
+        _invalidate_profile_cache(user_id)
         
         return result
         
@@ -545,15 +651,14 @@ async def clear_user_scores(user_id: str, db: Session = Depends(get_db)):
         raise HTTPException(status_code=500, detail="Error clearing job scores")
 
 @router.post("/score-new-job/{job_id}")
-async def trigger_job_scoring(job_id: int, db: Session = Depends(get_db)):
+def trigger_job_scoring(job_id: int, db: Session = Depends(get_db)):
     """
     Trigger scoring of a new job against all existing users
     Use when adding new jobs to the system
     """
     try:
         # Check if job exists
-        job = db.query(JobListing).filter(JobListing.id == job_id).first()
-        if not job:
+        if not _job_exists(db, job_id):
             raise HTTPException(status_code=404, detail="Job not found")
         
         result = smart_job_scorer.trigger_scoring_for_new_job(job_id)
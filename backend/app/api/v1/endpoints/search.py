@@ -1,9 +1,5 @@
-from typing import List, Optional
-from fastapi import APIRouter, Depends, HTTPException
-from sqlalchemy.orm import Session
-from app.db.session import get_db
+from fastapi import APIRouter, HTTPException
 # SearchQuery and SearchResult models have been removed - functionality replaced by RSS feeds
-from app.utils.logger import logger
 
 router = APIRouter()
 
@@ -1,20 +1,135 @@
 from openai import AsyncOpenAI
-import json
+import asyncio
+import hashlib
+import httpx
 import logging
+import re
+from string import Template
 from typing import Dict, List, Any, Optional, Tuple
+from pydantic_core import from_json, to_json
+from app.core import cache
 from app.core.config import settings
 
 logger = logging.getLogger(__name__)
 
+SCORE_CACHE_TTL = 7 * 86400  # seconds; a (candidate, job) score is reused for a week
+RESUME_PROMPT_MAX_CHARS = 8000  # resume text sent to the parser, after whitespace is collapsed
+
+# Fixed prompt bodies are parsed once at import; only the $fields change per call
+_RESUME_PROMPT = Template("""\
+Extract structured information from this resume and return ONLY a valid JSON object with the following structure:
+
+{
+    "personal_info": {
+        "full_name": "string",
+        "email": "string", 
+        "phone": "string",
+        "location": "string",
+        "work_authorization": "string"
+    },
+    "professional_summary": {
+        "years_of_experience": 0.0,
+        "career_level": "entry|mid|senior",
+        "summary": "string"
+    },
+    "skills": {
+        "programming_languages": ["Python", "JavaScript"],
+        "frameworks_libraries": ["React", "Django"],
+        "tools_platforms": ["AWS", "Docker"],
+        "soft_skills": ["Leadership", "Communication"]
+    },
+    "experience": {
+        "job_titles": ["Software Engineer", "Intern"],
+        "companies": ["Google", "Startup Inc"],
+        "industries": ["Technology", "Finance"],
+        "descriptions": ["Led team of 5", "Built scalable APIs"]
+    },
+    "education": {
+        "degrees": ["B.S. Computer Science"],
+        "institutions": ["Stanford University"],
+        "graduation_years": [2022],
+        "coursework": ["Data Structures", "Algorithms"]
+    },
+    "preferences": {
+        "desired_roles": ["Software Engineer", "Full Stack Developer"],
+        "preferred_locations": ["San Francisco", "Remote"],
+        "salary_range_min": 80000,
+        "salary_range_max": 120000,
+        "job_types": ["Full-time"]
+    }
+}
+
+Resume Text:
+$resume_text
+
+Return ONLY the JSON object, no additional text or explanation:
+""")
+
+_INSIGHTS_PROMPT = Template("""\
+Analyze this user profile and provide insights. Return ONLY a valid JSON object:
+
+{
+    "profile_summary": "A professional 2-3 sentence summary",
+    "strengths": ["Strong in Python", "Leadership experience"],
+    "improvement_areas": ["Could learn cloud technologies", "Needs more frontend experience"],
+    "career_advice": "Detailed career advice paragraph"
+}
+
+User Profile:
+$profile_json
+
+Return ONLY the JSON object:
+""")
+
+_DIGEST_PROMPT = Template("""\
+Create a personalized daily job digest. Return ONLY a valid JSON object:
+
+{
+    "digest_title": "Engaging title like '5 Perfect Matches for Software Engineer'",
+    "digest_summary": "2-3 sentence summary of today's opportunities",
+    "digest_html": "HTML formatted email content with job highlights",
+    "market_insights": ["Insight 1", "Insight 2"],
+    "skill_recommendations": ["Learn React", "Practice system design"]
+}
+
+User Profile: $professional_summary
+Preferred Roles: $desired_roles
+
+Top Jobs Today: $job_count matches
+$top_jobs
+
+Market Data: $market_data
+
+Create engaging, personalized content. Return ONLY the JSON object:
+""")
+
+# JSON mode: the API only returns syntactically valid JSON objects, so
+# responses are parsed without guarding against prose around the payload
+_JSON_OBJECT = {"type": "json_object"}
+
+_SCORE_FORMAT = '{"compatibility_score": 75.0, "confidence_score": 80.0, "reasoning": "Good skills match with Python and React", "match_factors": ["Technical Skills", "Experience"], "skills_match_score": 80.0, "experience_match_score": 70.0, "location_match_score": 90.0, "salary_match_score": 75.0, "culture_match_score": 65.0}'
+
 class AIService:
     """
     OpenAI GPT-4o-mini integration for job matching and resume parsing
     """
     
     def __init__(self):
-        self.client = AsyncOpenAI(api_key=settings.OPENAPI_KEY)
+        # One pooled HTTP client per process. Idle connections are kept for a
+        # minute (httpx defaults to 5s) so back-to-back scoring batches reuse
+        # open TLS sessions, and a stuck call fails after OPENAI_TIMEOUT
+        # instead of the SDK's 10 minute default
+        self._http = httpx.AsyncClient(
+            limits=httpx.Limits(max_connections=64, max_keepalive_connections=32, keepalive_expiry=60.0),
+            timeout=httpx.Timeout(settings.OPENAI_TIMEOUT, connect=5.0),
+        )
+        self.client = AsyncOpenAI(api_key=settings.OPENAPI_KEY, http_client=self._http)
         self.model = settings.OPENAI_MODEL
         self.max_tokens = settings.OPENAI_MAX_TOKENS
+    
+    async def close(self) -> None:
+        """Close pooled connections; called from the API lifespan on shutdown"""
+        await self._http.aclose()
         
     async def parse_resume(self, resume_text: str) -> Dict[str, Any]:
         """
@@ -26,54 +141,11 @@ class AIService:
         Returns:
             Structured profile data dictionary
         """
-        prompt = f"""
-        Extract structured information from this resume and return ONLY a valid JSON object with the following structure:
-
-        {{
-            "personal_info": {{
-                "full_name": "string",
-                "email": "string", 
-                "phone": "string",
-                "location": "string",
-                "work_authorization": "string"
-            }},
-            "professional_summary": {{
-                "years_of_experience": 0.0,
-                "career_level": "entry|mid|senior",
-                "summary": "string"
-            }},
-            "skills": {{
-                "programming_languages": ["Python", "JavaScript"],
-                "frameworks_libraries": ["React", "Django"],
-                "tools_platforms": ["AWS", "Docker"],
-                "soft_skills": ["Leadership", "Communication"]
-            }},
-            "experience": {{
-                "job_titles": ["Software Engineer", "Intern"],
-                "companies": ["Google", "Startup Inc"],
-                "industries": ["Technology", "Finance"],
-                "descriptions": ["Led team of 5", "Built scalable APIs"]
-            }},
-            "education": {{
-                "degrees": ["B.S. Computer Science"],
-                "institutions": ["Stanford University"],
-                "graduation_years": [2022],
-                "coursework": ["Data Structures", "Algorithms"]
-            }},
-            "preferences": {{
-                "desired_roles": ["Software Engineer", "Full Stack Developer"],
-                "preferred_locations": ["San Francisco", "Remote"],
-                "salary_range_min": 80000,
-                "salary_range_max": 120000,
-                "job_types": ["Full-time"]
-            }}
-        }}
-
-        Resume Text:
-        {resume_text}
-
-        Return ONLY the JSON object, no additional text or explanation:
-        """
+        # PDF/DOCX extraction leaves runs of spaces and blank lines; they cost
+        # tokens without adding anything the parser uses
+        resume_text = re.sub(r"[ \t]+", " ", resume_text)
+        resume_text = re.sub(r"\s*\n\s*", "\n", resume_text).strip()
+        prompt = _RESUME_PROMPT.substitute(resume_text=resume_text[:RESUME_PROMPT_MAX_CHARS])
         
         try:
             response = await self.client.chat.completions.create(
@@ -83,7 +155,8 @@ class AIService:
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=self.max_tokens,
-                temperature=0.1  # Low temperature for consistent extraction
+                temperature=0.1,  # Low temperature for consistent extraction
+                response_format=_JSON_OBJECT
             )
             
             content = response.choices[0].message.content.strip()
@@ -94,10 +167,10 @@ class AIService:
                 return self._get_fallback_profile()
             
             try:
-                parsed_data = json.loads(content)
+                parsed_data = from_json(content)
                 logger.info("Successfully parsed resume with AI")
                 return parsed_data
-            except json.JSONDecodeError as e:
+            except ValueError as e:
                 logger.error(f"AI returned invalid JSON: {e}")
                 # Return fallback structure
                 return self._get_fallback_profile()
@@ -110,21 +183,7 @@ class AIService:
         """
         Generate AI insights about user profile including strengths and career advice
         """
-        prompt = f"""
-        Analyze this user profile and provide insights. Return ONLY a valid JSON object:
-
-        {{
-            "profile_summary": "A professional 2-3 sentence summary",
-            "strengths": ["Strong in Python", "Leadership experience"],
-            "improvement_areas": ["Could learn cloud technologies", "Needs more frontend experience"],
-            "career_advice": "Detailed career advice paragraph"
-        }}
-
-        User Profile:
-        {json.dumps(profile_data, indent=2)}
-
-        Return ONLY the JSON object:
-        """
+        prompt = _INSIGHTS_PROMPT.substitute(profile_json=to_json(profile_data).decode())
         
         try:
             response = await self.client.chat.completions.create(
@@ -134,7 +193,8 @@ class AIService:
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=500,
-                temperature=0.3
+                temperature=0.3,
+                response_format=_JSON_OBJECT
             )
             
             content = response.choices[0].message.content.strip()
@@ -143,7 +203,7 @@ class AIService:
                 logger.warning("Empty response from OpenAI for profile insights, using fallback")
                 raise ValueError("Empty response")
                 
-            return json.loads(content)
+            return from_json(content)
             
         except Exception as e:
             logger.error(f"Error generating profile insights: {e}")
@@ -164,19 +224,23 @@ class AIService:
         """
         Score how well a job matches a user profile using AI
         
+        Results are cached in Redis per (candidate, job) so rescoring the
+        same pair does not call OpenAI again.
+        
         Returns:
             Dictionary with compatibility score and detailed breakdown
         """
-        # Extract key information for better scoring
-        user_skills = user_profile.get('skills', {}).get('programming_languages', [])
-        user_experience = user_profile.get('professional_summary', {}).get('years_of_experience', 0)
-        user_location = user_profile.get('personal_info', {}).get('location', '')
+        candidate = self._candidate_summary(user_profile)
+        cache_key = self._score_cache_key(candidate, job_title, job_description)
+        cached = (await asyncio.to_thread(cache.get_many_json, [cache_key]))[0]
+        if cached is not None:
+            return cached
         
         prompt = f"""Score this job match. Return ONLY valid JSON in this exact format:
 
-{{"compatibility_score": 75.0, "confidence_score": 80.0, "reasoning": "Good skills match with Python and React", "match_factors": ["Technical Skills", "Experience"], "skills_match_score": 80.0, "experience_match_score": 70.0, "location_match_score": 90.0, "salary_match_score": 75.0, "culture_match_score": 65.0}}
+{_SCORE_FORMAT}
 
-CANDIDATE: {user_experience} years experience with skills: {', '.join(user_skills[:3]) if user_skills else 'General skills'}. Located in: {user_location}
+CANDIDATE: {candidate}
 
 JOB: {job_title} - {job_description[:600]}
 
@@ -190,7 +254,8 @@ Score 0-100 based on skill match, experience fit, and requirements. Return only
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=400,
-                temperature=0.2
+                temperature=0.2,
+                response_format=_JSON_OBJECT
             )
             
             content = response.choices[0].message.content.strip()
@@ -199,29 +264,52 @@ Score 0-100 based on skill match, experience fit, and requirements. Return only
                 logger.warning("Empty response from OpenAI for job scoring, using fallback")
                 raise ValueError("Empty response")
                 
-            result = json.loads(content)
-            
-            # Ensure score is within bounds
-            result["compatibility_score"] = max(0.0, min(100.0, result.get("compatibility_score", 0.0)))
-            
+            result = self._clamp_score(from_json(content))
+            await asyncio.to_thread(cache.set_json, cache_key, result, SCORE_CACHE_TTL)
             return result
             
         except Exception as e:
             logger.error(f"Error scoring job compatibility: {e}")
-            return {
-                "compatibility_score": 50.0,
-                "confidence_score": 30.0,
-                "reasoning": "Unable to analyze compatibility",
-                "match_factors": [],
-                "mismatch_factors": ["analysis_failed"],
-                "breakdown": {
-                    "skills_match": 50.0,
-                    "experience_match": 50.0,
-                    "location_match": 50.0,
-                    "salary_match": 50.0,
-                    "culture_match": 50.0
-                }
+            return self._fallback_job_score()
+    
+    def _candidate_summary(self, user_profile: Dict[str, Any]) -> str:
+        """The profile fields job scoring prompts use, which also key the score cache"""
+        user_skills = user_profile.get('skills', {}).get('programming_languages', [])
+        user_experience = user_profile.get('professional_summary', {}).get('years_of_experience', 0)
+        user_location = user_profile.get('personal_info', {}).get('location', '')
+        # Up to five distinct skills, in profile order
+        top_skills = list(dict.fromkeys(user_skills or []))[:5]
+        skills = ', '.join(top_skills) if top_skills else 'General skills'
+        return f"{user_experience} years experience with skills: {skills}. Located in: {user_location}"
+    
+    def _score_cache_key(self, candidate: str, job_title: str, job_description: str) -> str:
+        digest = hashlib.blake2b(
+            f"{self.model}\0{candidate}\0{job_title}\0{job_description[:600]}".encode(),
+            digest_size=16
+        ).hexdigest()
+        return f"ai:job_score:{digest}"
+    
+    def _clamp_score(self, result: Dict[str, Any]) -> Dict[str, Any]:
+        # Ensure score is within bounds
+        result["compatibility_score"] = max(0.0, min(100.0, result.get("compatibility_score", 0.0)))
+        return result
+    
+    def _fallback_job_score(self) -> Dict[str, Any]:
+        """Neutral score used when the AI call fails; never cached"""
+        return {
+            "compatibility_score": 50.0,
+            "confidence_score": 30.0,
+            "reasoning": "Unable to analyze compatibility",
+            "match_factors": [],
+            "mismatch_factors": ["analysis_failed"],
+            "breakdown": {
+                "skills_match": 50.0,
+                "experience_match": 50.0,
+                "location_match": 50.0,
+                "salary_match": 50.0,
+                "culture_match": 50.0
             }
+        }
     
     async def generate_daily_digest(
         self,
@@ -232,27 +320,13 @@ Score 0-100 based on skill match, experience fit, and requirements. Return only
         """
         Generate personalized daily digest content
         """
-        prompt = f"""
-        Create a personalized daily job digest. Return ONLY a valid JSON object:
-
-        {{
-            "digest_title": "Engaging title like '5 Perfect Matches for Software Engineer'",
-            "digest_summary": "2-3 sentence summary of today's opportunities",
-            "digest_html": "HTML formatted email content with job highlights",
-            "market_insights": ["Insight 1", "Insight 2"],
-            "skill_recommendations": ["Learn React", "Practice system design"]
-        }}
-
-        User Profile: {user_profile.get('professional_summary', 'New graduate')}
-        Preferred Roles: {user_profile.get('preferences', {}).get('desired_roles', [])}
-        
-        Top Jobs Today: {len(top_jobs)} matches
-        {json.dumps(top_jobs[:3], indent=2) if top_jobs else "No jobs"}
-
-        Market Data: {market_data or 'No market data available'}
-
-        Create engaging, personalized content. Return ONLY the JSON object:
-        """
+        prompt = _DIGEST_PROMPT.substitute(
+            professional_summary=user_profile.get('professional_summary', 'New graduate'),
+            desired_roles=user_profile.get('preferences', {}).get('desired_roles', []),
+            job_count=len(top_jobs),
+            top_jobs=to_json(top_jobs[:3]).decode() if top_jobs else "No jobs",
+            market_data=market_data or 'No market data available'
+        )
         
         try:
             response = await self.client.chat.completions.create(
@@ -262,7 +336,8 @@ Score 0-100 based on skill match, experience fit, and requirements. Return only
                     {"role": "user", "content": prompt}
                 ],
                 max_tokens=600,
-                temperature=0.4
+                temperature=0.4,
+                response_format=_JSON_OBJECT
             )
             
             content = response.choices[0].message.content.strip()
@@ -271,7 +346,7 @@ Score 0-100 based on skill match, experience fit, and requirements. Return only
                 logger.warning("Empty response from OpenAI for daily digest, using fallback")
                 raise ValueError("Empty response")
                 
-            return json.loads(content)
+            return from_json(content)
             
         except Exception as e:
             logger.error(f"Error generating daily digest: {e}")
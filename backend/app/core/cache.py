@@ -0,0 +1,94 @@
+"""
+Redis-backed cache for hot API reads
+
+Values are stored as JSON. Redis being unavailable never fails a request:
+reads fall through to the compute function and writes are skipped.
+"""
+import json
+import logging
+from typing import Any, Callable, List, Optional
+
+import redis
+
+from app.core.config import settings
+
+logger = logging.getLogger(__name__)
+
+redis_client = redis.Redis(
+    host=settings.REDIS_HOST,
+    port=settings.REDIS_PORT,
+    db=settings.REDIS_CACHE_DB,
+    socket_timeout=0.5,
+    socket_connect_timeout=0.5,
+)
+
+
+def get_or_compute(key: str, compute: Callable[[], Any], ttl: int = 60) -> Any:
+    """Return the cached value for key, computing and storing it on a miss"""
+    try:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return json.loads(cached)
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return compute()
+
+    value = compute()
+    try:
+        redis_client.setex(key, ttl, json.dumps(value, default=str))
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+    return value
+
+
+def get_or_compute_bytes(key: str, compute: Callable[[], bytes], ttl: int = 60) -> bytes:
+    """Like get_or_compute, for values that are already serialized bytes"""
+    try:
+        cached = redis_client.get(key)
+        if cached is not None:
+            return cached
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {key}: {e}")
+        return compute()
+
+    value = compute()
+    try:
+        redis_client.setex(key, ttl, value)
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+    return value
+
+
+def get_many_json(keys: List[str]) -> List[Optional[Any]]:
+    """Cached values for keys in one round trip, None for misses"""
+    try:
+        return [json.loads(cached) if cached is not None else None for cached in redis_client.mget(keys)]
+    except redis.RedisError as e:
+        logger.warning(f"Cache read failed for {len(keys)} keys: {e}")
+        return [None] * len(keys)
+
+
+def set_json(key: str, value: Any, ttl: int = 60) -> None:
+    """Store value under key, skipping silently if Redis is unavailable"""
+    try:
+        redis_client.setex(key, ttl, json.dumps(value, default=str))
+    except redis.RedisError as e:
+        logger.warning(f"Cache write failed for {key}: {e}")
+
+
+def _escape_glob(prefix: str) -> str:
+    """Escape Redis glob metacharacters so prefix is matched literally"""
+    return "".join(f"\\{char}" if char in "*?[]\\" else char for char in prefix)
+
+
+def invalidate(*prefixes: str) -> None:
+    """Delete every cached key starting with one of the given prefixes"""
+    try:
+        for prefix in prefixes:
+            # Prefixes embed client-supplied ids; unescaped, a user id such as
+            # "*" would match, and delete, every other user's keys
+            keys = list(redis_client.scan_iter(match=f"{_escape_glob(prefix)}*", count=500))
+            if keys:
+                redis_client.delete(*keys)
+    except redis.RedisError as e:
+        logger.warning(f"Cache invalidation failed for {prefixes}: {e}")
@@ -1,11 +1,20 @@
 from celery import Celery
+from celery.schedules import crontab
+from kombu import Queue
 from app.core.config import settings
 
 celery_app = Celery(
     "linkedin_automation",
     broker=settings.CELERY_BROKER_URL,
     backend=settings.CELERY_RESULT_BACKEND,
-    include=["app.tasks.search_tasks", "app.tasks.scoring_tasks"]
+    include=[
+        "app.tasks.search_tasks",
+        "app.tasks.scoring_tasks",
+        "app.tasks.application_tasks",
+        "app.tasks.stats_tasks",
+        "app.tasks.cleanup_tasks",
+        "app.tasks.email_monitoring_tasks",
+    ]
 )
 
 # Celery configuration
@@ -18,20 +27,36 @@ celery_app.conf.update(
     task_track_started=True,
     task_always_eager=False,
     worker_prefetch_multiplier=1,
+    # Long feed refreshes and AI scoring get their own queues so they cannot
+    # starve the short application/stats tasks left on the default queue.
+    # A worker started without -Q consumes all three; scale one with e.g.
+    # `celery -A app.core.celery_app worker -Q scoring`
+    task_default_queue="celery",
+    task_queues=(Queue("celery"), Queue("search"), Queue("scoring")),
+    task_routes={
+        # AI scoring and digest tasks that live in search_tasks; listed ahead
+        # of its wildcard so they run on the scoring queue
+        "app.tasks.search_tasks.score_jobs_for_all_users": {"queue": "scoring"},
+        "app.tasks.search_tasks.score_jobs_for_user_task": {"queue": "scoring"},
+        "app.tasks.search_tasks.generate_daily_digests": {"queue": "scoring"},
+        "app.tasks.search_tasks.*": {"queue": "search"},
+        # scoring_tasks registers its tasks under bare names
+        "score_all_jobs_for_new_user": {"queue": "scoring"},
+        "score_new_job_for_all_users": {"queue": "scoring"},
+        "update_user_job_scores": {"queue": "scoring"},
+        "cleanup_old_job_scores": {"queue": "scoring"},
+    },
+    # Every periodic task is declared here, where the beat process reads it
+    # at startup; schedules added at runtime in another process never reach it
     beat_schedule={
         # Refresh all active search queries every 60 minutes
         'refresh-job-feeds': {
             'task': 'app.tasks.search_tasks.refresh_all_active_searches',
             'schedule': 3600.0,  # 60 minutes in seconds
         },
-        # Clean up old job results every 24 hours
-        'cleanup-old-results': {
-            'task': 'app.tasks.search_tasks.cleanup_old_results',
-            'schedule': 86400.0,  # 24 hours in seconds
-        },
         # Clean up old job scores every 24 hours
-        'cleanup-old-scores': {
-            'task': 'app.tasks.scoring_tasks.cleanup_old_job_scores',
+        'cleanup-old-job-scores-daily': {
+            'task': 'cleanup_old_job_scores',  # registered name in scoring_tasks
             'schedule': 86400.0,  # 24 hours in seconds
         },
         # AI job scoring for all users (runs 30 minutes after job fetching)
@@ -44,14 +69,36 @@ celery_app.conf.update(
             'task': 'app.tasks.search_tasks.generate_daily_digests',
             'schedule': 86400.0,  # Once per day
         },
-        # Clean up old job scores weekly
-        'cleanup-old-scores': {
-            'task': 'app.tasks.search_tasks.cleanup_old_job_scores',
-            'schedule': 604800.0,  # 7 days in seconds
+        # Fold application outbox entries missed by the API process
+        'drain-application-outbox': {
+            'task': 'app.tasks.application_tasks.process_pending_applications_task',
+            'schedule': 300.0,  # 5 minutes
+        },
+        # Rebuild the daily rollup behind the /stats graph
+        'refresh-jobs-daily-stats': {
+            'task': 'app.tasks.stats_tasks.refresh_daily_stats_task',
+            'schedule': 300.0,  # 5 minutes
+        },
+        # Delete job listings older than 20 days
+        'daily-job-cleanup': {
+            'task': 'app.tasks.cleanup_tasks.cleanup_old_jobs_task',
+            'schedule': crontab(hour=2, minute=0),  # 2:00 AM daily
+            'args': (20,),
+        },
+        'weekly-cleanup-stats': {
+            'task': 'app.tasks.cleanup_tasks.get_cleanup_stats_task',
+            'schedule': crontab(hour=3, minute=0, day_of_week=0),  # Sunday 3:00 AM
+            'args': (20,),
+        },
+        # Gmail monitoring for the email agent
+        'monitor-emails-every-5-minutes': {
+            'task': 'app.tasks.email_monitoring_tasks.monitor_and_process_emails',
+            'schedule': 300.0,  # 5 minutes
+        },
+        'check-gmail-connections-every-hour': {
+            'task': 'app.tasks.email_monitoring_tasks.check_gmail_connections',
+            'schedule': 3600.0,  # 1 hour
         },
     },
     beat_schedule_filename='celerybeat-schedule',
 )
-
-# Import tasks
-from app.tasks import search_tasks  # noqa 
\ No newline at end of file
@@ -1,6 +1,7 @@
+from functools import lru_cache
 from typing import List
 from pydantic_settings import BaseSettings
-from pydantic import AnyHttpUrl, validator
+from pydantic import AnyHttpUrl, Field, ValidationInfo, field_validator
 
 class Settings(BaseSettings):
     PROJECT_NAME: str = "LinkedIn Job Scraper"
@@ -9,7 +10,8 @@ class Settings(BaseSettings):
     # CORS Configuration
     CORS_ORIGINS: List[AnyHttpUrl] = ["http://localhost:3000"]  # Frontend URL
     
-    @validator("CORS_ORIGINS", pre=True)
+    @field_validator("CORS_ORIGINS", mode="before")
+    @classmethod
     def assemble_cors_origins(cls, v: str | List[str]) -> List[str] | str:
         if isinstance(v, str) and not v.startswith("["):
             return [i.strip() for i in v.split(",")]
@@ -22,17 +24,36 @@ class Settings(BaseSettings):
     POSTGRES_USER: str = "postgres"
     POSTGRES_PASSWORD: str = "postgres"
     POSTGRES_DB: str = "linkedin_jobs"
-    SQLALCHEMY_DATABASE_URI: str | None = None
+    SQLALCHEMY_DATABASE_URI: str | None = Field(default=None, validate_default=True)
     
-    @validator("SQLALCHEMY_DATABASE_URI", pre=True)
-    def assemble_db_connection(cls, v: str | None, values: dict[str, any]) -> str:
+    @field_validator("SQLALCHEMY_DATABASE_URI", mode="before")
+    @classmethod
+    def assemble_db_connection(cls, v: str | None, info: ValidationInfo) -> str:
         if isinstance(v, str):
             return v
+        values = info.data
         return f"postgresql://{values.get('POSTGRES_USER')}:{values.get('POSTGRES_PASSWORD')}@{values.get('POSTGRES_SERVER')}/{values.get('POSTGRES_DB')}"
     
+    # DSN for background jobs that work across every user (the Gmail sync).
+    # Point it at a BYPASSRLS role (sync_worker, created by
+    # app/migrations/cleanup_unused_tables.py); unset, they share the main engine
+    SYNC_DATABASE_URI: str | None = None
+    
+    # Connection pool (per engine, per process). app.db.session and
+    # app.db.rls_session each hold one, so a process can open up to
+    # 2 * (DB_POOL_SIZE + DB_MAX_OVERFLOW), plus one more pool in Celery
+    # workers when SYNC_DATABASE_URI is set; keep that times the process count
+    # below Postgres max_connections
+    DB_POOL_SIZE: int = 20
+    DB_MAX_OVERFLOW: int = 30
+    DB_POOL_TIMEOUT: int = 10  # seconds to wait for a free connection before failing
+    DB_POOL_RECYCLE: int = 1800  # seconds; stay under server/proxy idle timeouts
+    DB_APPLICATION_NAME: str = "jobs_api"
+    
     # Redis Configuration
     REDIS_HOST: str = "localhost"
     REDIS_PORT: int = 6379
+    REDIS_CACHE_DB: int = 1  # Kept apart from the Celery broker database
     
     # Celery Configuration
     CELERY_BROKER_URL: str = f"redis://{REDIS_HOST}:{REDIS_PORT}/0"
@@ -55,6 +76,8 @@ class Settings(BaseSettings):
     OPENAPI_KEY: str = ""  # OpenAI API key
     OPENAI_MODEL: str = "gpt-4o-mini"  # Cost-efficient model
     OPENAI_MAX_TOKENS: int = 1000  # Token limit for responses
+    OPENAI_TIMEOUT: float = 60.0  # seconds per request
+    RESUME_PARSER_WORKERS: int = 2  # Processes for PDF/DOCX text extraction, per API worker
     
     # Legacy LinkedIn fields (now optional)
     LINKEDIN_EMAIL: str = ""
@@ -86,4 +109,9 @@ class Settings(BaseSettings):
         env_file = ".env"
         extra = "ignore"  # Allow extra fields during migration
 
-settings = Settings() 
\ No newline at end of file
+@lru_cache(maxsize=1)
+def get_settings() -> Settings:
+    """The process-wide Settings, built once; usable as a FastAPI dependency"""
+    return Settings()
+
+settings = get_settings()
@@ -1,28 +1,36 @@
+import atexit
 import logging
+import queue
 import sys
 from pathlib import Path
-from logging.handlers import RotatingFileHandler
+from logging.handlers import QueueHandler, QueueListener, RotatingFileHandler
+
+_listener: QueueListener | None = None
+
+def _stop_listener():
+    """Flush queued records and stop the listener thread"""
+    global _listener
+    if _listener is not None:
+        _listener.stop()
+        _listener = None
 
 def setup_logging():
     """Configure logging for the application"""
+    global _listener
+
     # Create logs directory if it doesn't exist
     log_dir = Path("logs")
     log_dir.mkdir(exist_ok=True)
-    
+
     # Configure logging format
     log_format = logging.Formatter(
         "%(asctime)s - %(name)s - %(levelname)s - %(message)s"
     )
-    
-    # Configure root logger
-    root_logger = logging.getLogger()
-    root_logger.setLevel(logging.INFO)
-    
+
     # Console handler
     console_handler = logging.StreamHandler(sys.stdout)
     console_handler.setFormatter(log_format)
-    root_logger.addHandler(console_handler)
-    
+
     # File handler
     file_handler = RotatingFileHandler(
         log_dir / "app.log",
@@ -30,12 +38,29 @@ def setup_logging():
         backupCount=5
     )
     file_handler.setFormatter(log_format)
-    root_logger.addHandler(file_handler)
-    
+
+    # Configure root logger. Request code only enqueues records; a listener
+    # thread does the console/file writes and rotation off the event loop.
+    # Handlers added earlier (e.g. basicConfig in app.utils.logger) are
+    # replaced so records are not written twice
+    if _listener is None:
+        atexit.register(_stop_listener)
+    _stop_listener()
+    log_queue = queue.SimpleQueue()
+    root_logger = logging.getLogger()
+    root_logger.setLevel(logging.INFO)
+    for handler in root_logger.handlers[:]:
+        root_logger.removeHandler(handler)
+        handler.close()
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, console_handler, file_handler, respect_handler_level=True)
+    _listener.start()
+
     # Set specific log levels for different modules
     logging.getLogger("uvicorn").setLevel(logging.INFO)
     logging.getLogger("fastapi").setLevel(logging.INFO)
     logging.getLogger("sqlalchemy").setLevel(logging.WARNING)
     logging.getLogger("playwright").setLevel(logging.INFO)
-    
-    return root_logger 
\ No newline at end of file
+
+    return root_logger
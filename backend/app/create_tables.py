@@ -1,8 +1,43 @@
+"""
+One-off bootstrap for an empty database
+
+The API no longer creates tables at startup; schema changes are applied
+with `alembic upgrade head` as a deploy step. The migration chain assumes
+tables that predate it, so it cannot build a database from nothing. A
+brand-new database is instead created from the models and then marked as
+up to date:
+
+    python -m app.create_tables && alembic stamp head
+"""
+from pathlib import Path
+
+from alembic.config import Config
+from alembic.migration import MigrationContext
+from alembic.operations import Operations
+from alembic.script import ScriptDirectory
+
 from app.db.session import engine
-from app.models.job import Base  # or from wherever your Base is defined
-from app.models.email_models import UserGmailConnection, EmailEvent, EmailSyncLog  # Import email models
+from app.db.base_class import Base
+# Import every model module so all tables are registered on Base.metadata
+from app.models import job, user, email_models  # noqa: F401
+
+# Migrations for objects the models do not declare (trigram indexes, the
+# jobs_daily_stats view, the stats_overall counters); replayed after
+# create_all so a stamped database matches head
+MIGRATION_ONLY_REVISIONS = ("a41d6e2b9c07", "c6e0b3d8f214", "e777b3159342")
+
+def create_tables() -> None:
+    """Create every table, then the objects only the migrations build"""
+    Base.metadata.create_all(bind=engine)
+    config = Config()
+    config.set_main_option("script_location", str(Path(__file__).resolve().parents[1] / "migrations"))
+    scripts = ScriptDirectory.from_config(config)
+    with engine.begin() as conn:
+        with Operations.context(MigrationContext.configure(conn)):
+            for revision in MIGRATION_ONLY_REVISIONS:
+                scripts.get_revision(revision).module.upgrade()
 
 if __name__ == "__main__":
     print("Creating all tables...")
-    Base.metadata.create_all(bind=engine)
-    print("Done.")
\ No newline at end of file
+    create_tables()
+    print("Done. Run `alembic stamp head` to mark the database as migrated.")
@@ -1,4 +1,4 @@
-from sqlalchemy import create_engine, text
+from sqlalchemy import create_engine, event, text
 from sqlalchemy.orm import sessionmaker, Session
 from app.core.config import settings
 from contextvars import ContextVar
@@ -8,19 +8,42 @@ from typing import Optional
 current_user_id: ContextVar[Optional[str]] = ContextVar('current_user_id', default='demo_user')
 
 # Create engine and session factory
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
-SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Reuse the most recently returned connection, so overflow connections
+    # left idle after a burst age out instead of being cycled through
+    pool_use_lifo=True,
+    # Short OLTP queries never benefit from JIT compilation
+    connect_args={"application_name": settings.DB_APPLICATION_NAME, "options": "-c jit=off"},
+    query_cache_size=1200,  # Room for every endpoint's compiled statements
+)
+# Keep loaded attributes after commit so rows returned by UPDATE ... RETURNING
+# can be serialized without a second SELECT
+SessionLocal = sessionmaker(autocommit=False, autoflush=False, expire_on_commit=False, bind=engine)
+
+# Transaction-local (is_local = true), so the user never outlives the
+# transaction or leaks to the next checkout of a pooled connection. This is
+# SET LOCAL app.current_user_id in a form that takes a bind parameter; it
+# runs once per transaction, and the policies read it once per statement
+_SET_CURRENT_USER = text("SELECT set_config('app.current_user_id', :uid, true)")
+
+@event.listens_for(SessionLocal, "after_begin")
+def _apply_current_user(session, transaction, connection):
+    """Scope each request transaction to the current user for RLS policies"""
+    # Read when the transaction begins, so set_current_user() calls made in
+    # the handler apply; a handler that commits and reads on gets it again
+    if session.info.get("rls_scoped"):
+        connection.execute(_SET_CURRENT_USER, {"uid": current_user_id.get()})
 
 def get_db():
     """Dependency for getting DB session with RLS context"""
-    db = SessionLocal()
-    
+    db = SessionLocal(info={"rls_scoped": True})
     try:
-        # Set the current user ID for RLS policies
-        user_id = current_user_id.get()
-        db.execute(text(f"SET app.current_user_id = '{user_id}'"))
-        db.commit()  # Commit the setting change
-        
         yield db
     finally:
         db.close()
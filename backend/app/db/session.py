@@ -2,9 +2,36 @@ from sqlalchemy import create_engine
 from sqlalchemy.orm import sessionmaker
 from app.core.config import settings
 
-engine = create_engine(settings.SQLALCHEMY_DATABASE_URI, pool_pre_ping=True)
+engine = create_engine(
+    settings.SQLALCHEMY_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    # Reuse the most recently returned connection, so overflow connections
+    # left idle after a burst age out instead of being cycled through
+    pool_use_lifo=True,
+    # Short OLTP queries never benefit from JIT compilation
+    connect_args={"application_name": settings.DB_APPLICATION_NAME, "options": "-c jit=off"},
+)
 SessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=engine)
 
+# Cross-user background jobs connect as the BYPASSRLS sync role so Postgres
+# skips the policy check on every row they read and write; nothing connects
+# until a task opens a session, so API processes never hold this pool
+sync_engine = create_engine(
+    settings.SYNC_DATABASE_URI,
+    pool_pre_ping=True,
+    pool_size=settings.DB_POOL_SIZE,
+    max_overflow=settings.DB_MAX_OVERFLOW,
+    pool_timeout=settings.DB_POOL_TIMEOUT,
+    pool_recycle=settings.DB_POOL_RECYCLE,
+    pool_use_lifo=True,
+    connect_args={"application_name": f"{settings.DB_APPLICATION_NAME}_sync", "options": "-c jit=off"},
+) if settings.SYNC_DATABASE_URI else engine
+SyncSessionLocal = sessionmaker(autocommit=False, autoflush=False, bind=sync_engine)
+
 def get_db():
     """Dependency for getting DB session"""
     db = SessionLocal()
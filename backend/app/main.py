@@ -1,5 +1,6 @@
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
+from fastapi.middleware.gzip import GZipMiddleware
 from fastapi.responses import JSONResponse
 from contextlib import asynccontextmanager
 import logging
@@ -7,10 +8,9 @@ import logging
 from app.core.config import settings
 from app.api.v1.api import api_router
 from app.core.logging import setup_logging
-from app.models.job import Base
-from app.models.user import User
-from app.models.email_models import UserGmailConnection, EmailEvent, EmailSyncLog  # Import email models
-from app.db.session import engine
+from app.services.resume_parser import resume_parser
+from app.core.ai_service import ai_service
+from app.utils.json_response import PydanticJSONResponse
 
 # Setup logging
 setup_logging()
@@ -20,17 +20,19 @@ logger = logging.getLogger(__name__)
 async def lifespan(app: FastAPI):
     # Startup
     logger.info("Starting up application...")
+    resume_parser.start_text_pool(settings.RESUME_PARSER_WORKERS)
     yield
     # Shutdown
     logger.info("Shutting down application...")
-
-Base.metadata.create_all(bind=engine)
+    resume_parser.shutdown_text_pool()
+    await ai_service.close()
 
 app = FastAPI(
     title=settings.PROJECT_NAME,
     description="LinkedIn Job Scraper & Automation API",
     version="1.0.0",
     lifespan=lifespan,
+    default_response_class=PydanticJSONResponse,
 )
 
 # Set up CORS middleware
@@ -40,8 +42,14 @@ app.add_middleware(
     allow_credentials=True,
     allow_methods=["*"],
     allow_headers=["*"],
+    # Pagination/caching headers the frontend reads from list responses
+    expose_headers=["X-Total-Count", "X-Next-Cursor", "ETag"],
 )
 
+# Compress JSON payloads (job lists, applications, stats, profiles); bodies
+# under 512 bytes go out as-is. Also adds Vary: Accept-Encoding.
+app.add_middleware(GZipMiddleware, minimum_size=512)
+
 # Include API router
 app.include_router(api_router, prefix="/api/v1")
 
@@ -1,5 +1,7 @@
+import hashlib
 from datetime import datetime
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Float, Index
+from sqlalchemy import BigInteger, Column, Integer, String, DateTime, Text, Boolean, ForeignKey, Float, Index, func, text
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
@@ -7,12 +9,12 @@ class UserGmailConnection(Base):
     """Track Gmail connections for users using Google OAuth"""
     __tablename__ = "user_gmail_connections"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(100), nullable=False, index=True)  # Using string to match existing user_id pattern
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)  # Using string to match existing user_id pattern
     
     # Google OAuth identifiers
-    google_user_id = Column(String(255), unique=True, nullable=True, index=True)
-    gmail_email = Column(String(255), nullable=True)
+    google_user_id = Column(Text, unique=True, nullable=True, index=True)
+    gmail_email = Column(Text, nullable=True)
     
     # OAuth tokens (encrypted in production)
     access_token = Column(Text, nullable=True)
@@ -31,8 +33,8 @@ class UserGmailConnection(Base):
     auto_update_enabled = Column(Boolean, default=True)
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.timezone('UTC', func.now()))
+    updated_at = Column(DateTime, server_default=func.timezone('UTC', func.now()), onupdate=func.timezone('UTC', func.now()))
     
     # Relationships
     email_events = relationship("EmailEvent", back_populates="gmail_connection")
@@ -53,29 +55,43 @@ class UserGmailConnection(Base):
             return True
         return datetime.utcnow() > self.token_expiry
 
+def message_id_fingerprint(message_id: str) -> int:
+    """Signed 64-bit fingerprint of a Gmail message id: the first 8 bytes of
+    its MD5, the same value Postgres computes as
+    ('x' || substr(md5(email_message_id), 1, 16))::bit(64)::bigint"""
+    return int.from_bytes(hashlib.md5(message_id.encode()).digest()[:8], "big", signed=True)
+
+def _message_id_hash_default(context) -> int:
+    """Column default: fingerprint the email_message_id being inserted"""
+    return message_id_fingerprint(context.get_current_parameters()["email_message_id"])
+
 class EmailEvent(Base):
     """Track individual email events and classifications"""
     __tablename__ = "email_events"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     
     # Basic relationships
-    user_id = Column(String(100), nullable=False, index=True)
+    user_id = Column(String(100), nullable=False)
     gmail_connection_id = Column(Integer, ForeignKey("user_gmail_connections.id"), nullable=False)
     
     # Email identifiers
-    email_message_id = Column(String(255), unique=True, nullable=False, index=True)
+    email_message_id = Column(Text, nullable=False)
+    # Unique 8-byte key for dedup lookups instead of a btree on the string;
+    # derived from email_message_id on insert, see message_id_fingerprint
+    email_message_id_hash = Column(BigInteger, unique=True, nullable=False, index=True,
+                                   default=_message_id_hash_default)
     
     # Email content
-    sender_email = Column(String(255), nullable=False)
-    sender_name = Column(String(255), nullable=True)
+    sender_email = Column(Text, nullable=False)
+    sender_name = Column(Text, nullable=True)
     subject = Column(Text, nullable=False)
     email_received_at = Column(DateTime, nullable=False, index=True)
     
     # Classification
-    email_type = Column(String(20), nullable=False, default='unknown', index=True)  # rejection, interview, offer, update, confirmation, unknown
+    email_type = Column(Text, nullable=False, default='unknown', index=True)  # rejection, interview, offer, update, confirmation, unknown
     confidence_score = Column(Float, default=0.0)
-    company_name = Column(String(255), nullable=True, index=True)
+    company_name = Column(Text, nullable=True)
     
     # Job matching
     matched_job_listing_id = Column(Integer, ForeignKey("job_listings.id"), nullable=True)
@@ -84,11 +100,12 @@ class EmailEvent(Base):
     status_updated = Column(Boolean, default=False)
     user_reviewed = Column(Boolean, default=False)
     
-    # AI data (JSON field)
-    ai_data = Column(JSON, default=dict)
+    # AI data (JSONB, stored out of line once large)
+    ai_data = Column(JSONB, nullable=False, server_default=text("'{}'::jsonb"))
     
     # Timestamps
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    # NOT NULL: half of the event list's (created_at, id) keyset
+    created_at = Column(DateTime, nullable=False, server_default=func.timezone('UTC', func.now()), index=True)
     processed_at = Column(DateTime, nullable=True)
     
     # Relationships
@@ -111,20 +128,24 @@ class EmailSyncLog(Base):
     """Track email sync operations"""
     __tablename__ = "email_sync_logs"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(100), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)
     emails_found = Column(Integer, default=0)
     emails_processed = Column(Integer, default=0)
-    status = Column(String(20), default='completed')  # started, completed, failed
+    status = Column(Text, default='completed')  # started, completed, failed
     error_message = Column(Text, nullable=True)
-    created_at = Column(DateTime, default=datetime.utcnow, index=True)
+    created_at = Column(DateTime, server_default=func.timezone('UTC', func.now()), index=True)
     
     def __repr__(self):
         return f"<EmailSyncLog {self.user_id} - {self.status} ({self.created_at})>"
 
-# Create indexes for better performance
-Index('idx_email_events_user_type', EmailEvent.user_id, EmailEvent.email_type)
+# Create indexes for better performance. Each user_id column is indexed only
+# through the composites it leads, and the primary keys need no extra index
+Index('idx_email_events_user_type', EmailEvent.user_id, EmailEvent.email_type, EmailEvent.created_at.desc(), EmailEvent.id.desc())  # type-filtered event list
+Index('idx_email_events_user_created', EmailEvent.user_id, EmailEvent.created_at.desc(), EmailEvent.id.desc())  # event list keyset pages
 Index('idx_email_events_confidence', EmailEvent.confidence_score)
+Index('idx_email_events_matched_job', EmailEvent.matched_job_listing_id, postgresql_where=EmailEvent.matched_job_listing_id.isnot(None))  # FK checks on job cleanup
 Index('idx_email_events_company', EmailEvent.company_name)
+Index('idx_email_events_gmail_conn', EmailEvent.gmail_connection_id)  # connection.email_events loads, FK checks on disconnect
 Index('idx_gmail_connections_user', UserGmailConnection.user_id)
 Index('idx_sync_logs_user_status', EmailSyncLog.user_id, EmailSyncLog.status) 
\ No newline at end of file
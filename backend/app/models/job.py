@@ -1,15 +1,15 @@
-from datetime import datetime, date
-from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Float, Index, Date
+from sqlalchemy import Column, Integer, String, DateTime, Text, Boolean, ForeignKey, JSON, Float, Index, Date, func
+from sqlalchemy.dialects.postgresql import JSONB
 from sqlalchemy.orm import relationship
 from app.db.base_class import Base
 
 class JobListing(Base):
     __tablename__ = "job_listings"
     
-    id = Column(Integer, primary_key=True, index=True)
-    title = Column(String(255), nullable=False)
-    company = Column(String(255), nullable=False)
-    location = Column(String(255))
+    id = Column(Integer, primary_key=True)
+    title = Column(Text, nullable=False)
+    company = Column(Text, nullable=False)
+    location = Column(Text)
     description = Column(Text)
     requirements = Column(Text)
     job_type = Column(String(50))  # Full-time, Part-time, Contract, etc.
@@ -21,7 +21,7 @@ class JobListing(Base):
     source_url = Column(Text)
     is_active = Column(Boolean, default=True)
     posted_date = Column(DateTime)
-    extracted_date = Column(DateTime, default=datetime.utcnow)
+    extracted_date = Column(DateTime, server_default=func.timezone('UTC', func.now()))
     applied = Column(Boolean, default=False)  # Track application status
     applied_date = Column(DateTime)  # When application was submitted
     
@@ -36,13 +36,13 @@ class RSSFeedConfiguration(Base):
     """
     __tablename__ = "rss_feed_configurations"
     
-    id = Column(Integer, primary_key=True, index=True)
-    name = Column(String(255), nullable=False)  # e.g., "Texas Software Engineers", "California Developers"
+    id = Column(Integer, primary_key=True)
+    name = Column(Text, nullable=False)  # e.g., "Texas Software Engineers", "California Developers"
     feed_url = Column(Text, nullable=False)  # RSS.app feed URL
     source_type = Column(String(50), default="rss_app")  # rss_app, indeed_rss, etc.
     
     # Feed filtering/preferences
-    location_filter = Column(String(255))  # Optional location filtering
+    location_filter = Column(Text)  # Optional location filtering
     keyword_filter = Column(String(512))  # Optional keyword filtering  
     job_type_filter = Column(String(50))  # Optional job type filtering
     experience_filter = Column(String(50))  # Optional experience filtering
@@ -54,7 +54,7 @@ class RSSFeedConfiguration(Base):
     last_job_count = Column(Integer, default=0)  # Track job count for monitoring
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.timezone('UTC', func.now()))
     created_by = Column(String(100))  # Optional user tracking
     description = Column(Text)  # Human-readable description
     tags = Column(JSON)  # Tags for categorization: ["state:texas", "level:senior", "type:remote"]
@@ -77,14 +77,14 @@ class UserProfile(Base):
     """
     __tablename__ = "user_profiles"
     
-    id = Column(Integer, primary_key=True, index=True)
+    id = Column(Integer, primary_key=True)
     user_id = Column(String(100), nullable=False, unique=True, index=True)
     
     # Personal Information
-    full_name = Column(String(255))
-    email = Column(String(255))
+    full_name = Column(Text)
+    email = Column(Text)
     phone = Column(String(50))
-    location = Column(String(255))  # Current location
+    location = Column(Text)  # Current location
     work_authorization = Column(String(100))  # "US Citizen", "H1B", "F1 OPT", etc.
     
     # Professional Summary
@@ -92,11 +92,11 @@ class UserProfile(Base):
     career_level = Column(String(50))  # "entry", "mid", "senior"
     professional_summary = Column(Text)  # AI-generated summary
     
-    # Skills & Technologies (JSON arrays)
-    programming_languages = Column(JSON)  # ["Python", "JavaScript", "Java"]
-    frameworks_libraries = Column(JSON)  # ["React", "Django", "Spring Boot"]
-    tools_platforms = Column(JSON)      # ["AWS", "Docker", "Git"]
-    soft_skills = Column(JSON)          # ["Leadership", "Communication"]
+    # Skills & Technologies (JSONB arrays)
+    programming_languages = Column(JSONB)  # ["Python", "JavaScript", "Java"]
+    frameworks_libraries = Column(JSONB)  # ["React", "Django", "Spring Boot"]
+    tools_platforms = Column(JSONB)      # ["AWS", "Docker", "Git"]
+    soft_skills = Column(JSONB)          # ["Leadership", "Communication"]
     
     # Experience
     job_titles = Column(JSON)            # Previous job titles
@@ -111,12 +111,12 @@ class UserProfile(Base):
     relevant_coursework = Column(JSON)   # ["Machine Learning", "Algorithms"]
     
     # Job Preferences (integrated from UserJobPreferences)
-    desired_roles = Column(JSON)         # ["Software Engineer", "Data Scientist"]
-    preferred_locations = Column(JSON)   # ["San Francisco", "Remote"]
+    desired_roles = Column(JSONB)         # ["Software Engineer", "Data Scientist"]
+    preferred_locations = Column(JSONB)   # ["San Francisco", "Remote"]
     salary_range_min = Column(Integer)
     salary_range_max = Column(Integer)
-    job_types = Column(JSON)             # ["Full-time", "Contract"]
-    company_size_preference = Column(JSON)  # ["Startup", "Mid-size", "Enterprise"]
+    job_types = Column(JSONB)             # ["Full-time", "Contract"]
+    company_size_preference = Column(JSONB)  # ["Startup", "Mid-size", "Enterprise"]
     
     # AI-Generated Insights
     ai_profile_summary = Column(Text)    # GPT-generated profile summary
@@ -125,8 +125,8 @@ class UserProfile(Base):
     ai_career_advice = Column(Text)      # AI-generated career advice
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.timezone('UTC', func.now()))
+    updated_at = Column(DateTime, server_default=func.timezone('UTC', func.now()), onupdate=func.timezone('UTC', func.now()))
     last_resume_upload = Column(DateTime)
     
     # Relationships - removed unused relationships
@@ -144,17 +144,17 @@ class JobApplication(Base):
     """Track user job applications and their status"""
     __tablename__ = "job_applications"
     
-    id = Column(Integer, primary_key=True, index=True)
-    user_id = Column(String(100), nullable=False, index=True)
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)  # indexed by the composites below
     job_id = Column(Integer, ForeignKey("job_listings.id"), nullable=False, index=True)
     
     # Application Status Tracking
     application_status = Column(String(50), default="interested", index=True)  # interested, applied, interviewed, rejected, hired
     application_source = Column(String(100))  # direct, indeed, linkedin, referral
-    application_date = Column(DateTime, default=datetime.utcnow)
+    application_date = Column(DateTime, server_default=func.timezone('UTC', func.now()))
     
     # External Application Tracking
-    external_application_id = Column(String(255))  # ID from external job board
+    external_application_id = Column(Text)  # ID from external job board
     application_url = Column(String(1000))  # Direct application link
     source_url = Column(String(1000))  # Original URL if extracted from web
     
@@ -172,18 +172,60 @@ class JobApplication(Base):
     rejection_reason = Column(String(500))
     
     # Metadata
-    created_at = Column(DateTime, default=datetime.utcnow)
-    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+    created_at = Column(DateTime, server_default=func.timezone('UTC', func.now()))
+    updated_at = Column(DateTime, server_default=func.timezone('UTC', func.now()), onupdate=func.timezone('UTC', func.now()))
     
     # Relationships
-    job_listing = relationship("JobListing")
+    # Callers must eager-load this (joinedload) so lists never issue a SELECT per row
+    job_listing = relationship("JobListing", lazy="raise")
     
     def __repr__(self):
         return f"<JobApplication {self.user_id}:{self.job_id}:{self.application_status}>"
 
+class ApplicationOutbox(Base):
+    """
+    Durable queue of "user applied" clicks
+
+    apply_to_job inserts here and returns immediately; the row is folded into
+    JobApplication in the background and stamped with processed_at.
+    """
+    __tablename__ = "application_outbox"
+    
+    id = Column(Integer, primary_key=True)
+    user_id = Column(String(100), nullable=False)
+    # Processed entries are kept, so they must not pin the listing
+    job_id = Column(Integer, ForeignKey("job_listings.id", ondelete="CASCADE"), nullable=False)
+    application_source = Column(String(100))
+    user_notes = Column(Text)
+    created_at = Column(DateTime, server_default=func.timezone('UTC', func.now()))
+    processed_at = Column(DateTime)
+    
+    def __repr__(self):
+        return f"<ApplicationOutbox {self.user_id}:{self.job_id}>"
+
 # Add indexes for better performance
-from sqlalchemy import Index
+from sqlalchemy import Index, cast
 
 # Composite indexes for efficient queries
-Index('idx_job_applications_user_status', JobApplication.user_id, JobApplication.application_status)
-Index('idx_job_applications_user_date', JobApplication.user_id, JobApplication.application_date.desc()) 
\ No newline at end of file
+Index('idx_job_listings_extracted_day', cast(JobListing.extracted_date, Date))
+Index('idx_job_listings_applied_extracted', JobListing.extracted_date.desc(), postgresql_where=JobListing.applied == True)
+# Status-filtered application pages walk (application_date, id) within one status
+Index('idx_job_applications_user_status', JobApplication.user_id, JobApplication.application_status,
+      JobApplication.application_date.desc(), JobApplication.id.desc())
+# One application per user and job; apply tracking upserts against it
+Index('uq_job_applications_user_job', JobApplication.user_id, JobApplication.job_id, unique=True)
+Index('idx_job_applications_user_date', JobApplication.user_id, JobApplication.application_date.desc(), JobApplication.id.desc()) 
+
+# Only unprocessed outbox rows are ever scanned
+Index('idx_application_outbox_pending', ApplicationOutbox.id, postgresql_where=ApplicationOutbox.processed_at.is_(None))
+# Deleting old job listings checks every referencing row; without these the
+# FK check seq-scans the referencing table once per deleted job
+Index('idx_application_outbox_job_id', ApplicationOutbox.job_id)
+
+# Skill containment lookups (programming_languages @> '["Python"]')
+Index('idx_user_profiles_programming_languages', UserProfile.programming_languages,
+      postgresql_using='gin', postgresql_ops={'programming_languages': 'jsonb_path_ops'})
+Index('idx_user_profiles_frameworks_libraries', UserProfile.frameworks_libraries,
+      postgresql_using='gin', postgresql_ops={'frameworks_libraries': 'jsonb_path_ops'})
+Index('idx_user_profiles_tools_platforms', UserProfile.tools_platforms,
+      postgresql_using='gin', postgresql_ops={'tools_platforms': 'jsonb_path_ops'})
@@ -1,6 +1,6 @@
-from typing import Optional, List, Dict
-from pydantic import BaseModel
-from datetime import datetime
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, AliasPath, field_validator, model_validator
+from datetime import date, datetime
 from enum import Enum
 
 class TimeRange(str, Enum):
@@ -69,12 +69,80 @@ class JobStats(BaseModel):
     daily_stats: List[DailyJobStats]
 
 class RecentApplication(BaseModel):
+    """Recent-applications row, validated straight from a JobApplication with its listing loaded"""
+    id: int = Field(validation_alias=AliasPath("job_listing", "id"))
+    title: str = Field(validation_alias=AliasPath("job_listing", "title"))
+    company: str = Field(validation_alias=AliasPath("job_listing", "company"))
+    location: str = Field(validation_alias=AliasPath("job_listing", "location"))
+    applied_date: Optional[datetime] = Field(default=None, validation_alias="application_date")
+    extracted_date: Optional[datetime] = Field(default=None, validation_alias=AliasPath("job_listing", "extracted_date"))
+    status: str = Field(validation_alias="application_status")
+    source_url: Optional[str] = Field(default=None, validation_alias=AliasPath("job_listing", "source_url"))
+    application_source: Optional[str] = None
+
+    @field_validator("location", mode="before")
+    @classmethod
+    def default_location(cls, v):
+        return v or "Remote"
+
+    @field_validator("status", mode="before")
+    @classmethod
+    def display_status(cls, v):
+        return v.title() if v else "Applied"
+
+    class Config:
+        from_attributes = True
+
+class ApplicationJobListing(BaseModel):
+    """Listing summary nested in the applications list"""
     id: int
     title: str
     company: str
-    location: str
-    extracted_date: datetime
+    location: Optional[str] = None
+    job_type: Optional[str] = None
+    experience_level: Optional[str] = None
+    salary_range: Optional[str] = None
+    application_url: Optional[str] = None
+    source: Optional[str] = None
+    source_url: Optional[str] = None
+    posted_date: Optional[datetime] = None
+    extracted_date: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class ApplicationListItem(BaseModel):
+    id: int
+    user_id: str
+    job_id: int
+    application_status: Optional[str] = None
+    application_source: Optional[str] = None
+    application_date: Optional[datetime] = None
     source_url: Optional[str] = None
+    user_notes: Optional[str] = None
+    extraction_metadata: Optional[Dict[str, Any]] = None
+    follow_up_date: Optional[date] = None
+    company_response: Optional[bool] = None
+    response_date: Optional[datetime] = None
+    job_listing: ApplicationJobListing
+
+    @model_validator(mode="after")
+    def default_extraction_metadata(self):
+        # Applications tracked from the dashboard carry no extraction metadata
+        if self.extraction_metadata is None:
+            self.extraction_metadata = {
+                "extraction_confidence": 0.9,
+                "extraction_method": self.job_listing.source or "dashboard"
+            }
+        return self
 
     class Config:
-        from_attributes = True
\ No newline at end of file
+        from_attributes = True
+
+class ApplicationListResponse(BaseModel):
+    applications: List[ApplicationListItem]
+    total: Optional[int] = None
+    page: int
+    limit: int
+    total_pages: Optional[int] = None
+    next_cursor: Optional[str] = None
@@ -0,0 +1,121 @@
+from typing import Optional, List, Dict, Any
+from pydantic import BaseModel, Field, computed_field, model_validator
+from datetime import datetime
+
+class PersonalInfo(BaseModel):
+    full_name: Optional[str] = None
+    email: Optional[str] = None
+    phone: Optional[str] = None
+    location: Optional[str] = None
+    work_authorization: Optional[str] = None
+
+    class Config:
+        from_attributes = True
+
+class ProfessionalSummary(BaseModel):
+    years_of_experience: Optional[float] = None
+    career_level: Optional[str] = None
+    summary: Optional[str] = Field(default=None, validation_alias="professional_summary")
+
+    class Config:
+        from_attributes = True
+
+class Skills(BaseModel):
+    programming_languages: Optional[List[Any]] = None
+    frameworks_libraries: Optional[List[Any]] = None
+    tools_platforms: Optional[List[Any]] = None
+    soft_skills: Optional[List[Any]] = None
+
+    class Config:
+        from_attributes = True
+
+class Experience(BaseModel):
+    job_titles: Optional[List[Any]] = None
+    companies: Optional[List[Any]] = None
+    industries: Optional[List[Any]] = None
+    descriptions: Optional[List[Any]] = Field(default=None, validation_alias="experience_descriptions")
+
+    class Config:
+        from_attributes = True
+
+class Education(BaseModel):
+    degrees: Optional[List[Any]] = None
+    institutions: Optional[List[Any]] = None
+    graduation_years: Optional[List[Any]] = None
+    coursework: Optional[List[Any]] = Field(default=None, validation_alias="relevant_coursework")
+
+    class Config:
+        from_attributes = True
+
+class Preferences(BaseModel):
+    desired_roles: Optional[List[Any]] = None
+    preferred_locations: Optional[List[Any]] = None
+    salary_range_min: Optional[int] = Field(default=None, exclude=True)
+    salary_range_max: Optional[int] = Field(default=None, exclude=True)
+    job_types: Optional[List[Any]] = None
+    company_size_preference: Optional[List[Any]] = None
+
+    @computed_field
+    @property
+    def salary_range(self) -> Dict[str, Optional[int]]:
+        return {"min": self.salary_range_min, "max": self.salary_range_max}
+
+    class Config:
+        from_attributes = True
+
+class AIInsights(BaseModel):
+    profile_summary: Optional[str] = Field(default=None, validation_alias="ai_profile_summary")
+    strengths: Optional[List[Any]] = Field(default=None, validation_alias="ai_strengths")
+    improvement_areas: Optional[List[Any]] = Field(default=None, validation_alias="ai_improvement_areas")
+    career_advice: Optional[str] = Field(default=None, validation_alias="ai_career_advice")
+
+    class Config:
+        from_attributes = True
+
+class ProfileMetadata(BaseModel):
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+    last_resume_upload: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class ProfileResponse(BaseModel):
+    """GET /profile body, validated straight from a UserProfile row"""
+    user_id: str
+    personal_info: PersonalInfo
+    professional_summary: ProfessionalSummary
+    skills: Skills
+    experience: Experience
+    education: Education
+    preferences: Preferences
+    ai_insights: AIInsights
+    metadata: ProfileMetadata
+
+    @model_validator(mode="before")
+    @classmethod
+    def sections_from_profile(cls, data):
+        # Every section reads its columns off the same flat row
+        if isinstance(data, dict):
+            return data
+        sections = ("personal_info", "professional_summary", "skills", "experience",
+                    "education", "preferences", "ai_insights", "metadata")
+        return {"user_id": data.user_id, **{section: data for section in sections}}
+
+class UserSummary(BaseModel):
+    user_id: str
+    full_name: Optional[str] = None
+    career_level: Optional[str] = None
+    years_of_experience: Optional[float] = None
+    created_at: Optional[datetime] = None
+    last_resume_upload: Optional[datetime] = None
+
+    class Config:
+        from_attributes = True
+
+class JobMatchesResponse(BaseModel):
+    user_id: str
+    total_matches: int
+    min_score_threshold: float
+    matches: List[Dict[str, Any]]
+    scoring_method: str
@@ -0,0 +1,117 @@
+from datetime import datetime, timedelta
+from typing import Optional
+from sqlalchemy import delete, func, insert, select, text
+from sqlalchemy.dialects.postgresql import insert as pg_insert
+from sqlalchemy.orm import Session
+from app.core import cache
+from app.models.job import JobApplication, ApplicationOutbox
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+OUTBOX_RETENTION_DAYS = 7  # processed entries are kept this long for status polls
+
+class ApplicationTrackingService:
+    """Folds queued "user applied" events from the outbox into JobApplication"""
+
+    def __init__(self, db: Session):
+        self.db = db
+
+    def enqueue(self, user_id: str, job_id: int, application_source: str, notes: str) -> int:
+        """Durably record an application click and return the outbox id"""
+        outbox_id = self.db.execute(
+            insert(ApplicationOutbox)
+            .values(
+                user_id=user_id,
+                job_id=job_id,
+                application_source=application_source,
+                user_notes=notes
+            )
+            .returning(ApplicationOutbox.id)
+        ).scalar_one()
+        self.db.commit()
+        return outbox_id
+
+    def status(self, outbox_id: int) -> Optional[str]:
+        """Return "queued" or "processed" for an outbox entry, None if unknown"""
+        processed_at = self.db.execute(
+            select(ApplicationOutbox.processed_at).where(ApplicationOutbox.id == outbox_id)
+        ).first()
+        if processed_at is None:
+            return None
+        return "queued" if processed_at[0] is None else "processed"
+
+    def process(self, outbox_id: int) -> dict:
+        """Apply one outbox entry to JobApplication; no-op if already processed"""
+        entry = self.db.query(ApplicationOutbox).filter(
+            ApplicationOutbox.id == outbox_id,
+            ApplicationOutbox.processed_at.is_(None)
+        ).with_for_update(skip_locked=True).first()
+        if not entry:
+            return {"status": "skipped", "outbox_id": outbox_id}
+
+        # Applications are RLS-protected, so act as the entry's user
+        self.db.execute(
+            text("SELECT set_config('app.current_user_id', :uid, true)"),
+            {"uid": entry.user_id}
+        )
+
+        # One atomic upsert instead of SELECT then INSERT or UPDATE; rows
+        # already marked applied are left untouched
+        now = func.timezone('UTC', func.now())
+        self.db.execute(
+            pg_insert(JobApplication)
+            .values(
+                user_id=entry.user_id,
+                job_id=entry.job_id,
+                application_status="applied",
+                application_source=entry.application_source,
+                user_notes=entry.user_notes,
+                application_date=now,
+                created_at=now,
+                updated_at=now
+            )
+            .on_conflict_do_update(
+                index_elements=[JobApplication.user_id, JobApplication.job_id],
+                set_={
+                    "application_status": "applied",
+                    "application_date": now,
+                    "application_source": entry.application_source,
+                    "user_notes": entry.user_notes,
+                    "updated_at": now
+                },
+                where=JobApplication.application_status != "applied"
+            )
+        )
+
+        entry.processed_at = datetime.utcnow()
+        self.db.commit()
+        cache.invalidate(f"applications:{entry.user_id}:")
+        return {"status": "processed", "outbox_id": outbox_id}
+
+    def process_pending(self, limit: int = 500) -> dict:
+        """Drain entries left behind by a crashed or restarted API worker"""
+        pending_ids = [
+            row.id for row in self.db.query(ApplicationOutbox.id)
+            .filter(ApplicationOutbox.processed_at.is_(None))
+            .order_by(ApplicationOutbox.id)
+            .limit(limit)
+        ]
+        processed = 0
+        for outbox_id in pending_ids:
+            try:
+                if self.process(outbox_id)["status"] == "processed":
+                    processed += 1
+            except Exception as e:
+                logger.error(f"Error processing application outbox entry {outbox_id}: {e}")
+                self.db.rollback()
+        return {"status": "success", "pending": len(pending_ids), "processed": processed}
+
+    def purge_processed(self, days_old: int = OUTBOX_RETENTION_DAYS) -> int:
+        """Delete entries processed more than days_old days ago; returns the count"""
+        cutoff = datetime.utcnow() - timedelta(days=days_old)
+        purged = self.db.execute(
+            delete(ApplicationOutbox).where(ApplicationOutbox.processed_at < cutoff)
+        ).rowcount
+        self.db.commit()
+        return purged
@@ -3,7 +3,7 @@ import logging
 from typing import Dict, List, Any, Optional
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from app.models.email_models import UserGmailConnection, EmailEvent
+from app.models.email_models import UserGmailConnection, EmailEvent, message_id_fingerprint
 from app.models.job import JobListing, JobApplication
 from app.services.gmail_service import GmailService
 from app.services.email_classifier import EmailClassifier
@@ -109,8 +109,8 @@ class EmailProcessor:
         """
         try:
             # Check if email already processed
-            existing_event = db.query(EmailEvent).filter(
-                EmailEvent.email_message_id == email['id']
+            existing_event = db.query(EmailEvent.id).filter(
+                EmailEvent.email_message_id_hash == message_id_fingerprint(email['id'])
             ).first()
             
             if existing_event:
@@ -263,7 +263,7 @@ class EmailProcessor:
         Process a specific email event (for manual processing)
         """
         try:
-            email_event = db.query(EmailEvent).filter(EmailEvent.id == email_event_id).first()
+            email_event = db.get(EmailEvent, email_event_id)
             if not email_event:
                 return {"success": False, "message": "Email event not found"}
             
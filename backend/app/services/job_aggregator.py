@@ -8,7 +8,6 @@ from urllib.parse import quote_plus, urljoin
 import re
 from bs4 import BeautifulSoup
 from app.core.config import settings
-from app.models.job import JobListing
 
 logger = logging.getLogger(__name__)
 
@@ -25,7 +24,7 @@ class JobAggregator:
             'User-Agent': 'Mozilla/5.0 (Macintosh; Intel Mac OS X 10_15_7) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/122.0.0.0 Safari/537.36'
         })
         
-    async def search_jobs(self, query: Dict[str, Any]) -> List[JobListing]:
+    async def search_jobs(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Main job search method that aggregates from multiple sources:
         1. RSS.app feeds (175 jobs)
@@ -80,7 +79,7 @@ class JobAggregator:
         logger.info(f"Final filtered jobs: {len(filtered_jobs)}")
         return filtered_jobs
     
-    async def _fetch_rss_app_jobs(self, query: Dict[str, Any]) -> List[JobListing]:
+    async def _fetch_rss_app_jobs(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Fetch jobs using RSS.app feeds (JSON format) with feed health monitoring
         """
@@ -126,7 +125,7 @@ class JobAggregator:
                 for item in items[:25]:  # Increase to 25 jobs per state (max available)
                     job_data = self._parse_json_feed_item(item, state_name)
                     if job_data:
-                        jobs.append(JobListing(**job_data))
+                        jobs.append(job_data)
                         
             except Exception as e:
                 logger.error(f"Error processing RSS.app feed {state_name}: {e}")
@@ -232,14 +231,14 @@ class JobAggregator:
         
         return feeds
     
-    async def _fetch_indeed_jobs(self, query: Dict[str, Any]) -> List[JobListing]:
+    async def _fetch_indeed_jobs(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Indeed RSS feeds are blocked (403 Forbidden), so we'll use alternative sources
         """
         logger.info("Indeed RSS feeds are currently blocked, skipping Indeed source")
         return []
     
-    async def _fetch_job_board_feeds(self, query: Dict[str, Any]) -> List[JobListing]:
+    async def _fetch_job_board_feeds(self, query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Fetch jobs from various working job board RSS feeds
         """
@@ -279,7 +278,7 @@ class JobAggregator:
                     try:
                         job_data = self._parse_rss_entry(entry, board_name)
                         if job_data and self._matches_query(job_data, query):
-                            jobs.append(JobListing(**job_data))
+                            jobs.append(job_data)
                     except Exception as e:
                         logger.debug(f"Error parsing {board_name} RSS entry: {e}")
                         continue
@@ -590,7 +589,7 @@ class JobAggregator:
         
         return True
     
-    def _deduplicate_jobs(self, jobs: List[JobListing]) -> List[JobListing]:
+    def _deduplicate_jobs(self, jobs: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
         """
         Remove duplicate jobs based on title, company, and location
         """
@@ -599,9 +598,9 @@ class JobAggregator:
         
         for job in jobs:
             # Create a unique key based on title, company, and location
-            title_clean = re.sub(r'[^\w\s]', '', job.title.lower().strip())
-            company_clean = re.sub(r'[^\w\s]', '', job.company.lower().strip())
-            location_clean = re.sub(r'[^\w\s]', '', job.location.lower().strip())
+            title_clean = re.sub(r'[^\w\s]', '', job["title"].lower().strip())
+            company_clean = re.sub(r'[^\w\s]', '', job["company"].lower().strip())
+            location_clean = re.sub(r'[^\w\s]', '', job["location"].lower().strip())
             
             key = f"{title_clean}|{company_clean}|{location_clean}"
             
@@ -609,12 +608,12 @@ class JobAggregator:
                 seen.add(key)
                 unique_jobs.append(job)
             else:
-                logger.debug(f"Duplicate job filtered: {job.title} at {job.company}")
+                logger.debug(f"Duplicate job filtered: {job['title']} at {job['company']}")
         
         logger.info(f"Deduplicated {len(jobs)} jobs to {len(unique_jobs)} unique jobs")
         return unique_jobs
     
-    def _filter_jobs(self, jobs: List[JobListing], query: Dict[str, Any]) -> List[JobListing]:
+    def _filter_jobs(self, jobs: List[Dict[str, Any]], query: Dict[str, Any]) -> List[Dict[str, Any]]:
         """
         Filter jobs based on query criteria
         """
@@ -622,11 +621,11 @@ class JobAggregator:
         
         for job in jobs:
             # Filter by date if specified
-            if query.get("date_posted") and job.posted_date:
+            if query.get("date_posted") and job.get("posted_date"):
                 cutoff_date = self._get_date_cutoff(query["date_posted"])
                 if cutoff_date:
                     # Ensure both dates are timezone-aware for comparison
-                    job_date = job.posted_date
+                    job_date = job["posted_date"]
                     if job_date.tzinfo is None:
                         job_date = job_date.replace(tzinfo=timezone.utc)
                     if job_date < cutoff_date:
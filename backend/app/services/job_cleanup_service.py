@@ -1,11 +1,25 @@
 from datetime import datetime, timedelta
 from sqlalchemy.orm import Session
-from sqlalchemy import and_
-from app.models.job import JobListing
+from sqlalchemy import and_, exists
+from app.models.job import JobApplication, JobListing
+from app.models.email_models import EmailEvent
 from app.utils.logger import get_logger
 
 logger = get_logger(__name__)
 
+def _unreferenced():
+    """Listings no application or email event points at
+
+    Those foreign keys to job_listings have no ON DELETE, so one referenced
+    row would fail the whole bulk delete; `applied` is not kept in step with
+    job_applications, so it cannot be relied on to exclude them. Outbox
+    entries cascade with their listing
+    """
+    return and_(
+        ~exists().where(JobApplication.job_id == JobListing.id),
+        ~exists().where(EmailEvent.matched_job_listing_id == JobListing.id),
+    )
+
 class JobCleanupService:
     """Service for cleaning up old job listings"""
     
@@ -19,7 +33,8 @@ class JobCleanupService:
             old_jobs_query = self.db.query(JobListing).filter(
                 and_(
                     JobListing.extracted_date < cutoff_date,
-                    JobListing.applied == False
+                    JobListing.applied == False,
+                    _unreferenced()
                 )
             )
             
@@ -60,7 +75,8 @@ class JobCleanupService:
             old_unapplied_jobs = self.db.query(JobListing).filter(
                 and_(
                     JobListing.extracted_date < cutoff_date,
-                    JobListing.applied == False
+                    JobListing.applied == False,
+                    _unreferenced()
                 )
             ).count()
             
@@ -98,7 +114,8 @@ class JobCleanupService:
             old_jobs_query = self.db.query(JobListing).filter(
                 and_(
                     JobListing.extracted_date < cutoff_date,
-                    JobListing.applied == False
+                    JobListing.applied == False,
+                    _unreferenced()
                 )
             )
             
@@ -47,7 +47,7 @@ class JobMatcher:
             
             for application in user_applications:
                 # Get the job listing
-                job = db.query(JobListing).filter(JobListing.id == application.job_id).first()
+                job = db.get(JobListing, application.job_id)
                 if not job:
                     continue
                 
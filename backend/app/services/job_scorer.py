@@ -48,35 +48,35 @@ class JobScoringService:
         db = SessionLocal()
         try:
             # Get all users with profiles
-            active_users = db.query(UserProfile.user_id).all()
-            
-            results = {
-                "users_processed": 0,
-                "total_scores_generated": 0,
-                "errors": 0
-            }
-            
-            for (user_id,) in active_users:
-                try:
-                    user_scores = await self.score_jobs_for_user(user_id, job_limit=100, days_back=1)
-                    results["users_processed"] += 1
-                    results["total_scores_generated"] += len(user_scores)
-                    
-                    # Small delay between users
-                    await asyncio.sleep(0.5)
-                    
-                except Exception as e:
-                    logger.error(f"Error scoring jobs for user {user_id}: {e}")
-                    results["errors"] += 1
-            
-            logger.info(f"Daily scoring complete: {results}")
-            return results
-            
+            user_ids = [user_id for (user_id,) in db.query(UserProfile.user_id).all()]
         except Exception as e:
             logger.error(f"Error in daily scoring batch: {e}")
             return {"users_processed": 0, "total_scores_generated": 0, "errors": 1}
         finally:
             db.close()
+        
+        # Users are scored concurrently, at most max_concurrent_scoring at a
+        # time, rather than one after another with a fixed pause between them
+        semaphore = asyncio.Semaphore(self.max_concurrent_scoring)
+        
+        async def score_user(user_id: str) -> Optional[int]:
+            async with semaphore:
+                try:
+                    user_scores = await self.score_jobs_for_user(user_id, job_limit=100, days_back=1)
+                    return len(user_scores)
+                except Exception as e:
+                    logger.error(f"Error scoring jobs for user {user_id}: {e}")
+                    return None
+        
+        score_counts = await asyncio.gather(*(score_user(user_id) for user_id in user_ids))
+        
+        results = {
+            "users_processed": sum(1 for count in score_counts if count is not None),
+            "total_scores_generated": sum(count for count in score_counts if count is not None),
+            "errors": sum(1 for count in score_counts if count is None)
+        }
+        logger.info(f"Daily scoring complete: {results}")
+        return results
     
     async def get_top_matches_for_user(
         self, 
@@ -1,5 +1,7 @@
+import asyncio
 import io
 import logging
+from concurrent.futures import ProcessPoolExecutor
 from typing import Dict, Any, Optional
 from fastapi import UploadFile, HTTPException
 import PyPDF2
@@ -9,6 +11,67 @@ from app.core.ai_service import ai_service
 
 logger = logging.getLogger(__name__)
 
+def extract_resume_text(content: bytes, file_extension: str) -> str:
+    """
+    Extract plain text from resume file bytes
+
+    Module-level so it can run in a worker process; raises ValueError with a
+    user-facing message when the file cannot be read.
+    """
+    if file_extension == '.pdf':
+        return _extract_text_from_pdf(content)
+    elif file_extension in ['.docx', '.doc']:
+        return _extract_text_from_docx(content)
+    else:
+        raise ValueError("Unsupported file format")
+
+def _extract_text_from_pdf(content: bytes) -> str:
+    """
+    Extract text from PDF file using PyPDF2
+    """
+    try:
+        pdf_file = io.BytesIO(content)
+        pdf_reader = PyPDF2.PdfReader(pdf_file)
+        
+        text = ""
+        for page in pdf_reader.pages:
+            page_text = page.extract_text()
+            if page_text:
+                text += page_text + "\n"
+        
+        return text.strip()
+        
+    except Exception as e:
+        logger.error(f"Error extracting text from PDF: {e}")
+        raise ValueError("Could not read PDF file. Please ensure it's a valid PDF.")
+
+def _extract_text_from_docx(content: bytes) -> str:
+    """
+    Extract text from DOCX file using python-docx
+    """
+    try:
+        docx_file = io.BytesIO(content)
+        doc = Document(docx_file)
+        
+        text = ""
+        for paragraph in doc.paragraphs:
+            if paragraph.text.strip():
+                text += paragraph.text + "\n"
+        
+        # Also extract text from tables
+        for table in doc.tables:
+            for row in table.rows:
+                for cell in row.cells:
+                    if cell.text.strip():
+                        text += cell.text + " "
+                text += "\n"
+        
+        return text.strip()
+        
+    except Exception as e:
+        logger.error(f"Error extracting text from DOCX: {e}")
+        raise ValueError("Could not read DOCX file. Please ensure it's a valid Word document.")
+
 class ResumeParserService:
     """
     Service for handling resume uploads and parsing
@@ -20,6 +83,7 @@ class ResumeParserService:
     
     def __init__(self):
         self.ai_service = ai_service
+        self._text_pool: Optional[ProcessPoolExecutor] = None
     
     async def parse_resume_file(self, file: UploadFile) -> Dict[str, Any]:
         """
@@ -92,6 +156,17 @@ class ResumeParserService:
                 detail=f"File too large. Maximum size: {self.MAX_FILE_SIZE // (1024*1024)}MB"
             )
     
+    def start_text_pool(self, max_workers: int) -> None:
+        """
+        Start the worker processes used for PDF/DOCX text extraction
+        """
+        self._text_pool = ProcessPoolExecutor(max_workers=max_workers)
+    
+    def shutdown_text_pool(self) -> None:
+        if self._text_pool is not None:
+            self._text_pool.shutdown(cancel_futures=True)
+            self._text_pool = None
+    
     async def _extract_text_from_file(self, file: UploadFile) -> str:
         """
         Extract text content from PDF or DOCX file
@@ -101,65 +176,14 @@ class ResumeParserService:
         # Read file content
         content = await file.read()
         
-        if file_extension == '.pdf':
-            return self._extract_text_from_pdf(content)
-        elif file_extension in ['.docx', '.doc']:
-            return self._extract_text_from_docx(content)
-        else:
-            raise HTTPException(status_code=422, detail="Unsupported file format")
-    
-    def _extract_text_from_pdf(self, content: bytes) -> str:
-        """
-        Extract text from PDF file using PyPDF2
-        """
+        # Text extraction is CPU-bound, so it runs in the worker processes
+        # (or the default thread pool when none were started) to keep
+        # concurrent uploads from queuing behind each other on the event loop
+        loop = asyncio.get_running_loop()
         try:
-            pdf_file = io.BytesIO(content)
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            
-            text = ""
-            for page in pdf_reader.pages:
-                page_text = page.extract_text()
-                if page_text:
-                    text += page_text + "\n"
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting text from PDF: {e}")
-            raise HTTPException(
-                status_code=422,
-                detail="Could not read PDF file. Please ensure it's a valid PDF."
-            )
-    
-    def _extract_text_from_docx(self, content: bytes) -> str:
-        """
-        Extract text from DOCX file using python-docx
-        """
-        try:
-            docx_file = io.BytesIO(content)
-            doc = Document(docx_file)
-            
-            text = ""
-            for paragraph in doc.paragraphs:
-                if paragraph.text.strip():
-                    text += paragraph.text + "\n"
-            
-            # Also extract text from tables
-            for table in doc.tables:
-                for row in table.rows:
-                    for cell in row.cells:
-                        if cell.text.strip():
-                            text += cell.text + " "
-                    text += "\n"
-            
-            return text.strip()
-            
-        except Exception as e:
-            logger.error(f"Error extracting text from DOCX: {e}")
-            raise HTTPException(
-                status_code=422,
-                detail="Could not read DOCX file. Please ensure it's a valid Word document."
-            )
+            return await loop.run_in_executor(self._text_pool, extract_resume_text, content, file_extension)
+        except ValueError as e:
+            raise HTTPException(status_code=422, detail=str(e))
     
     def _get_file_extension(self, filename: str) -> str:
         """
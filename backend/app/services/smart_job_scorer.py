@@ -2,7 +2,7 @@ import logging
 from datetime import datetime, timedelta
 from typing import List, Dict, Any, Optional
 from sqlalchemy.orm import Session
-from sqlalchemy import and_, or_, desc
+from sqlalchemy import and_, or_, desc, select
 
 from app.db.session import SessionLocal
 from app.models.job import JobListing, UserProfile
@@ -14,6 +14,26 @@ from app.tasks.scoring_tasks import (
 
 logger = logging.getLogger(__name__)
 
+# Profile columns that feed match filtering
+_PREFERENCE_COLUMNS = (
+    UserProfile.preferred_locations,
+    UserProfile.salary_range_min,
+    UserProfile.salary_range_max,
+    UserProfile.job_types,
+    UserProfile.desired_roles,
+)
+# Job columns a match result is built from
+_MATCH_COLUMNS = (
+    JobListing.id,
+    JobListing.title,
+    JobListing.company,
+    JobListing.location,
+    JobListing.salary_range,
+    JobListing.application_url,
+    JobListing.posted_date,
+    JobListing.extracted_date,
+)
+
 class SmartJobScoringService:
     """
     Scalable job scoring service implementing the efficient architecture:
@@ -101,8 +121,10 @@ class SmartJobScoringService:
         """
         db = SessionLocal()
         try:
-            # Get user profile for preferences
-            profile = db.query(UserProfile).filter(UserProfile.user_id == user_id).first()
+            # Get user profile for preferences (only the preference columns)
+            profile = db.execute(
+                select(*_PREFERENCE_COLUMNS).where(UserProfile.user_id == user_id)
+            ).first()
             if not profile:
                 return []
             
@@ -116,8 +138,9 @@ class SmartJobScoringService:
                     'desired_roles': profile.desired_roles or []
                 }
             
-            # Simple query without JobScore - just get active jobs
-            query = db.query(JobListing).filter(
+            # Simple query without JobScore - just get active jobs. Plain rows
+            # of the returned columns; no JobListing instances are built.
+            query = select(*_MATCH_COLUMNS).where(
                 JobListing.is_active == True
             )
             
@@ -125,7 +148,7 @@ class SmartJobScoringService:
             query = self._apply_basic_filters(query, preferences)
             
             # Get jobs ordered by extracted date (newest first)
-            jobs = query.order_by(desc(JobListing.extracted_date)).limit(limit).all()
+            jobs = db.execute(query.order_by(desc(JobListing.extracted_date)).limit(limit)).all()
             
             # Format results with simple scoring
             results = []
@@ -0,0 +1,33 @@
+from app.core.celery_app import celery_app
+from app.db.rls_session import SessionLocal
+from app.services.application_tracking_service import ApplicationTrackingService
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@celery_app.task
+def process_application_task(outbox_id: int):
+    """Fold one application outbox entry into JobApplication"""
+    try:
+        db = SessionLocal()
+        try:
+            return ApplicationTrackingService(db).process(outbox_id)
+        finally:
+            db.close()
+    except Exception as e:
+        # The entry stays pending and is retried by the outbox drain task
+        logger.error(f"Error processing application outbox entry {outbox_id}: {str(e)}")
+        return {"status": "error", "message": f"Task error: {str(e)}"}
+
+@celery_app.task
+def process_pending_applications_task(limit: int = 500):
+    """Fold application outbox entries the API process did not get to"""
+    try:
+        db = SessionLocal()
+        try:
+            return ApplicationTrackingService(db).process_pending(limit)
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Error in application outbox task: {str(e)}")
+        return {"status": "error", "message": f"Task error: {str(e)}"}
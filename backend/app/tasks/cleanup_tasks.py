@@ -1,5 +1,6 @@
 from app.core.celery_app import celery_app
 from app.db.rls_session import SessionLocal
+from app.services.application_tracking_service import ApplicationTrackingService
 from app.services.job_cleanup_service import JobCleanupService
 from app.utils.logger import get_logger
 
@@ -13,6 +14,8 @@ def cleanup_old_jobs_task(days_old: int = 20):
         try:
             cleanup_service = JobCleanupService(db)
             result = cleanup_service.cleanup_old_jobs(days_old)
+            # Processed outbox entries are only read by status polls
+            result["purged_outbox_entries"] = ApplicationTrackingService(db).purge_processed()
             return result
         finally:
             db.close()
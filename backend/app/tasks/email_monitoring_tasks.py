@@ -4,7 +4,7 @@ from celery import Celery
 from sqlalchemy.orm import Session
 from datetime import datetime, timedelta
 from typing import List, Dict, Any
-from app.db.session import SessionLocal
+from app.db.session import SyncSessionLocal
 from app.models.email_models import UserGmailConnection, EmailEvent
 from app.services.email_processor import EmailProcessor
 from app.core.celery_app import celery_app
@@ -19,7 +19,7 @@ def monitor_and_process_emails():
     """
     logger.info("Starting email monitoring task")
     
-    db = SessionLocal()
+    db = SyncSessionLocal()
     try:
         # Get all authorized Gmail connections
         connections = db.query(UserGmailConnection).filter(
@@ -75,17 +75,17 @@ def monitor_and_process_emails():
         db.close()
 
 @celery_app.task
-def process_user_emails_async(user_id: str):
+def process_user_emails_async(user_id: str, user_email: str = None):
     """
     Process emails for a specific user asynchronously
     Can be triggered manually or by webhook
     """
     logger.info(f"Processing emails for user {user_id}")
     
-    db = SessionLocal()
+    db = SyncSessionLocal()
     try:
         processor = EmailProcessor()
-        result = asyncio.run(processor.process_user_emails(user_id=user_id, db=db))
+        result = asyncio.run(processor.process_user_emails(user_id=user_id, user_email=user_email, db=db))
         
         logger.info(f"User {user_id} processing result: {result}")
         return result
@@ -107,7 +107,7 @@ def check_gmail_connections():
     """
     logger.info("Checking Gmail connection health")
     
-    db = SessionLocal()
+    db = SyncSessionLocal()
     try:
         connections = db.query(UserGmailConnection).filter(
             UserGmailConnection.is_authorized == True
@@ -159,24 +159,3 @@ def check_gmail_connections():
         }
     finally:
         db.close()
-
-# Schedule the tasks
-@celery_app.on_after_configure.connect
-def setup_periodic_tasks(sender, **kwargs):
-    """Set up periodic tasks for email monitoring"""
-    
-    # Monitor emails every 5 minutes
-    sender.add_periodic_task(
-        300.0,  # 5 minutes
-        monitor_and_process_emails.s(),
-        name='monitor-emails-every-5-minutes'
-    )
-    
-    # Check Gmail connections every hour
-    sender.add_periodic_task(
-        3600.0,  # 1 hour
-        check_gmail_connections.s(),
-        name='check-gmail-connections-every-hour'
-    )
-    
-    logger.info("Periodic tasks configured for email monitoring") 
\ No newline at end of file
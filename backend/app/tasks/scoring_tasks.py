@@ -13,6 +13,8 @@ from app.core.ai_service import ai_service
 
 logger = logging.getLogger(__name__)
 
+SCORING_CONCURRENCY = 8  # AI scoring calls in flight at once per task
+
 # =====================================================
 # BACKGROUND JOB SCORING TASKS
 # =====================================================
@@ -137,38 +139,32 @@ async def _score_all_jobs_for_user_async(user_id: str, task=None):
             }
         }
         
-        # Score jobs in batches for better performance
-        batch_size = 10
+        # Keep SCORING_CONCURRENCY calls in flight the whole time, rather
+        # than waiting for the slowest job of each fixed-size batch
+        semaphore = asyncio.Semaphore(SCORING_CONCURRENCY)
         total_scored = 0
-        successful_scores = 0
-        
-        for i in range(0, len(jobs), batch_size):
-            batch = jobs[i:i+batch_size]
-            
-            if task:
-                progress = int((i / len(jobs)) * 90) + 5  # 5-95% range
-                task.update_state(
-                    state='PROGRESS',
-                    meta={
-                        'status': f'Scoring batch {i//batch_size + 1}/{(len(jobs)//batch_size) + 1}',
-                        'progress': progress,
-                        'scored': total_scored,
-                        'total': len(jobs)
-                    }
-                )
-            
-            # Score batch concurrently
-            batch_tasks = []
-            for job in batch:
-                batch_tasks.append(_score_single_job_async(profile_dict, job, user_id, db))
-            
-            batch_results = await asyncio.gather(*batch_tasks, return_exceptions=True)
-            
-            for result in batch_results:
-                total_scored += 1
-                if not isinstance(result, Exception):
-                    successful_scores += 1
-                    
+        
+        async def score_job(job: JobListing):
+            nonlocal total_scored
+            async with semaphore:
+                try:
+                    return await _score_single_job_async(profile_dict, job, user_id, db)
+                finally:
+                    total_scored += 1
+                    if task and total_scored % SCORING_CONCURRENCY == 0:
+                        task.update_state(
+                            state='PROGRESS',
+                            meta={
+                                'status': f'Scored {total_scored}/{len(jobs)} jobs',
+                                'progress': int((total_scored / len(jobs)) * 90) + 5,  # 5-95% range
+                                'scored': total_scored,
+                                'total': len(jobs)
+                            }
+                        )
+        
+        results = await asyncio.gather(*(score_job(job) for job in jobs), return_exceptions=True)
+        successful_scores = sum(1 for result in results if not isinstance(result, Exception))
+        
         if task:
             task.update_state(
                 state='PROGRESS',
@@ -195,7 +191,7 @@ async def _score_job_for_all_users_async(job_id: int, task=None):
     db = SessionLocal()
     try:
         # Get the job
-        job = db.query(JobListing).filter(JobListing.id == job_id).first()
+        job = db.get(JobListing, job_id)
         if not job:
             raise ValueError(f"Job not found: {job_id}")
         
@@ -208,20 +204,13 @@ async def _score_job_for_all_users_async(job_id: int, task=None):
                 meta={'status': f'Found {len(users)} users to score against', 'progress': 10}
             )
         
-        successful_scores = 0
+        # Users are scored concurrently, SCORING_CONCURRENCY at a time
+        semaphore = asyncio.Semaphore(SCORING_CONCURRENCY)
+        finished = 0
         
-        for i, profile in enumerate(users):
+        async def score_for_user(profile: UserProfile) -> bool:
+            nonlocal finished
             try:
-                if task:
-                    progress = int((i / len(users)) * 80) + 10  # 10-90% range
-                    task.update_state(
-                        state='PROGRESS',
-                        meta={
-                            'status': f'Scoring for user {i+1}/{len(users)}',
-                            'progress': progress
-                        }
-                    )
-                
                 # Convert profile to dict
                 profile_dict = {
                     'skills': {
@@ -238,11 +227,26 @@ async def _score_job_for_all_users_async(job_id: int, task=None):
                 }
                 
                 # Score the job
-                await _score_single_job_async(profile_dict, job, profile.user_id, db)
-                successful_scores += 1
+                async with semaphore:
+                    await _score_single_job_async(profile_dict, job, profile.user_id, db)
+                return True
                 
             except Exception as e:
                 logger.warning(f"Failed to score job {job_id} for user {profile.user_id}: {e}")
+                return False
+            finally:
+                finished += 1
+                if task:
+                    task.update_state(
+                        state='PROGRESS',
+                        meta={
+                            'status': f'Scored for {finished}/{len(users)} users',
+                            'progress': int((finished / len(users)) * 80) + 10  # 10-90% range
+                        }
+                    )
+        
+        outcomes = await asyncio.gather(*(score_for_user(profile) for profile in users))
+        successful_scores = sum(outcomes)
         
         return {
             'job_id': job_id,
@@ -7,9 +7,17 @@ from app.models.job import JobListing, RSSFeedConfiguration, UserProfile
 import logging
 import asyncio
 from datetime import datetime, timedelta
+from sqlalchemy import insert, select
 
 logger = logging.getLogger(__name__)
 
+# JobListing columns copied from aggregated RSS jobs into new rows
+_RSS_JOB_COLUMNS = (
+    "title", "company", "location", "description", "requirements", "job_type",
+    "experience_level", "salary_range", "skills", "application_url", "source",
+    "source_url", "is_active", "posted_date", "extracted_date", "applied",
+)
+
 @shared_task
 def execute_search_task(query_id: int):
     """
@@ -60,42 +68,29 @@ def refresh_rss_feeds_direct():
         
         logger.info(f"Found {len(jobs)} total jobs from all RSS feeds")
         
-        # Save jobs to database (skip duplicates)
-        saved_count = 0
-        duplicate_count = 0
+        # Save jobs to database (skip duplicates by title, company, location).
+        # One query finds the listings that already exist and one multi-row
+        # INSERT saves the rest, instead of a SELECT and INSERT per job.
+        existing_keys = set(db.execute(
+            select(JobListing.title, JobListing.company, JobListing.location).where(
+                JobListing.title.in_({job["title"] for job in jobs}),
+                JobListing.company.in_({job["company"] for job in jobs})
+            )
+        ).tuples())
         
+        new_rows = []
         for job in jobs:
-            # Check if job already exists (by title, company, location)
-            existing = db.query(JobListing).filter(
-                JobListing.title == job.title,
-                JobListing.company == job.company,
-                JobListing.location == job.location
-            ).first()
-            
-            if not existing:
-                # Save new job
-                db_job = JobListing(
-                    title=job.title,
-                    company=job.company,
-                    location=job.location,
-                    description=job.description,
-                    requirements=job.requirements,
-                    job_type=job.job_type,
-                    experience_level=job.experience_level,
-                    salary_range=job.salary_range,
-                    skills=job.skills,
-                    application_url=job.application_url,
-                    source=job.source,
-                    source_url=job.source_url,
-                    is_active=job.is_active,
-                    posted_date=job.posted_date,
-                    extracted_date=job.extracted_date,
-                    applied=job.applied
-                )
-                db.add(db_job)
-                saved_count += 1
-            else:
-                duplicate_count += 1
+            key = (job["title"], job["company"], job["location"])
+            if key in existing_keys:
+                continue
+            existing_keys.add(key)
+            # Every row carries the same keys, as one multi-row INSERT needs
+            new_rows.append({column: job.get(column) for column in _RSS_JOB_COLUMNS})
+        
+        if new_rows:
+            db.execute(insert(JobListing), new_rows)
+        saved_count = len(new_rows)
+        duplicate_count = len(jobs) - saved_count
         
         db.commit()
         logger.info(f"RSS Feed Refresh Complete: {saved_count} new jobs saved, {duplicate_count} duplicates skipped")
@@ -0,0 +1,23 @@
+from sqlalchemy import text
+
+from app.core.celery_app import celery_app
+from app.db.rls_session import SessionLocal
+from app.utils.logger import get_logger
+
+logger = get_logger(__name__)
+
+@celery_app.task
+def refresh_daily_stats_task():
+    """Rebuild the jobs_daily_stats rollup read by /jobs/stats"""
+    try:
+        db = SessionLocal()
+        try:
+            # CONCURRENTLY keeps the view readable while it is rebuilt
+            db.execute(text("REFRESH MATERIALIZED VIEW CONCURRENTLY jobs_daily_stats"))
+            db.commit()
+            return {"status": "success"}
+        finally:
+            db.close()
+    except Exception as e:
+        logger.error(f"Error refreshing daily job stats: {str(e)}")
+        return {"status": "error", "message": f"Task error: {str(e)}"}
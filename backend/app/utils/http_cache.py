@@ -0,0 +1,19 @@
+"""
+HTTP conditional-request helpers for cacheable JSON reads
+"""
+import hashlib
+
+from fastapi import Request, Response
+
+
+def conditional_json_response(request: Request, content: bytes, cache_control: str) -> Response:
+    """
+    Return JSON content with a strong ETag, or a bodiless 304 when the client
+    already holds this exact body
+    """
+    etag = f'"{hashlib.md5(content).hexdigest()}"'
+    headers = {"ETag": etag, "Cache-Control": cache_control}
+    if_none_match = request.headers.get("if-none-match", "")
+    if etag in (tag.strip().removeprefix("W/") for tag in if_none_match.split(",")):
+        return Response(status_code=304, headers=headers)
+    return Response(content=content, media_type="application/json", headers=headers)
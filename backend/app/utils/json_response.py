@@ -0,0 +1,17 @@
+"""
+Default JSON response class for the API
+"""
+from typing import Any
+
+from fastapi.responses import JSONResponse
+from pydantic_core import to_json
+
+
+class PydanticJSONResponse(JSONResponse):
+    """
+    JSONResponse encoded by pydantic-core's Rust serializer instead of the
+    stdlib json module; datetimes, dates and UUIDs are encoded natively
+    """
+
+    def render(self, content: Any) -> bytes:
+        return to_json(content)
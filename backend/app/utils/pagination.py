@@ -0,0 +1,24 @@
+"""
+Opaque keyset cursors for newest-first list endpoints
+"""
+import base64
+from datetime import datetime
+from typing import Tuple
+
+from fastapi import HTTPException
+
+
+def encode_keyset_cursor(ts: datetime, id: int) -> str:
+    """Encode a row's (timestamp, id) sort key as an opaque cursor"""
+    raw = f"{ts.isoformat()}|{id}"
+    return base64.urlsafe_b64encode(raw.encode()).decode()
+
+
+def decode_keyset_cursor(cursor: str) -> Tuple[datetime, int]:
+    """Decode a cursor produced by encode_keyset_cursor; 400 if malformed"""
+    try:
+        raw = base64.urlsafe_b64decode(cursor.encode()).decode()
+        date_part, id_part = raw.rsplit("|", 1)
+        return datetime.fromisoformat(date_part), int(id_part)
+    except (ValueError, UnicodeDecodeError):
+        raise HTTPException(status_code=400, detail="Invalid pagination cursor")
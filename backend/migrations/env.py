@@ -10,7 +10,9 @@ from pathlib import Path
 sys.path.append(str(Path(__file__).resolve().parents[2]))
 
 from app.core.config import settings
-from app.models.job import Base
+from app.db.base_class import Base
+# Register every model's table so autogenerate sees the whole schema
+from app.models import job, user, email_models  # noqa: F401
 
 # this is the Alembic Config object, which provides
 # access to the values within the .ini file in use.
@@ -0,0 +1,41 @@
+"""Index the unindexed foreign keys to job_listings
+
+Revision ID: 0b6d4e8a2c19
+Revises: f7c2e9a4b1d6
+Create Date: 2026-10-16 14:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '0b6d4e8a2c19'
+down_revision: Union[str, None] = 'f7c2e9a4b1d6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The job cleanup deletes old job_listings in bulk; Postgres checks each
+    # deleted id against every referencing table, which was a sequential scan
+    # of application_outbox and email_events per row. Most email events match
+    # no job, so that index only covers the rows that do.
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_application_outbox_job_id "
+            "ON application_outbox (job_id)"
+        )
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_email_events_matched_job "
+            "ON email_events (matched_job_listing_id) "
+            "WHERE matched_job_listing_id IS NOT NULL"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_email_events_matched_job")
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_application_outbox_job_id")
@@ -0,0 +1,100 @@
+"""Drop indexes that duplicate a primary key or a composite's prefix
+
+Revision ID: 1e7b4c9a2f63
+Revises: 9c4e7a1b3f58
+Create Date: 2026-10-16 17:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '1e7b4c9a2f63'
+down_revision: Union[str, None] = '9c4e7a1b3f58'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# index=True on a primary key built a second btree on id
+PRIMARY_KEY_DUPLICATES = {
+    'ix_user_gmail_connections_id': 'user_gmail_connections',
+    'ix_email_events_id': 'email_events',
+    'ix_email_sync_logs_id': 'email_sync_logs',
+    'ix_job_listings_id': 'job_listings',
+    'ix_rss_feed_configurations_id': 'rss_feed_configurations',
+    'ix_user_profiles_id': 'user_profiles',
+    'ix_job_applications_id': 'job_applications',
+    'ix_application_outbox_id': 'application_outbox',
+    'ix_users_id': 'users',
+}
+
+# Single-column indexes whose column already leads a composite or is
+# indexed under another name
+MODEL_DUPLICATES = {
+    'ix_user_gmail_connections_user_id': ('user_gmail_connections', 'user_id'),
+    'ix_email_events_user_id': ('email_events', 'user_id'),
+    'ix_email_events_company_name': ('email_events', 'company_name'),
+    'ix_email_sync_logs_user_id': ('email_sync_logs', 'user_id'),
+    'ix_job_applications_user_id': ('job_applications', 'user_id'),
+}
+
+# Created by earlier versions of app/migrations/cleanup_unused_tables.py
+SCRIPT_DUPLICATES = (
+    'idx_job_listings_user_id',
+    'idx_job_applications_user_id',
+    'idx_user_profiles_user_id',
+    'idx_gmail_connections_user_id',
+    'idx_email_events_user_id',
+    'idx_email_events_user_type_created',
+    'idx_email_sync_logs_user_id',
+)
+
+
+def upgrade() -> None:
+    # Every insert into these tables maintained each duplicate. email_events
+    # is written continuously by the Gmail sync, so nothing here blocks writes
+    with op.get_context().autocommit_block():
+        # Widen (user_id, email_type) to serve the type-filtered event list
+        # page order too, replacing the script's copy of the same index
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_email_events_user_type_new "
+            "ON email_events (user_id, email_type, created_at DESC, id DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_email_events_user_type")
+        op.execute("ALTER INDEX idx_email_events_user_type_new RENAME TO idx_email_events_user_type")
+
+        # The script now indexes job_listings.user_id as (user_id,
+        # posted_date DESC) instead, but only when it is re-run; build that
+        # here before dropping the old index, which backs the RLS predicate.
+        # user_id exists only where the script has been run at all
+        has_user_id = op.get_bind().execute(sa.text(
+            "SELECT 1 FROM information_schema.columns "
+            "WHERE table_schema = current_schema() AND table_name = 'job_listings' AND column_name = 'user_id'"
+        )).first() is not None
+        if has_user_id:
+            op.execute(
+                "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_listings_user_posted "
+                "ON job_listings (user_id, posted_date DESC)"
+            )
+
+        for index in (*PRIMARY_KEY_DUPLICATES, *MODEL_DUPLICATES, *SCRIPT_DUPLICATES):
+            op.execute(f"DROP INDEX CONCURRENTLY IF EXISTS {index}")
+
+
+def downgrade() -> None:
+    # Restores the model-declared indexes; the cleanup script's own copies
+    # are not recreated
+    with op.get_context().autocommit_block():
+        for index, (table, column) in MODEL_DUPLICATES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} ({column})")
+        for index, table in PRIMARY_KEY_DUPLICATES.items():
+            op.execute(f"CREATE INDEX CONCURRENTLY IF NOT EXISTS {index} ON {table} (id)")
+
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_email_events_user_type_old "
+            "ON email_events (user_id, email_type)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_email_events_user_type")
+        op.execute("ALTER INDEX idx_email_events_user_type_old RENAME TO idx_email_events_user_type")
@@ -0,0 +1,35 @@
+"""Index email_events.gmail_connection_id
+
+Revision ID: 2f9a6c1e4d87
+Revises: 8e4b2d6a9f13
+Create Date: 2026-10-16 15:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '2f9a6c1e4d87'
+down_revision: Union[str, None] = '8e4b2d6a9f13'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Postgres does not index foreign key columns; loading a connection's
+    # email_events and deleting a user_gmail_connections row both scanned
+    # the whole table. email_events is written continuously by the Gmail
+    # sync, so build without blocking inserts
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_email_events_gmail_conn "
+            "ON email_events (gmail_connection_id)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_email_events_gmail_conn")
@@ -0,0 +1,39 @@
+"""Add job listing day and applied-date indexes
+
+Revision ID: 3b8e1f0c7a52
+Revises: 9d7cf419629e
+Create Date: 2026-10-16 11:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3b8e1f0c7a52'
+down_revision: Union[str, None] = '9d7cf419629e'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # /stats groups job listings by calendar day
+    op.create_index(
+        'idx_job_listings_extracted_day',
+        'job_listings',
+        [sa.text('CAST(extracted_date AS DATE)')],
+    )
+    # Applied-job lists are read newest first
+    op.create_index(
+        'idx_job_listings_applied_extracted',
+        'job_listings',
+        [sa.text('extracted_date DESC')],
+        postgresql_where=sa.text('applied = true'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_job_listings_applied_extracted', table_name='job_listings')
+    op.drop_index('idx_job_listings_extracted_day', table_name='job_listings')
@@ -0,0 +1,61 @@
+"""Store email_events.ai_data as JSONB, moved out of line early
+
+Revision ID: 3d6a9e2c5b71
+Revises: 1e7b4c9a2f63
+Create Date: 2026-10-16 17:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '3d6a9e2c5b71'
+down_revision: Union[str, None] = '1e7b4c9a2f63'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.execute("UPDATE email_events SET ai_data = '{}' WHERE ai_data IS NULL")
+    op.alter_column(
+        'email_events',
+        'ai_data',
+        type_=postgresql.JSONB(),
+        existing_type=sa.JSON(),
+        postgresql_using='ai_data::jsonb',
+        server_default=sa.text("'{}'::jsonb"),
+        nullable=False,
+    )
+    # The classifier payload is most of each row; compress and move it to
+    # TOAST once a row passes 128 bytes so the heap keeps only the columns
+    # the lists and counts read. The storage stays EXTENDED (compressed)
+    op.execute("ALTER TABLE email_events SET (toast_tuple_target = 128)")
+    # lz4 needs Postgres 14+ built --with-lz4; elsewhere pglz stays
+    op.execute("""
+        DO $$
+        BEGIN
+            IF current_setting('server_version_num')::int >= 140000 THEN
+                ALTER TABLE email_events ALTER COLUMN ai_data SET COMPRESSION lz4;
+            END IF;
+        EXCEPTION WHEN feature_not_supported THEN
+            NULL;
+        END
+        $$
+    """)
+
+
+def downgrade() -> None:
+    op.execute("ALTER TABLE email_events RESET (toast_tuple_target)")
+    op.alter_column(
+        'email_events',
+        'ai_data',
+        type_=sa.JSON(),
+        existing_type=postgresql.JSONB(),
+        postgresql_using='ai_data::json',
+        server_default=None,
+        nullable=True,
+    )
@@ -0,0 +1,56 @@
+"""Store profile preference lists as JSONB; index more skill lists
+
+Revision ID: 4a8d2f6b0c35
+Revises: 7d3c5b9e1a42
+Create Date: 2026-10-16 16:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = '4a8d2f6b0c35'
+down_revision: Union[str, None] = '7d3c5b9e1a42'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+PREFERENCE_COLUMNS = ('desired_roles', 'preferred_locations', 'job_types', 'company_size_preference')
+# Skill lists (already JSONB) that get a containment index alongside
+# programming_languages
+INDEXED_SKILL_COLUMNS = ('frameworks_libraries', 'tools_platforms')
+
+
+def upgrade() -> None:
+    for column in PREFERENCE_COLUMNS:
+        op.alter_column(
+            'user_profiles',
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb',
+        )
+    for column in INDEXED_SKILL_COLUMNS:
+        op.create_index(
+            f'idx_user_profiles_{column}',
+            'user_profiles',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'jsonb_path_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in INDEXED_SKILL_COLUMNS:
+        op.drop_index(f'idx_user_profiles_{column}', table_name='user_profiles')
+    for column in PREFERENCE_COLUMNS:
+        op.alter_column(
+            'user_profiles',
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::json',
+        )
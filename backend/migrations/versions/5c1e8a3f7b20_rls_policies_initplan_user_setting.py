@@ -0,0 +1,59 @@
+"""Evaluate the RLS user setting once per statement
+
+Revision ID: 5c1e8a3f7b20
+Revises: 0b6d4e8a2c19
+Create Date: 2026-10-16 15:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5c1e8a3f7b20'
+down_revision: Union[str, None] = '0b6d4e8a2c19'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Policies created by app/migrations/cleanup_unused_tables.py
+POLICIES = (
+    ("job_listings_user_policy", "job_listings"),
+    ("job_applications_user_policy", "job_applications"),
+    ("user_profiles_user_policy", "user_profiles"),
+    ("rss_feeds_user_policy", "rss_feed_configurations"),
+    ("gmail_connections_user_policy", "user_gmail_connections"),
+    ("email_events_user_policy", "email_events"),
+    ("email_sync_logs_user_policy", "email_sync_logs"),
+)
+
+
+def _alter_policies(using: str) -> None:
+    # The policies only exist where the cleanup script has been run
+    for policy, table in POLICIES:
+        op.execute(f"""
+            DO $$
+            BEGIN
+                IF EXISTS (
+                    SELECT 1 FROM pg_policies
+                    WHERE schemaname = current_schema()
+                      AND tablename = '{table}'
+                      AND policyname = '{policy}'
+                ) THEN
+                    ALTER POLICY {policy} ON {table} USING ({using});
+                END IF;
+            END
+            $$
+        """)
+
+
+def upgrade() -> None:
+    # A bare current_setting() in USING is re-evaluated for every row scanned;
+    # as a scalar subquery it becomes an InitPlan computed once per statement
+    _alter_policies("user_id = (SELECT current_setting('app.current_user_id', true)::VARCHAR(100))")
+
+
+def downgrade() -> None:
+    _alter_policies("user_id = current_setting('app.current_user_id', true)::VARCHAR(100)")
@@ -0,0 +1,55 @@
+"""Make the script-added user_id columns NOT NULL
+
+Revision ID: 5e2b8d4f7a16
+Revises: 3d6a9e2c5b71
+Create Date: 2026-10-16 18:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5e2b8d4f7a16'
+down_revision: Union[str, None] = '3d6a9e2c5b71'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Added by app/migrations/cleanup_unused_tables.py with DEFAULT 'demo_user'
+# but left nullable
+TABLES = ('job_listings', 'rss_feed_configurations')
+
+
+def _if_user_id_exists(table: str, statements: str) -> str:
+    # The columns only exist where the cleanup script has been run
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM information_schema.columns
+                WHERE table_schema = current_schema()
+                  AND table_name = '{table}'
+                  AND column_name = 'user_id'
+            ) THEN
+                {statements}
+            END IF;
+        END
+        $$
+    """
+
+
+def upgrade() -> None:
+    for table in TABLES:
+        op.execute(_if_user_id_exists(table, f"""
+            UPDATE {table} SET user_id = 'demo_user' WHERE user_id IS NULL;
+            ALTER TABLE {table} ALTER COLUMN user_id SET NOT NULL;
+        """))
+
+
+def downgrade() -> None:
+    for table in TABLES:
+        op.execute(_if_user_id_exists(table, f"""
+            ALTER TABLE {table} ALTER COLUMN user_id DROP NOT NULL;
+        """))
@@ -0,0 +1,39 @@
+"""Make job applications unique per user and job
+
+Revision ID: 5f2c9a7d41e8
+Revises: 3b8e1f0c7a52
+Create Date: 2026-10-16 11:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '5f2c9a7d41e8'
+down_revision: Union[str, None] = '3b8e1f0c7a52'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keep the earliest row of any duplicate pair so the index can be built
+    op.execute("""
+        DELETE FROM job_applications a
+        USING job_applications b
+        WHERE a.user_id = b.user_id
+          AND a.job_id = b.job_id
+          AND a.id > b.id
+    """)
+    op.create_index(
+        'uq_job_applications_user_job',
+        'job_applications',
+        ['user_id', 'job_id'],
+        unique=True,
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('uq_job_applications_user_job', table_name='job_applications')
@@ -0,0 +1,53 @@
+"""Stamp created/updated timestamps with server-side defaults
+
+Revision ID: 6b1f3e8c2d94
+Revises: 4a8d2f6b0c35
+Create Date: 2026-10-16 16:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '6b1f3e8c2d94'
+down_revision: Union[str, None] = '4a8d2f6b0c35'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns the models used to fill with datetime.utcnow; they stay naive UTC
+TIMESTAMP_COLUMNS = (
+    ('user_gmail_connections', 'created_at'),
+    ('user_gmail_connections', 'updated_at'),
+    ('email_events', 'created_at'),
+    ('email_sync_logs', 'created_at'),
+    ('job_listings', 'extracted_date'),
+    ('rss_feed_configurations', 'created_at'),
+    ('user_profiles', 'created_at'),
+    ('user_profiles', 'updated_at'),
+    ('job_applications', 'application_date'),
+    ('job_applications', 'created_at'),
+    ('job_applications', 'updated_at'),
+    ('application_outbox', 'created_at'),
+    ('users', 'created_at'),
+    ('users', 'updated_at'),
+)
+
+
+def upgrade() -> None:
+    # Inserts no longer bind a Python-computed timestamp; the ORM reads the
+    # value back through RETURNING. Defaults are catalog-only changes.
+    # users only exists where app/migrations/cleanup_unused_tables.py or
+    # create_tables.py has run
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(
+            f"ALTER TABLE IF EXISTS {table} "
+            f"ALTER COLUMN {column} SET DEFAULT timezone('UTC', now())"
+        )
+
+
+def downgrade() -> None:
+    for table, column in TIMESTAMP_COLUMNS:
+        op.execute(f"ALTER TABLE IF EXISTS {table} ALTER COLUMN {column} DROP DEFAULT")
@@ -0,0 +1,51 @@
+"""Deduplicate email events on a BIGINT message id fingerprint
+
+Revision ID: 7d3c5b9e1a42
+Revises: 2f9a6c1e4d87
+Create Date: 2026-10-16 16:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '7d3c5b9e1a42'
+down_revision: Union[str, None] = '2f9a6c1e4d87'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The Gmail sync checks every fetched message against this key; an 8-byte
+    # integer btree is about half the size of the string one and compares
+    # without collation rules. The expression matches
+    # app.models.email_models.message_id_fingerprint
+    op.add_column('email_events', sa.Column('email_message_id_hash', sa.BigInteger(), nullable=True))
+    op.execute("""
+        UPDATE email_events
+        SET email_message_id_hash = ('x' || substr(md5(email_message_id), 1, 16))::bit(64)::bigint
+        WHERE email_message_id_hash IS NULL
+    """)
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_email_events_email_message_id_hash "
+            "ON email_events (email_message_id_hash)"
+        )
+    op.alter_column('email_events', 'email_message_id_hash', nullable=False)
+    # Nothing looks events up by the string any more
+    op.execute("ALTER TABLE email_events DROP CONSTRAINT IF EXISTS email_events_email_message_id_key")
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_email_events_email_message_id")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_email_events_email_message_id "
+            "ON email_events (email_message_id)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS ix_email_events_email_message_id_hash")
+    op.drop_column('email_events', 'email_message_id_hash')
@@ -0,0 +1,42 @@
+"""Order the per-status job application index by application date
+
+Revision ID: 8a5f1c3e6d29
+Revises: 5e2b8d4f7a16
+Create Date: 2026-10-16 18:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8a5f1c3e6d29'
+down_revision: Union[str, None] = '5e2b8d4f7a16'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /jobs/applications?status=... pages on (application_date, id) newest
+    # first within one status; with the date and id in the index that is an
+    # ordered range scan instead of a fetch-all-and-sort. The (user_id,
+    # application_status) prefix still serves the status counts
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_applications_user_status_new "
+            "ON job_applications (user_id, application_status, application_date DESC, id DESC)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_job_applications_user_status")
+        op.execute("ALTER INDEX idx_job_applications_user_status_new RENAME TO idx_job_applications_user_status")
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_job_applications_user_status_old "
+            "ON job_applications (user_id, application_status)"
+        )
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_job_applications_user_status")
+        op.execute("ALTER INDEX idx_job_applications_user_status_old RENAME TO idx_job_applications_user_status")
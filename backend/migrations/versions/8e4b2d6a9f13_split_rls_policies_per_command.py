@@ -0,0 +1,75 @@
+"""Split the RLS policies into one policy per command
+
+Revision ID: 8e4b2d6a9f13
+Revises: 5c1e8a3f7b20
+Create Date: 2026-10-16 15:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '8e4b2d6a9f13'
+down_revision: Union[str, None] = '5c1e8a3f7b20'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Policies created by app/migrations/cleanup_unused_tables.py
+POLICIES = (
+    ("job_listings_user_policy", "job_listings"),
+    ("job_applications_user_policy", "job_applications"),
+    ("user_profiles_user_policy", "user_profiles"),
+    ("rss_feeds_user_policy", "rss_feed_configurations"),
+    ("gmail_connections_user_policy", "user_gmail_connections"),
+    ("email_events_user_policy", "email_events"),
+    ("email_sync_logs_user_policy", "email_sync_logs"),
+)
+
+USER_MATCH = "user_id = (SELECT current_setting('app.current_user_id', true)::VARCHAR(100))"
+
+
+def _if_policy_exists(policy: str, table: str, statements: str) -> str:
+    # The policies only exist where the cleanup script has been run
+    return f"""
+        DO $$
+        BEGIN
+            IF EXISTS (
+                SELECT 1 FROM pg_policies
+                WHERE schemaname = current_schema()
+                  AND tablename = '{table}'
+                  AND policyname = '{policy}'
+            ) THEN
+                {statements}
+            END IF;
+        END
+        $$
+    """
+
+
+def upgrade() -> None:
+    # A FOR ALL policy applies its USING expression to every command; per
+    # command policies let inserts (the Gmail sync's bulk of writes) check
+    # only WITH CHECK and reads only USING
+    for policy, table in POLICIES:
+        op.execute(_if_policy_exists(policy, table, f"""
+            DROP POLICY {policy} ON {table};
+            CREATE POLICY {policy}_select ON {table} FOR SELECT USING ({USER_MATCH});
+            CREATE POLICY {policy}_insert ON {table} FOR INSERT WITH CHECK ({USER_MATCH});
+            CREATE POLICY {policy}_update ON {table} FOR UPDATE USING ({USER_MATCH}) WITH CHECK ({USER_MATCH});
+            CREATE POLICY {policy}_delete ON {table} FOR DELETE USING ({USER_MATCH});
+        """))
+
+
+def downgrade() -> None:
+    for policy, table in POLICIES:
+        op.execute(_if_policy_exists(f"{policy}_select", table, f"""
+            DROP POLICY {policy}_select ON {table};
+            DROP POLICY IF EXISTS {policy}_insert ON {table};
+            DROP POLICY IF EXISTS {policy}_update ON {table};
+            DROP POLICY IF EXISTS {policy}_delete ON {table};
+            CREATE POLICY {policy} ON {table} FOR ALL USING ({USER_MATCH});
+        """))
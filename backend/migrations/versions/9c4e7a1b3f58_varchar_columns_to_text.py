@@ -0,0 +1,56 @@
+"""Store free-form and label string columns as TEXT
+
+Revision ID: 9c4e7a1b3f58
+Revises: 6b1f3e8c2d94
+Create Date: 2026-10-16 17:00:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9c4e7a1b3f58'
+down_revision: Union[str, None] = '6b1f3e8c2d94'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, column, previous VARCHAR length)
+COLUMNS = (
+    ('user_gmail_connections', 'google_user_id', 255),
+    ('user_gmail_connections', 'gmail_email', 255),
+    ('email_events', 'email_message_id', 255),
+    ('email_events', 'sender_email', 255),
+    ('email_events', 'sender_name', 255),
+    ('email_events', 'company_name', 255),
+    ('email_events', 'email_type', 20),
+    ('email_sync_logs', 'status', 20),
+    ('job_listings', 'title', 255),
+    ('job_listings', 'company', 255),
+    ('job_listings', 'location', 255),
+    ('rss_feed_configurations', 'name', 255),
+    ('rss_feed_configurations', 'location_filter', 255),
+    ('user_profiles', 'full_name', 255),
+    ('user_profiles', 'email', 255),
+    ('user_profiles', 'location', 255),
+    ('job_applications', 'external_application_id', 255),
+    ('users', 'email', 255),
+    ('users', 'full_name', 255),
+)
+
+
+def upgrade() -> None:
+    # VARCHAR(n) -> TEXT is binary compatible: no table rewrite, and the
+    # btree/trigram indexes keep the same operator class. The classifier's
+    # email types ('application_confirmation') did not fit VARCHAR(20).
+    # users only exists where app/migrations/cleanup_unused_tables.py or
+    # create_tables.py has run
+    for table, column, _ in COLUMNS:
+        op.execute(f"ALTER TABLE IF EXISTS {table} ALTER COLUMN {column} TYPE TEXT")
+
+
+def downgrade() -> None:
+    for table, column, length in COLUMNS:
+        op.execute(f"ALTER TABLE IF EXISTS {table} ALTER COLUMN {column} TYPE VARCHAR({length})")
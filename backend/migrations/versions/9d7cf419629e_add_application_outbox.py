@@ -0,0 +1,46 @@
+"""Add application outbox table
+
+Revision ID: 9d7cf419629e
+Revises: e777b3159342
+Create Date: 2026-10-16 10:03:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = '9d7cf419629e'
+down_revision: Union[str, None] = 'e777b3159342'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        'application_outbox',
+        sa.Column('id', sa.Integer(), nullable=False),
+        sa.Column('user_id', sa.String(length=100), nullable=False),
+        sa.Column('job_id', sa.Integer(), nullable=False),
+        sa.Column('application_source', sa.String(length=100), nullable=True),
+        sa.Column('user_notes', sa.Text(), nullable=True),
+        sa.Column('created_at', sa.DateTime(), nullable=True),
+        sa.Column('processed_at', sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(['job_id'], ['job_listings.id'], ondelete='CASCADE'),
+        sa.PrimaryKeyConstraint('id')
+    )
+    op.create_index(op.f('ix_application_outbox_id'), 'application_outbox', ['id'], unique=False)
+    op.create_index(
+        'idx_application_outbox_pending',
+        'application_outbox',
+        ['id'],
+        postgresql_where=sa.text('processed_at IS NULL'),
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_application_outbox_pending', table_name='application_outbox')
+    op.drop_index(op.f('ix_application_outbox_id'), table_name='application_outbox')
+    op.drop_table('application_outbox')
@@ -0,0 +1,38 @@
+"""Add trigram indexes for job listing text filters
+
+Revision ID: a41d6e2b9c07
+Revises: 5f2c9a7d41e8
+Create Date: 2026-10-16 12:05:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'a41d6e2b9c07'
+down_revision: Union[str, None] = '5f2c9a7d41e8'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Columns filtered with ILIKE '%term%' by GET /jobs/ and /jobs/counts
+TRIGRAM_COLUMNS = ('title', 'company', 'location')
+
+
+def upgrade() -> None:
+    op.execute("CREATE EXTENSION IF NOT EXISTS pg_trgm")
+    for column in TRIGRAM_COLUMNS:
+        op.create_index(
+            f'idx_job_listings_{column}_trgm',
+            'job_listings',
+            [column],
+            postgresql_using='gin',
+            postgresql_ops={column: 'gin_trgm_ops'},
+        )
+
+
+def downgrade() -> None:
+    for column in TRIGRAM_COLUMNS:
+        op.drop_index(f'idx_job_listings_{column}_trgm', table_name='job_listings')
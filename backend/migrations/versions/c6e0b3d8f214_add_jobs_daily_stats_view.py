@@ -0,0 +1,37 @@
+"""Add jobs_daily_stats materialized view
+
+Revision ID: c6e0b3d8f214
+Revises: a41d6e2b9c07
+Create Date: 2026-10-16 12:40:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'c6e0b3d8f214'
+down_revision: Union[str, None] = 'a41d6e2b9c07'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Daily rollup behind the /stats graph, refreshed by a Celery beat task
+    op.execute("""
+        CREATE MATERIALIZED VIEW jobs_daily_stats AS
+        SELECT CAST(extracted_date AS DATE) AS day,
+               count(*) AS jobs_extracted,
+               sum(CAST(applied AS INTEGER)) AS jobs_applied
+        FROM job_listings
+        WHERE extracted_date IS NOT NULL
+        GROUP BY 1
+    """)
+    # Required by REFRESH ... CONCURRENTLY, and serves the day-range reads
+    op.create_index('uq_jobs_daily_stats_day', 'jobs_daily_stats', ['day'], unique=True)
+
+
+def downgrade() -> None:
+    op.execute("DROP MATERIALIZED VIEW IF EXISTS jobs_daily_stats")
@@ -0,0 +1,43 @@
+"""Ensure the unique index on user_profiles.user_id
+
+Revision ID: d2a7f5c3e918
+Revises: c6e0b3d8f214
+Create Date: 2026-10-16 13:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'd2a7f5c3e918'
+down_revision: Union[str, None] = 'c6e0b3d8f214'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # user_profiles is created by metadata.create_all rather than a migration,
+    # so older databases may lack the index that every profile lookup and the
+    # ON CONFLICT (user_id) profile upsert depend on. Keep the newest row of
+    # any duplicate pair so the index can be built.
+    op.execute("""
+        DELETE FROM user_profiles a
+        USING user_profiles b
+        WHERE a.user_id = b.user_id
+          AND a.id < b.id
+    """)
+    # Same name create_all uses, so databases that already have it are untouched
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE UNIQUE INDEX CONCURRENTLY IF NOT EXISTS ix_user_profiles_user_id "
+            "ON user_profiles (user_id)"
+        )
+
+
+def downgrade() -> None:
+    # The index belongs to the UserProfile model (unique=True, index=True), so
+    # it is left in place
+    pass
@@ -0,0 +1,35 @@
+"""Make email_events.created_at NOT NULL
+
+Revision ID: e1c7f4a9b2d6
+Revises: 8a5f1c3e6d29
+Create Date: 2026-10-16 19:20:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e1c7f4a9b2d6'
+down_revision: Union[str, None] = '8a5f1c3e6d29'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # The event list pages on (created_at, id); a NULL created_at sorts ahead
+    # of every page, never matches the keyset comparison and cannot be
+    # encoded as a cursor. Rows from before the server default get the
+    # closest timestamp they have
+    op.execute("""
+        UPDATE email_events
+        SET created_at = coalesce(processed_at, email_received_at, timezone('UTC', now()))
+        WHERE created_at IS NULL
+    """)
+    op.alter_column('email_events', 'created_at', nullable=False)
+
+
+def downgrade() -> None:
+    op.alter_column('email_events', 'created_at', nullable=True)
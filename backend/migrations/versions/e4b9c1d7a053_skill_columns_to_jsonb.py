@@ -0,0 +1,52 @@
+"""Store profile skill lists as JSONB
+
+Revision ID: e4b9c1d7a053
+Revises: d2a7f5c3e918
+Create Date: 2026-10-16 13:30:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.dialects import postgresql
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e4b9c1d7a053'
+down_revision: Union[str, None] = 'd2a7f5c3e918'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# Merged on every resume upload with jsonb_agg(DISTINCT ...)
+SKILL_COLUMNS = ('programming_languages', 'frameworks_libraries', 'tools_platforms', 'soft_skills')
+
+
+def upgrade() -> None:
+    for column in SKILL_COLUMNS:
+        op.alter_column(
+            'user_profiles',
+            column,
+            type_=postgresql.JSONB(),
+            existing_type=sa.JSON(),
+            postgresql_using=f'{column}::jsonb',
+        )
+    op.create_index(
+        'idx_user_profiles_programming_languages',
+        'user_profiles',
+        ['programming_languages'],
+        postgresql_using='gin',
+        postgresql_ops={'programming_languages': 'jsonb_path_ops'},
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_user_profiles_programming_languages', table_name='user_profiles')
+    for column in SKILL_COLUMNS:
+        op.alter_column(
+            'user_profiles',
+            column,
+            type_=sa.JSON(),
+            existing_type=postgresql.JSONB(),
+            postgresql_using=f'{column}::json',
+        )
@@ -0,0 +1,110 @@
+"""Add trigger-maintained stats_overall counters
+
+Revision ID: e777b3159342
+Revises: ecd6aef2cae6
+Create Date: 2026-10-16 09:56:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'e777b3159342'
+down_revision: Union[str, None] = 'ecd6aef2cae6'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Held until the migration commits: writes that land between the seeding
+    # count(*) and the triggers' creation would otherwise never be counted
+    op.execute("LOCK TABLE job_listings IN SHARE ROW EXCLUSIVE MODE")
+
+    # Single-row table holding all-time job counters for /jobs/stats
+    op.execute("""
+        CREATE TABLE stats_overall (
+            id SMALLINT PRIMARY KEY DEFAULT 1 CHECK (id = 1),
+            total_jobs BIGINT NOT NULL DEFAULT 0,
+            total_applied BIGINT NOT NULL DEFAULT 0
+        )
+    """)
+    op.execute("""
+        INSERT INTO stats_overall (id, total_jobs, total_applied)
+        SELECT 1, count(*), coalesce(sum(applied::int), 0) FROM job_listings
+    """)
+
+    # Statement-level insert/delete triggers with transition tables: one
+    # counter UPDATE per statement rather than per row. Every writing
+    # transaction still holds the counter row's lock until it commits, so
+    # concurrent writers to job_listings queue behind one another there
+    op.execute("""
+        CREATE FUNCTION stats_overall_on_insert() RETURNS trigger AS $$
+        BEGIN
+            UPDATE stats_overall SET
+                total_jobs = total_jobs + (SELECT count(*) FROM new_rows),
+                total_applied = total_applied + (SELECT coalesce(sum(applied::int), 0) FROM new_rows);
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION stats_overall_on_update() RETURNS trigger AS $$
+        BEGIN
+            UPDATE stats_overall SET
+                total_applied = total_applied
+                    + coalesce(NEW.applied, false)::int
+                    - coalesce(OLD.applied, false)::int;
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION stats_overall_on_delete() RETURNS trigger AS $$
+        BEGIN
+            UPDATE stats_overall SET
+                total_jobs = total_jobs - (SELECT count(*) FROM old_rows),
+                total_applied = total_applied - (SELECT coalesce(sum(applied::int), 0) FROM old_rows);
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE FUNCTION stats_overall_on_truncate() RETURNS trigger AS $$
+        BEGIN
+            UPDATE stats_overall SET total_jobs = 0, total_applied = 0;
+            RETURN NULL;
+        END $$ LANGUAGE plpgsql
+    """)
+    op.execute("""
+        CREATE TRIGGER job_listings_stats_insert AFTER INSERT ON job_listings
+        REFERENCING NEW TABLE AS new_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION stats_overall_on_insert()
+    """)
+    # Only changes to applied touch the counters. Transition tables cannot
+    # be combined with a column list, so this one fires per changed row
+    op.execute("""
+        CREATE TRIGGER job_listings_stats_update AFTER UPDATE OF applied ON job_listings
+        FOR EACH ROW WHEN (OLD.applied IS DISTINCT FROM NEW.applied)
+        EXECUTE FUNCTION stats_overall_on_update()
+    """)
+    op.execute("""
+        CREATE TRIGGER job_listings_stats_delete AFTER DELETE ON job_listings
+        REFERENCING OLD TABLE AS old_rows
+        FOR EACH STATEMENT EXECUTE FUNCTION stats_overall_on_delete()
+    """)
+    op.execute("""
+        CREATE TRIGGER job_listings_stats_truncate AFTER TRUNCATE ON job_listings
+        FOR EACH STATEMENT EXECUTE FUNCTION stats_overall_on_truncate()
+    """)
+
+
+def downgrade() -> None:
+    op.execute("DROP TRIGGER IF EXISTS job_listings_stats_truncate ON job_listings")
+    op.execute("DROP TRIGGER IF EXISTS job_listings_stats_delete ON job_listings")
+    op.execute("DROP TRIGGER IF EXISTS job_listings_stats_update ON job_listings")
+    op.execute("DROP TRIGGER IF EXISTS job_listings_stats_insert ON job_listings")
+    op.execute("DROP FUNCTION IF EXISTS stats_overall_on_truncate()")
+    op.execute("DROP FUNCTION IF EXISTS stats_overall_on_delete()")
+    op.execute("DROP FUNCTION IF EXISTS stats_overall_on_update()")
+    op.execute("DROP FUNCTION IF EXISTS stats_overall_on_insert()")
+    op.execute("DROP TABLE IF EXISTS stats_overall")
@@ -0,0 +1,37 @@
+"""Add id tiebreaker to job application date index
+
+Revision ID: ecd6aef2cae6
+Revises: manual_google_oauth_migration
+Create Date: 2026-10-16 09:49:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'ecd6aef2cae6'
+down_revision: Union[str, None] = 'manual_google_oauth_migration'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Keyset pagination orders by (application_date DESC, id DESC)
+    op.drop_index('idx_job_applications_user_date', table_name='job_applications')
+    op.create_index(
+        'idx_job_applications_user_date',
+        'job_applications',
+        ['user_id', sa.text('application_date DESC'), sa.text('id DESC')],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index('idx_job_applications_user_date', table_name='job_applications')
+    op.create_index(
+        'idx_job_applications_user_date',
+        'job_applications',
+        ['user_id', sa.text('application_date DESC')],
+    )
@@ -0,0 +1,34 @@
+"""Index email events by user and recency for keyset pagination
+
+Revision ID: f7c2e9a4b1d6
+Revises: e4b9c1d7a053
+Create Date: 2026-10-16 14:10:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+# revision identifiers, used by Alembic.
+revision: str = 'f7c2e9a4b1d6'
+down_revision: Union[str, None] = 'e4b9c1d7a053'
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # GET /email-agent/events/{user_id} walks (created_at, id) newest first
+    # from a cursor; email_events is written continuously by the Gmail sync,
+    # so build without blocking inserts
+    with op.get_context().autocommit_block():
+        op.execute(
+            "CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_email_events_user_created "
+            "ON email_events (user_id, created_at DESC, id DESC)"
+        )
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        op.execute("DROP INDEX CONCURRENTLY IF EXISTS idx_email_events_user_created")
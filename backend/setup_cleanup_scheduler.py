@@ -3,7 +3,6 @@
 
 import os
 import sys
-from celery.schedules import crontab
 
 sys.path.append(os.path.dirname(os.path.abspath(__file__)))
 
@@ -11,31 +10,17 @@ from app.core.celery_app import celery_app
 from app.tasks.cleanup_tasks import cleanup_old_jobs_task, get_cleanup_stats_task
 
 def setup_cleanup_schedule():
-    """Set up automatic cleanup schedule using Celery Beat"""
-    print("Setting up automatic job cleanup schedule...")
-    
-    celery_app.conf.beat_schedule = {
-        'daily-job-cleanup': {
-            'task': 'app.tasks.cleanup_tasks.cleanup_old_jobs_task',
-            'schedule': crontab(hour=2, minute=0),  # 2:00 AM daily
-            'args': (20,),
-            'options': {'queue': 'cleanup'}
-        },
-        'weekly-cleanup-stats': {
-            'task': 'app.tasks.cleanup_tasks.get_cleanup_stats_task',
-            'schedule': crontab(hour=3, minute=0, day_of_week=0),  # Sunday 3:00 AM
-            'args': (20,),
-            'options': {'queue': 'cleanup'}
-        },
-    }
-    
-    print("Cleanup schedule configured:")
-    print("- Daily cleanup: 2:00 AM (jobs older than 20 days)")
-    print("- Weekly stats: Sunday 3:00 AM")
+    """Show the cleanup schedule Celery Beat runs"""
+    # The entries live in app.core.celery_app's beat_schedule; assigning
+    # conf.beat_schedule here would only change this process, never beat
+    print("Cleanup schedule (app.core.celery_app beat_schedule):")
+    for name in ('daily-job-cleanup', 'weekly-cleanup-stats'):
+        entry = celery_app.conf.beat_schedule[name]
+        print(f"- {name}: {entry['task']} {entry['schedule']} args={entry['args']}")
     print("\nTo start the scheduler, run:")
     print("celery -A app.core.celery_app beat --loglevel=info")
-    print("\nTo start a worker for cleanup tasks, run:")
-    print("celery -A app.core.celery_app worker -Q cleanup --loglevel=info")
+    print("\nCleanup tasks run on the default queue, so any worker picks them up:")
+    print("celery -A app.core.celery_app worker --loglevel=info")
 
 def test_cleanup_task():
     """Test the cleanup task manually"""
@@ -0,0 +1,37 @@
+"""
+Shared fixtures for the pytest suites
+
+Database tests run against SQLALCHEMY_DATABASE_URI inside a transaction that
+is rolled back afterwards; code under test that commits only releases a
+savepoint. They are skipped when the database cannot be reached.
+"""
+import pytest
+from sqlalchemy import create_engine
+from sqlalchemy.exc import OperationalError
+from sqlalchemy.orm import Session
+
+from app.core.config import settings
+
+
+@pytest.fixture(scope="session")
+def db_engine():
+    engine = create_engine(settings.SQLALCHEMY_DATABASE_URI)
+    try:
+        engine.connect().close()
+    except OperationalError as e:
+        pytest.skip(f"Database not reachable: {e}")
+    yield engine
+    engine.dispose()
+
+
+@pytest.fixture
+def db(db_engine):
+    connection = db_engine.connect()
+    transaction = connection.begin()
+    session = Session(bind=connection, join_transaction_mode="create_savepoint", expire_on_commit=False)
+    try:
+        yield session
+    finally:
+        session.close()
+        transaction.rollback()
+        connection.close()
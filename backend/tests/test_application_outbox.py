@@ -0,0 +1,78 @@
+"""
+Tests for the application outbox (ApplicationTrackingService)
+"""
+from sqlalchemy import delete, func, insert, select
+
+from app.models.job import ApplicationOutbox, JobApplication, JobListing
+from app.services.application_tracking_service import ApplicationTrackingService
+
+
+def _job(db) -> int:
+    return db.execute(
+        insert(JobListing).values(title="Backend Engineer", company="Acme").returning(JobListing.id)
+    ).scalar_one()
+
+
+def _applications(db, job_id: int):
+    return db.execute(
+        select(JobApplication.application_status, JobApplication.application_source, JobApplication.user_notes)
+        .where(JobApplication.user_id == "outbox_test_user", JobApplication.job_id == job_id)
+    ).all()
+
+
+def test_enqueue_then_process_upserts_once(db):
+    service = ApplicationTrackingService(db)
+    job_id = _job(db)
+
+    outbox_id = service.enqueue("outbox_test_user", job_id, "direct", "")
+    assert service.status(outbox_id) == "queued"
+    assert _applications(db, job_id) == []
+
+    assert service.process(outbox_id)["status"] == "processed"
+    assert service.status(outbox_id) == "processed"
+    assert _applications(db, job_id) == [("applied", "direct", "")]
+
+
+def test_processing_an_entry_again_changes_nothing(db):
+    service = ApplicationTrackingService(db)
+    job_id = _job(db)
+    outbox_id = service.enqueue("outbox_test_user", job_id, "direct", "")
+    service.process(outbox_id)
+    before = _applications(db, job_id)
+
+    assert service.process(outbox_id)["status"] == "skipped"
+    assert _applications(db, job_id) == before
+
+
+def test_second_click_on_applied_job_leaves_application_alone(db):
+    service = ApplicationTrackingService(db)
+    job_id = _job(db)
+    service.process(service.enqueue("outbox_test_user", job_id, "direct", ""))
+    before = _applications(db, job_id)
+
+    assert service.process(service.enqueue("outbox_test_user", job_id, "linkedin", "again"))["status"] == "processed"
+    assert _applications(db, job_id) == before
+
+
+def test_processed_entries_do_not_block_deleting_the_job(db):
+    service = ApplicationTrackingService(db)
+    job_id = _job(db)
+    service.process(service.enqueue("outbox_test_user", job_id, "direct", ""))
+    db.execute(delete(JobApplication).where(JobApplication.job_id == job_id))
+
+    db.execute(delete(JobListing).where(JobListing.id == job_id))
+    assert db.execute(
+        select(func.count()).select_from(ApplicationOutbox).where(ApplicationOutbox.job_id == job_id)
+    ).scalar_one() == 0
+
+
+def test_purge_removes_only_processed_entries(db):
+    service = ApplicationTrackingService(db)
+    job_id = _job(db)
+    processed_id = service.enqueue("outbox_test_user", job_id, "direct", "")
+    service.process(processed_id)
+    pending_id = service.enqueue("outbox_test_user", job_id, "direct", "")
+
+    assert service.purge_processed(days_old=0) >= 1
+    assert service.status(processed_id) is None
+    assert service.status(pending_id) == "queued"
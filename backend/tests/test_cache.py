@@ -0,0 +1,15 @@
+"""
+Tests for the Redis cache helpers
+"""
+import pytest
+
+from app.core.cache import _escape_glob
+
+
+@pytest.mark.parametrize("char", ["*", "?", "[", "]", "\\"])
+def test_glob_metacharacters_in_prefix_are_escaped(char):
+    assert _escape_glob(f"applications:a{char}b:") == f"applications:a\\{char}b:"
+
+
+def test_plain_prefix_is_unchanged():
+    assert _escape_glob("applications:demo_user:") == "applications:demo_user:"
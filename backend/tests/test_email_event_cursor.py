@@ -0,0 +1,48 @@
+"""
+Tests for /email-agent/events keyset paging
+"""
+from datetime import datetime, timedelta
+
+from fastapi import Response
+from sqlalchemy import insert
+
+from app.api.v1.endpoints.email_agent import get_email_events
+from app.models.email_models import EmailEvent, UserGmailConnection
+
+USER_ID = "event_cursor_test_user"
+
+
+def _events(db, count: int) -> None:
+    connection_id = db.execute(
+        insert(UserGmailConnection).values(user_id=USER_ID).returning(UserGmailConnection.id)
+    ).scalar_one()
+    start = datetime(2026, 10, 16)
+    db.execute(insert(EmailEvent), [
+        {
+            "user_id": USER_ID,
+            "gmail_connection_id": connection_id,
+            "email_message_id": f"event-cursor-test-{i}",
+            "sender_email": "jobs@example.com",
+            "subject": f"Update {i}",
+            "email_received_at": start + timedelta(minutes=i),
+            "created_at": start + timedelta(minutes=i),
+        }
+        for i in range(count)
+    ])
+
+
+def _page(db, limit: int, cursor=None):
+    response = Response()
+    events = get_email_events(USER_ID, response, limit=limit, offset=0, cursor=cursor, email_type=None, db=db)
+    return events, response.headers.get("X-Next-Cursor")
+
+
+def test_next_cursor_only_set_on_a_full_page(db):
+    _events(db, 3)
+
+    first, next_cursor = _page(db, limit=2)
+    assert len(first) == 2 and next_cursor is not None
+
+    second, next_cursor = _page(db, limit=2, cursor=next_cursor)
+    assert len(second) == 1 and next_cursor is None
+    assert {event["id"] for event in first}.isdisjoint(event["id"] for event in second)
@@ -0,0 +1,28 @@
+"""
+Tests for the keyset cursors used by /jobs/applications and /email-agent/events
+"""
+import base64
+from datetime import datetime
+
+import pytest
+from fastapi import HTTPException
+
+from app.utils.pagination import decode_keyset_cursor, encode_keyset_cursor
+
+
+def test_cursor_round_trips_sort_key():
+    ts = datetime(2026, 10, 16, 9, 30, 15, 123456)
+    assert decode_keyset_cursor(encode_keyset_cursor(ts, 42)) == (ts, 42)
+
+
+@pytest.mark.parametrize("cursor", [
+    "not base64!",
+    base64.urlsafe_b64encode(b"no-separator").decode(),
+    base64.urlsafe_b64encode(b"not-a-date|42").decode(),
+    base64.urlsafe_b64encode(b"2026-10-16T09:30:15|not-an-id").decode(),
+    base64.urlsafe_b64encode(b"\xff\xfe|1").decode(),
+])
+def test_invalid_cursor_is_a_400(cursor):
+    with pytest.raises(HTTPException) as excinfo:
+        decode_keyset_cursor(cursor)
+    assert excinfo.value.status_code == 400
@@ -0,0 +1,38 @@
+"""
+Tests for folding parsed resumes into user profiles
+"""
+from sqlalchemy import select
+
+from app.api.v1.endpoints.profiles import _upsert_profile_from_parsed_data
+from app.models.job import UserProfile
+
+USER_ID = "profile_upsert_test_user"
+
+
+def _career_level(db) -> str:
+    return db.execute(select(UserProfile.career_level).where(UserProfile.user_id == USER_ID)).scalar_one()
+
+
+def test_new_profile_without_career_level_starts_at_entry(db):
+    _upsert_profile_from_parsed_data(db, USER_ID, {"personal_info": {"full_name": "Ada"}}, resume_uploaded=True)
+    assert _career_level(db) == "entry"
+
+
+def test_reparse_without_career_level_keeps_stored_value(db):
+    _upsert_profile_from_parsed_data(
+        db, USER_ID, {"professional_summary": {"career_level": "senior"}}, resume_uploaded=True
+    )
+    _upsert_profile_from_parsed_data(
+        db, USER_ID, {"professional_summary": {"summary": "Backend engineer"}}, resume_uploaded=True
+    )
+    assert _career_level(db) == "senior"
+
+
+def test_reparse_with_career_level_replaces_stored_value(db):
+    _upsert_profile_from_parsed_data(
+        db, USER_ID, {"professional_summary": {"career_level": "mid"}}, resume_uploaded=True
+    )
+    _upsert_profile_from_parsed_data(
+        db, USER_ID, {"professional_summary": {"career_level": "senior"}}, resume_uploaded=True
+    )
+    assert _career_level(db) == "senior"